@@ -0,0 +1,509 @@
+from __future__ import annotations
+
+import argparse
+import itertools
+import json
+import os
+import platform
+import random
+import re
+import sqlite3
+import statistics
+import tempfile
+import time
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Callable, Iterable, Iterator
+
+import exercise_database
+
+
+def _time_runs(action: Callable[[], None], runs: int, setup: Callable[[], None] | None = None) -> dict[str, float]:
+    """Run an action repeatedly and return min/median/max wall time in milliseconds."""
+    # Setup runs outside the timed section, e.g. to drop pooled connections.
+    samples: list[float] = []
+    for _ in range(runs):
+        if setup is not None:
+            setup()
+        started = time.perf_counter()
+        action()
+        samples.append((time.perf_counter() - started) * 1000)
+    return {
+        "min_ms": round(min(samples), 3),
+        "median_ms": round(statistics.median(samples), 3),
+        "max_ms": round(max(samples), 3),
+    }
+
+
+def bench_initialize_database(runs: int = 20) -> dict[str, dict[str, float]]:
+    """
+    Time cold and warm initialize_database calls.
+
+    "cold" creates a fresh file each run, "warm" reopens an initialized file, and
+    "warm_forced_seed" repeats the seeding work a warm start used to do every launch.
+    Connections are closed before each run so every sample includes opening the file.
+    """
+    # Use a throwaway directory so the shipped database is never touched.
+    results: dict[str, dict[str, float]] = {}
+    with tempfile.TemporaryDirectory() as tmpdir:
+        counter = iter(range(runs))
+        results["cold"] = _time_runs(
+            lambda: exercise_database.initialize_database(Path(tmpdir) / f"cold_{next(counter)}.db"),
+            runs,
+            setup=exercise_database.close_all,
+        )
+
+        warm_path = Path(tmpdir) / "warm.db"
+        exercise_database.initialize_database(warm_path)
+        results["warm"] = _time_runs(
+            lambda: exercise_database.initialize_database(warm_path),
+            runs,
+            setup=exercise_database.close_all,
+        )
+
+        def forced_seed() -> None:
+            """Replay the schema and seeding calls that ran on every launch before the seed stamp."""
+            # Mirrors the pre-stamp initialize_database body.
+            with exercise_database.get_connection(warm_path) as conn:
+                exercise_database.create_schema(conn)
+                exercise_database.migrate_schema(conn)
+                exercise_database.seed_sample_data(conn)
+                exercise_database.seed_example_user(conn)
+
+        results["warm_forced_seed"] = _time_runs(forced_seed, runs, setup=exercise_database.close_all)
+        exercise_database.close_all()
+    return results
+
+
+def _legacy_normalize(value: Iterable[str] | str, aliases: dict[str, list[str]]) -> list[str]:
+    """Reference copy of the pre-TagNormalizer pipeline with inline regex calls and no memo."""
+    # Kept verbatim so the tag benchmark has a stable baseline.
+    items: list[str] = []
+    for raw in [value] if isinstance(value, str) else value:
+        text = re.sub(r"\([^)]*\)", "", raw or "")
+        text = text.replace("&", " and ").replace("/", ",")
+        for part in re.split(r",|;|\band\b|\bwith\b|\+|\|", text, flags=re.IGNORECASE):
+            words = part.strip().split()
+            while words and words[-1].lower() in exercise_database._TAG_DESCRIPTOR_WORDS:
+                words.pop()
+            token = " ".join(words)
+            key = " ".join(re.sub(r"[^a-z0-9]+", " ", token.lower()).split())
+            if key:
+                items.extend(aliases.get(key) or [token.title()])
+    return list(dict.fromkeys(items))
+
+
+def bench_tag_normalizer(runs: int = 20, records: int = 5000) -> dict[str, dict[str, float]]:
+    """
+    Time tag normalization for a catalog-sized batch of equipment and muscle strings.
+
+    Compares the legacy regex pipeline, a cold TagNormalizer (memo cleared before each
+    run) and a warm one, which is the steady state during imports and migrations.
+    """
+    # Strings repeat the way real catalogs do: few distinct values, many records.
+    equipment_values = ["Barbell, plates", "Dumbbells & bench (optional)", "Pull-up bar / mat", "Cable machine", "Bodyweight"]
+    muscle_values = ["Posterior chain", "Chest, triceps", "Glutes focus; Calves", "Core", "Full body emphasis"]
+    equipment = [equipment_values[index % len(equipment_values)] for index in range(records)]
+    muscles = [muscle_values[index % len(muscle_values)] for index in range(records)]
+    equipment_normalizer = exercise_database.EQUIPMENT_NORMALIZER
+    muscle_normalizer = exercise_database.MUSCLE_NORMALIZER
+
+    def legacy() -> None:
+        """Normalize every record with the legacy pipeline."""
+        # Two calls per record, as the old import and migration paths did.
+        for equipment_value, muscle_value in zip(equipment, muscles):
+            _legacy_normalize(equipment_value, exercise_database._EQUIPMENT_ALIASES)
+            _legacy_normalize(muscle_value, exercise_database._MUSCLE_ALIASES)
+
+    def batch() -> None:
+        """Normalize every record with the batch API."""
+        # One normalize_many call per tag kind.
+        equipment_normalizer.normalize_many(equipment)
+        muscle_normalizer.normalize_many(muscles)
+
+    def clear() -> None:
+        """Drop both memo caches."""
+        # Forces the next batch to normalize every distinct string again.
+        equipment_normalizer.clear_cache()
+        muscle_normalizer.clear_cache()
+
+    results = {
+        "legacy": _time_runs(legacy, runs),
+        "normalizer_cold": _time_runs(batch, runs, setup=clear),
+        "normalizer_warm": _time_runs(batch, runs),
+    }
+    clear()
+    return results
+
+
+_MOVEMENTS = (
+    "Squat", "Deadlift", "Bench Press", "Overhead Press", "Row", "Pull-Up", "Lunge", "Hip Thrust",
+    "Plank", "Crunch", "Curl", "Extension", "Fly", "Raise", "Carry", "Burpee", "Step-Up", "Swing",
+)
+_VARIANTS = ("", "Paused", "Tempo", "Single-Arm", "Single-Leg", "Incline", "Decline", "Wide", "Close-Grip", "Banded")
+_EQUIPMENT_CHOICES = ("Barbell", "Dumbbell", "Bodyweight", "Machine", "Bands", "Kettlebell", "Pull-up bar", "Mat")
+_MUSCLE_CHOICES = ("Chest", "Back", "Legs", "Shoulders", "Core", "Biceps", "Triceps", "Glutes", "Calves", "Full body")
+# Relative training frequency per weekday (Monday first): busy early week, quiet weekend.
+_WEEKDAY_WEIGHTS = (1.3, 1.0, 1.2, 0.9, 1.0, 0.6, 0.4)
+
+
+def _catalog_records(exercises: int, rng: random.Random) -> Iterator[dict]:
+    """Yield catalog records with unique names and randomized tags and goal ratings."""
+    # Names cycle through movement/variant pairs and gain a number once those run out.
+    for index in range(exercises):
+        movement = _MOVEMENTS[index % len(_MOVEMENTS)]
+        variant = _VARIANTS[(index // len(_MOVEMENTS)) % len(_VARIANTS)]
+        round_number = index // (len(_MOVEMENTS) * len(_VARIANTS))
+        name = " ".join(part for part in (variant, movement, str(round_number + 1) if round_number else "") if part)
+        yield {
+            "name": name,
+            "short_description": f"Synthetic {movement.lower()} variation for benchmarking.",
+            "execution_instructions": f"Set up, brace, perform the {movement.lower()} with control, and reset.",
+            "required_equipment": ", ".join(rng.sample(_EQUIPMENT_CHOICES, rng.randint(1, 2))),
+            "target_muscle_group": ", ".join(rng.sample(_MUSCLE_CHOICES, rng.randint(1, 3))),
+            "recommendations": {
+                goal: {
+                    "suitability_rating": rng.randint(1, 10),
+                    "recommended_sets": rng.randint(2, 5),
+                    "recommended_reps_per_set": rng.choice((5, 8, 10, 12, 15)),
+                }
+                for goal in exercise_database.GOALS
+            },
+        }
+
+
+def _workout_rows(
+    user_ids: list[int],
+    workouts_per_user: int,
+    names: list[str],
+    rng: random.Random,
+    end_date: date,
+    days: int,
+) -> Iterator[dict]:
+    """Yield workouts with weekday-weighted dates, popularity-skewed exercises and mostly completed attempts."""
+    # Exercise popularity follows a Zipf-like 1/rank curve; about 12% of attempts are skipped.
+    day_offsets = list(range(days))
+    day_weights = [_WEEKDAY_WEIGHTS[(end_date - timedelta(days=offset)).weekday()] for offset in day_offsets]
+    popularity = [1.0 / (rank + 1) for rank in range(len(names))]
+    for user_id in user_ids:
+        offsets = rng.choices(day_offsets, weights=day_weights, k=workouts_per_user)
+        for offset in sorted(offsets, reverse=True):
+            performed = end_date - timedelta(days=offset)
+            if rng.random() < 0.3:
+                performed_at = f"{performed.isoformat()}T{rng.randint(6, 21):02d}:{rng.randint(0, 59):02d}:00"
+            else:
+                performed_at = performed.isoformat()
+            chosen = rng.choices(names, weights=popularity, k=rng.randint(3, 8))
+            statuses = [(name, "skipped" if rng.random() < 0.12 else "completed") for name in chosen]
+            duration_minutes = max(10, min(120, int(rng.lognormvariate(3.7, 0.35))))
+            yield {
+                "user_id": user_id,
+                "performed_at": performed_at,
+                "duration_minutes": duration_minutes,
+                "duration_seconds": duration_minutes * 60 - rng.randint(0, 59),
+                "exercises": chosen,
+                "goal": rng.choice(exercise_database.GOALS),
+                "total_sets_completed": sum(rng.randint(2, 5) for _, status in statuses if status == "completed"),
+                "exercise_statuses": statuses,
+            }
+
+
+def generate_dataset(
+    db_path: Path,
+    *,
+    users: int = 20,
+    workouts_per_user: int = 250,
+    exercises: int = 200,
+    days: int = 365,
+    end_date: date = date(2024, 12, 31),
+    seed: int = 42,
+) -> dict[str, int]:
+    """
+    Build a deterministic synthetic database and return its row counts.
+
+    The same arguments always produce the same rows, so results from different runs are comparable.
+    """
+    # Catalog first so workouts link to exercise ids; both go through the bulk import paths.
+    rng = random.Random(seed)
+    exercise_database.initialize_database(db_path)
+    exercise_database.import_exercise_catalog(_catalog_records(exercises, rng), db_path=db_path)
+    conn = exercise_database.get_connection(db_path)
+    names = [row[0] for row in conn.execute("SELECT name FROM exercises ORDER BY id;")]
+    rng.shuffle(names)
+    user_ids = [exercise_database.add_user(f"bench-user-{index}", db_path=db_path) for index in range(users)]
+    report = exercise_database.log_workouts_bulk(
+        _workout_rows(user_ids, workouts_per_user, names, rng, end_date, days),
+        collect_ids=False,
+        db_path=db_path,
+    )
+    if report["errors"]:
+        raise RuntimeError(f"Dataset generation rejected {len(report['errors'])} workout(s): {report['errors'][:3]}")
+    return {
+        "users": len(user_ids),
+        "exercises": len(names),
+        "workouts": conn.execute("SELECT COUNT(*) FROM workouts;").fetchone()[0],
+        "workout_exercises": conn.execute("SELECT COUNT(*) FROM workout_exercises;").fetchone()[0],
+    }
+
+
+def bench_data_layer(
+    runs: int = 20,
+    *,
+    users: int = 20,
+    workouts_per_user: int = 250,
+    exercises: int = 200,
+    seed: int = 42,
+) -> dict[str, dict[str, float]]:
+    """
+    Time the main read and write paths against a generated dataset.
+
+    Each sample targets a different user (chosen deterministically) so caches do not
+    favour a single user's pages. The *_cached cases repeat one user's query to time
+    query cache hits.
+    """
+    # The dataset lives in a temporary directory and is rebuilt for every invocation.
+    results: dict[str, dict[str, float]] = {}
+    with tempfile.TemporaryDirectory() as tmpdir:
+        db_path = Path(tmpdir) / "bench.db"
+        started = time.perf_counter()
+        counts = generate_dataset(
+            db_path, users=users, workouts_per_user=workouts_per_user, exercises=exercises, seed=seed
+        )
+        results["generate"] = {"seconds": round(time.perf_counter() - started, 3), **counts}
+        conn = exercise_database.get_connection(db_path)
+        user_ids = [row[0] for row in conn.execute("SELECT id FROM users WHERE username LIKE 'bench-user-%';")]
+        picks = itertools.cycle(random.Random(seed).sample(user_ids, len(user_ids)))
+        names = [row[0] for row in conn.execute("SELECT name FROM exercises ORDER BY id LIMIT 8;")]
+
+        cases: dict[str, Callable[[], object]] = {
+            "fetch_workout_history": lambda: exercise_database.fetch_workout_history(next(picks), db_path=db_path),
+            "fetch_workout_history_30d": lambda: exercise_database.fetch_workout_history(
+                next(picks), start_date="2024-12-01", end_date="2024-12-31", db_path=db_path
+            ),
+            "fetch_workout_stats": lambda: exercise_database.fetch_workout_stats(next(picks), db_path=db_path),
+            "fetch_workout_stats_30d": lambda: exercise_database.fetch_workout_stats(
+                next(picks), start_date="2024-12-01", end_date="2024-12-31", db_path=db_path
+            ),
+            "fetch_recent_exercise_usage": lambda: exercise_database.fetch_recent_exercise_usage(
+                next(picks), limit=200, db_path=db_path
+            ),
+            "log_workout": lambda: exercise_database.log_workout(
+                user_id=next(picks),
+                performed_at="2025-01-01",
+                duration_minutes=45,
+                exercises=names[:5],
+                db_path=db_path,
+            ),
+            "fetch_all": lambda: exercise_database.fetch_all(conn),
+        }
+        # The query cache is cleared before every sample so these stay cold reads.
+        for label, case in cases.items():
+            results[label] = _time_runs(case, runs, setup=exercise_database.clear_query_cache)
+        repeat_user = user_ids[0]
+        cached_cases: dict[str, Callable[[], object]] = {
+            "fetch_workout_history_cached": lambda: exercise_database.fetch_workout_history(
+                repeat_user, db_path=db_path
+            ),
+            "fetch_workout_stats_30d_cached": lambda: exercise_database.fetch_workout_stats(
+                repeat_user, start_date="2024-12-01", end_date="2024-12-31", db_path=db_path
+            ),
+            "fetch_recent_exercise_usage_cached": lambda: exercise_database.fetch_recent_exercise_usage(
+                repeat_user, limit=200, db_path=db_path
+            ),
+        }
+        exercise_database.clear_query_cache()
+        for label, case in cached_cases.items():
+            results[label] = _time_runs(case, runs)
+        results["query_cache"] = exercise_database.query_cache_stats()
+        exercise_database.close_all()
+    return results
+
+
+def _legacy_records(rows: list[tuple]) -> list[dict]:
+    """Reference copy of the pre-ExerciseCatalog list of per-goal record dicts."""
+    # Kept verbatim (minus icon resolution) so the catalog benchmark has a stable baseline.
+    records: list[dict] = []
+    for (
+        exercise_id,
+        name,
+        icon,
+        description,
+        execution_instructions,
+        equipment,
+        muscle_group,
+        goal,
+        rating,
+        sets,
+        reps,
+        time_seconds,
+        equipment_items,
+        muscle_items,
+    ) in rows:
+        if not name or not description:
+            continue
+        recommendation_parts = []
+        if sets is not None and reps is not None:
+            recommendation_parts.append(f"{sets} sets x {reps} reps")
+        elif sets is not None:
+            recommendation_parts.append(f"{sets} sets")
+        if time_seconds is not None:
+            recommendation_parts.append(f"{time_seconds}s hold")
+        records.append(
+            {
+                "id": exercise_id,
+                "name": name,
+                "icon": icon or "",
+                "icon_source": "",
+                "description": description,
+                "execution_instructions": execution_instructions or "",
+                "equipment": exercise_database.format_tag_list(equipment_items) or equipment,
+                "equipment_items": set(equipment_items),
+                "muscle_group": exercise_database.format_tag_list(muscle_items) or muscle_group,
+                "muscle_groups": set(muscle_items),
+                "goal": goal,
+                "goal_label": goal.replace("_", " ").title(),
+                "suitability_display": f"{rating}/10",
+                "rating": rating,
+                "sets": sets,
+                "reps": reps,
+                "time_seconds": time_seconds,
+                "recommendation": " • ".join(recommendation_parts) if recommendation_parts else "Adjust volume to preference",
+            }
+        )
+    return records
+
+
+def bench_exercise_catalog(runs: int = 20, *, exercises: int = 200, seed: int = 42) -> dict[str, dict[str, float]]:
+    """
+    Compare the UI's ExerciseCatalog with the legacy list of per-goal record dicts.
+
+    Times building from query_exercises rows and the lookups the screens perform (goal
+    filter, name/goal record, duplicate-name check), and reports both memory footprints.
+    Also times adding one exercise: patching the catalog in place versus rebuilding it.
+    """
+    # main pulls in Kivy, so it is imported here rather than for every benchmark.
+    os.environ.setdefault("KIVY_NO_ARGS", "1")
+    os.environ.setdefault("KIVY_NO_CONSOLELOG", "1")
+    from main import ExerciseCatalog, deep_sizeof
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        db_path = Path(tmpdir) / "bench.db"
+        generate_dataset(db_path, users=0, workouts_per_user=0, exercises=exercises, seed=seed)
+        rows = exercise_database.query_exercises(db_path=db_path)
+        exercise_database.close_all()
+    legacy = _legacy_records(rows)
+    catalog = ExerciseCatalog.from_rows(rows)
+    pairs = [(record["name"], record["goal"]) for record in legacy]
+    names = [name.upper() for name, _goal in pairs[:: len(exercise_database.GOALS)]]
+    # A new exercise whose name sorts into the middle of the catalog.
+    new_id = max(row[0] for row in rows) + 1
+    new_rows = [(new_id, "M" * 3, *row[2:]) for row in rows if row[0] == rows[0][0]]
+    state: dict[str, ExerciseCatalog] = {}
+
+    def legacy_lookups() -> None:
+        """Run every lookup against the record list with the scans the screens used."""
+        # One goal filter per goal, one record scan per pair, one duplicate check per name.
+        for goal in exercise_database.GOALS:
+            [record for record in legacy if record["goal"] == goal]
+        for name, goal in pairs:
+            next(record for record in legacy if record["name"] == name and record["goal"] == goal)
+        for name in names:
+            any(record["name"].lower() == name.lower() for record in legacy)
+
+    def catalog_lookups() -> None:
+        """Run the same lookups through the catalog indexes."""
+        # Mirrors legacy_lookups call for call.
+        for goal in exercise_database.GOALS:
+            catalog.for_goal(goal)
+        for name, goal in pairs:
+            catalog.record(name, goal)
+        for name in names:
+            catalog.has_name(name)
+
+    return {
+        "legacy_build": _time_runs(lambda: _legacy_records(rows), runs),
+        "catalog_build": _time_runs(lambda: ExerciseCatalog.from_rows(rows), runs),
+        "legacy_lookups": _time_runs(legacy_lookups, runs),
+        "catalog_lookups": _time_runs(catalog_lookups, runs),
+        "add_rebuild": _time_runs(lambda: ExerciseCatalog.from_rows([*rows, *new_rows]), runs),
+        "add_patch": _time_runs(
+            lambda: state["catalog"].add_rows(new_rows),
+            runs,
+            setup=lambda: state.update(catalog=ExerciseCatalog.from_rows(rows)),
+        ),
+        "memory": {
+            "records": len(legacy),
+            "legacy_kb": round(deep_sizeof(legacy) / 1024, 1),
+            "catalog_kb": round(catalog.memory_footprint() / 1024, 1),
+        },
+    }
+
+
+BENCHMARKS: dict[str, Callable[..., dict]] = {
+    "startup": bench_initialize_database,
+    "tags": bench_tag_normalizer,
+    "data": bench_data_layer,
+    "catalog": bench_exercise_catalog,
+}
+# Dataset options forwarded to the benchmarks that build a synthetic dataset.
+_DATASET_BENCHMARKS = {
+    "data": ("users", "workouts_per_user", "exercises", "seed"),
+    "catalog": ("exercises", "seed"),
+}
+
+
+def _compare(results: dict[str, dict], baseline_path: Path) -> None:
+    """Print median ratios between these results and a saved JSON run."""
+    # Ratios below 1.0 mean the current run is faster than the baseline.
+    baseline = json.loads(baseline_path.read_text(encoding="utf-8"))["results"]
+    print(f"== compared with {baseline_path}")
+    for name, labels in results.items():
+        for label, timings in labels.items():
+            old = baseline.get(name, {}).get(label, {}).get("median_ms")
+            new = timings.get("median_ms")
+            if old and new is not None:
+                print(f"{name + '.' + label:>40}: {old} -> {new} ms (x{new / old:.2f})")
+
+
+def main() -> None:
+    """Run the selected benchmarks, print their results and optionally save or compare them."""
+    # Default to every registered benchmark.
+    parser = argparse.ArgumentParser(description="FitTrainer data layer benchmarks.")
+    parser.add_argument("names", nargs="*", metavar="NAME", help=f"benchmarks to run: {', '.join(BENCHMARKS)} (default: all)")
+    parser.add_argument("--runs", type=int, default=20, help="samples per measurement")
+    parser.add_argument("--users", type=int, default=20, help="synthetic users for dataset benchmarks")
+    parser.add_argument("--workouts", type=int, default=250, help="workouts per synthetic user")
+    parser.add_argument("--exercises", type=int, default=200, help="synthetic catalog size")
+    parser.add_argument("--seed", type=int, default=42, help="random seed for the synthetic dataset")
+    parser.add_argument("--output", type=Path, metavar="FILE", help="write results as JSON")
+    parser.add_argument("--compare", type=Path, metavar="FILE", help="compare medians with a previous --output file")
+    args = parser.parse_args()
+    unknown = [name for name in args.names if name not in BENCHMARKS]
+    if unknown:
+        parser.error(f"unknown benchmark(s): {', '.join(unknown)}")
+    dataset = {"users": args.users, "workouts_per_user": args.workouts, "exercises": args.exercises, "seed": args.seed}
+    results: dict[str, dict] = {}
+    for name in args.names or list(BENCHMARKS):
+        print(f"== {name}")
+        options = {option: dataset[option] for option in _DATASET_BENCHMARKS.get(name, ())}
+        results[name] = BENCHMARKS[name](runs=args.runs, **options)
+        for label, timings in results[name].items():
+            print(f"{label:>30}: " + ", ".join(f"{key}={value}" for key, value in timings.items()))
+    if args.output is not None:
+        payload = {
+            "meta": {
+                "created_at": datetime.now().isoformat(timespec="seconds"),
+                "python": platform.python_version(),
+                "sqlite": sqlite3.sqlite_version,
+                "runs": args.runs,
+                "dataset": dataset,
+            },
+            "results": results,
+        }
+        args.output.write_text(json.dumps(payload, indent=2) + "\n", encoding="utf-8")
+    if args.compare is not None:
+        _compare(results, args.compare)
+
+
+if __name__ == "__main__":
+    main()
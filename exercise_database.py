@@ -1,9 +1,24 @@
 from __future__ import annotations
 
+import argparse
+import base64
+import atexit
+import csv
+import functools
+import inspect
+import json
+import os
 import re
+import socket
 import sqlite3
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from datetime import date, datetime, timedelta
+from functools import lru_cache
 from pathlib import Path
-from typing import Iterable, Optional, Sequence, Tuple
+from typing import Any, Callable, Iterable, Iterator, Optional, Sequence, Tuple
 
 
 DB_PATH = Path(__file__).with_name("exercises.db")
@@ -14,10 +29,23 @@ GOALS = (
     "strength_increase",
     "endurance_increase",
 )
+TAG_KINDS = ("equipment", "muscle")
 DEFAULT_GOAL_RATING = 5
 EXAMPLE_USERNAME = "exaple-user"
 EXAMPLE_DISPLAY_NAME = "Example User"
 EXAMPLE_PREFERRED_GOAL = "muscle_building"
+# Bump whenever seed_sample_data or seed_example_user change so existing databases reseed once.
+SEED_VERSION = 1
+_EPOCH = date(1970, 1, 1)
+_ASCII_LOWER = str.maketrans("ABCDEFGHIJKLMNOPQRSTUVWXYZ", "abcdefghijklmnopqrstuvwxyz")
+# SQL twin of day_number(): days since 1970-01-01 for date or ISO timestamp text. Like day_number it
+# reads the leading date as written, since date(performed_at) would shift offset timestamps to UTC,
+# and gives NULL for impossible dates such as 2024-02-30, which only the '+0 days' modifier normalizes.
+_DAY_PART_SQL = "substr(trim(performed_at), 1, 10)"
+_DAY_NUMBER_SQL = (
+    f"CASE WHEN date({_DAY_PART_SQL}, '+0 days') = {_DAY_PART_SQL} "
+    f"THEN CAST(julianday({_DAY_PART_SQL}) - 2440587.5 AS INTEGER) END"
+)
 
 _TAG_DESCRIPTOR_WORDS = {"focus", "emphasis", "target", "targeting", "optional", "mainly", "primary", "secondary"}
 _EQUIPMENT_ALIASES = {
@@ -55,10 +83,16 @@ _MUSCLE_ALIASES = {
 }
 
 
+_TAG_PAREN_PATTERN = re.compile(r"\([^)]*\)")
+_TAG_SPLIT_PATTERN = re.compile(r",|;|\band\b|\bwith\b|\+|\|", re.IGNORECASE)
+_TAG_KEY_PATTERN = re.compile(r"[^a-z0-9]+")
+_TAG_SEPARATORS = str.maketrans({"&": " and ", "/": ","})
+
+
 def _normalize_tag_key(value: str) -> str:
     """Normalize a tag string into a lookup key."""
     # Strip punctuation and collapse whitespace.
-    cleaned = re.sub(r"[^a-z0-9]+", " ", value.lower())
+    cleaned = _TAG_KEY_PATTERN.sub(" ", value.lower())
     return " ".join(cleaned.split())
 
 
@@ -74,43 +108,79 @@ def _strip_descriptor_words(token: str) -> str:
 def _split_tag_string(value: str) -> list[str]:
     """Split a tag string into cleaned tokens."""
     # Normalize separators and trim descriptors for each token.
-    text = re.sub(r"\([^)]*\)", "", value or "")
-    text = text.replace("&", " and ").replace("/", ",")
-    parts = re.split(r",|;|\band\b|\bwith\b|\+|\|", text, flags=re.IGNORECASE)
+    text = _TAG_PAREN_PATTERN.sub("", value or "").translate(_TAG_SEPARATORS)
     tokens: list[str] = []
-    for part in parts:
+    for part in _TAG_SPLIT_PATTERN.split(text):
         cleaned = _strip_descriptor_words(part.strip())
         if cleaned:
             tokens.append(cleaned)
     return tokens
 
 
-def _flatten_tag_input(value: Iterable[str] | str | None) -> list[str]:
-    """Flatten tag input from strings or iterables into tokens."""
-    # Accept strings or iterables and normalize them uniformly.
-    if value is None:
-        return []
-    if isinstance(value, str):
-        return _split_tag_string(value)
-    tokens: list[str] = []
-    for item in value:
-        if item is None:
-            continue
-        tokens.extend(_split_tag_string(str(item)))
-    return tokens
+class TagNormalizer:
+    """Map raw tag strings to canonical labels using one alias table and a bounded memo."""
 
+    __slots__ = ("_aliases", "_normalize_text")
 
-def _dedupe_preserve_order(items: Iterable[str]) -> list[str]:
-    """Return items with duplicates removed while preserving order."""
-    # Use a set to keep the first occurrence of each item.
-    seen: set[str] = set()
-    deduped: list[str] = []
-    for item in items:
-        if item in seen:
-            continue
-        seen.add(item)
-        deduped.append(item)
-    return deduped
+    def __init__(self, aliases: dict[str, Sequence[str]], cache_size: int = 1024) -> None:
+        """Index aliases by lookup key and wrap per-string normalization in an LRU cache."""
+        # Alias keys go through the same key normalization as tokens, so lookups are one dict hit.
+        self._aliases: dict[str, tuple[str, ...]] = {}
+        for alias, labels in aliases.items():
+            self._aliases.setdefault(_normalize_tag_key(alias), tuple(labels))
+        self._normalize_text = lru_cache(maxsize=cache_size)(self._normalize_uncached)
+
+    def _normalize_uncached(self, text: str) -> tuple[str, ...]:
+        """Split, alias-map and dedupe one tag string in a single pass over its tokens."""
+        # Unknown tokens are title-cased; results are tuples so cached values stay immutable.
+        labels: list[str] = []
+        seen: set[str] = set()
+        for token in _split_tag_string(text):
+            key = _normalize_tag_key(token)
+            if not key:
+                continue
+            for label in self._aliases.get(key) or (token.title(),):
+                if label not in seen:
+                    seen.add(label)
+                    labels.append(label)
+        return tuple(labels)
+
+    def normalize(self, value: Iterable[str] | str | None) -> list[str]:
+        """Return canonical labels for a tag string or an iterable of tag strings."""
+        # Iterables are normalized per item and merged, keeping the first occurrence of each label.
+        if value is None:
+            return []
+        if isinstance(value, str):
+            return list(self._normalize_text(value))
+        labels: list[str] = []
+        seen: set[str] = set()
+        for item in value:
+            if item is None:
+                continue
+            for label in self._normalize_text(str(item)):
+                if label not in seen:
+                    seen.add(label)
+                    labels.append(label)
+        return labels
+
+    def normalize_many(self, values: Iterable[Iterable[str] | str | None]) -> list[list[str]]:
+        """Normalize a batch of tag values, returning one label list per input."""
+        # Repeated strings across the batch are served from the memo.
+        return [self.normalize(value) for value in values]
+
+    def cache_info(self) -> Any:
+        """Return hit, miss and size counters for the memo cache."""
+        # Delegates to functools.lru_cache.
+        return self._normalize_text.cache_info()
+
+    def clear_cache(self) -> None:
+        """Drop all memoized results."""
+        # Useful after alias tables change in tests or benchmarks.
+        self._normalize_text.cache_clear()
+
+
+EQUIPMENT_NORMALIZER = TagNormalizer(_EQUIPMENT_ALIASES)
+MUSCLE_NORMALIZER = TagNormalizer(_MUSCLE_ALIASES)
 
 
 def format_tag_list(items: Sequence[str]) -> str:
@@ -122,45 +192,646 @@ def format_tag_list(items: Sequence[str]) -> str:
 def normalize_equipment_list(value: Iterable[str] | str) -> list[str]:
     """Normalize equipment labels into canonical display values."""
     # Map known aliases and title-case unknown entries.
-    items: list[str] = []
-    for token in _flatten_tag_input(value):
-        key = _normalize_tag_key(token)
-        if not key:
-            continue
-        mapped = _EQUIPMENT_ALIASES.get(key)
-        if mapped:
-            items.extend(mapped)
-        else:
-            items.append(token.strip().title())
-    return _dedupe_preserve_order(items)
+    return EQUIPMENT_NORMALIZER.normalize(value)
 
 
 def normalize_muscle_group_list(value: Iterable[str] | str) -> list[str]:
     """Normalize muscle group labels into canonical display values."""
     # Map known aliases and title-case unknown entries.
-    items: list[str] = []
-    for token in _flatten_tag_input(value):
-        key = _normalize_tag_key(token)
-        if not key:
+    return MUSCLE_NORMALIZER.normalize(value)
+
+
+def day_number(value: str) -> Optional[int]:
+    """
+    Return days since 1970-01-01 for a YYYY-MM-DD date or ISO timestamp.
+
+    Returns None when the value does not start with a valid ISO date.
+    """
+    # Only the date part matters; manual logs store dates, live logs full timestamps.
+    try:
+        return (date.fromisoformat((value or "").strip()[:10]) - _EPOCH).days
+    except ValueError:
+        return None
+
+
+def _day_range_filters(column: str, start_date: Optional[str], end_date: Optional[str]) -> tuple[list[str], list[object]]:
+    """Build index-friendly day-number filters for an optional date range; raise ValueError for invalid dates."""
+    # Compare integers on the stored column so SQLite can seek into (user_id, performed_day).
+    filters: list[str] = []
+    params: list[object] = []
+    for value, operator, label in ((start_date, ">=", "Start"), (end_date, "<=", "End")):
+        if not value:
             continue
-        mapped = _MUSCLE_ALIASES.get(key)
-        if mapped:
-            items.extend(mapped)
-        else:
-            items.append(token.strip().title())
-    return _dedupe_preserve_order(items)
+        day = day_number(value)
+        if day is None:
+            raise ValueError(f"{label} date must be in YYYY-MM-DD format.")
+        filters.append(f"{column} {operator} ?")
+        params.append(day)
+    return filters, params
+
+
+_JOURNAL_MODES = {"DELETE", "TRUNCATE", "PERSIST", "MEMORY", "WAL", "OFF"}
+_SYNCHRONOUS_MODES = {"OFF", "NORMAL", "FULL", "EXTRA"}
+# Schema name the exercise catalog is attached under on every pooled connection.
+CATALOG_SCHEMA = "catalog"
+CATALOG_ENV_VAR = "FITTRAINER_CATALOG_DB"
+CATALOG_MODE_ENV_VAR = "FITTRAINER_CATALOG_MODE"
+# "rw" may create and seed the catalog; "ro" and "immutable" only read a prepared file.
+CATALOG_MODES = ("rw", "ro", "immutable")
+
+
+class ConnectionManager:
+    """
+    Reuse SQLite connections per thread and database path.
+
+    Each connection is configured once (foreign keys, journal mode, synchronous,
+    cache_size, mmap_size) and keeps a prepared statement cache, so repeated
+    calls into this module avoid reconnecting and re-running PRAGMAs.
+
+    The user database at db_path is the main schema; the exercise catalog is a
+    separate file attached as "catalog". Table names are unique across the two, so
+    queries use them unqualified. By default the catalog is <stem>_catalog.db next
+    to db_path; catalog_path points every connection at one shared file instead.
+    """
+    # Track per-thread connections plus a registry so close_all can reach every thread.
+    def __init__(
+        self,
+        *,
+        journal_mode: str = "WAL",
+        synchronous: str = "NORMAL",
+        cache_size: int = -8000,
+        mmap_size: int = 0,
+        cached_statements: int = 256,
+        catalog_path: Optional[Path] = None,
+        catalog_mode: str = "rw",
+    ) -> None:
+        """Store connection settings used for newly opened connections."""
+        # Validate eagerly so misconfiguration fails before the first query.
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._open: list[sqlite3.Connection] = []
+        self.journal_mode = "WAL"
+        self.synchronous = "NORMAL"
+        self.cache_size = -8000
+        self.mmap_size = 0
+        self.cached_statements = 256
+        self.catalog_path: Optional[Path] = None
+        self.catalog_mode = "rw"
+        self.configure(
+            journal_mode=journal_mode,
+            synchronous=synchronous,
+            cache_size=cache_size,
+            mmap_size=mmap_size,
+            cached_statements=cached_statements,
+            catalog_path=catalog_path,
+            catalog_mode=catalog_mode,
+        )
+
+    def configure(
+        self,
+        *,
+        journal_mode: Optional[str] = None,
+        synchronous: Optional[str] = None,
+        cache_size: Optional[int] = None,
+        mmap_size: Optional[int] = None,
+        cached_statements: Optional[int] = None,
+        catalog_path: Optional[Path] = None,
+        catalog_mode: Optional[str] = None,
+    ) -> None:
+        """
+        Update connection settings.
+
+        Open connections are closed so the next call reconnects with the new values.
+        """
+        # Only override the settings that were passed explicitly.
+        if journal_mode is not None:
+            journal_mode = journal_mode.upper()
+            if journal_mode not in _JOURNAL_MODES:
+                raise ValueError(f"Unsupported journal mode: {journal_mode}")
+            self.journal_mode = journal_mode
+        if synchronous is not None:
+            synchronous = synchronous.upper()
+            if synchronous not in _SYNCHRONOUS_MODES:
+                raise ValueError(f"Unsupported synchronous setting: {synchronous}")
+            self.synchronous = synchronous
+        if cache_size is not None:
+            self.cache_size = int(cache_size)
+        if mmap_size is not None:
+            if mmap_size < 0:
+                raise ValueError("mmap_size cannot be negative.")
+            self.mmap_size = int(mmap_size)
+        if cached_statements is not None:
+            if cached_statements < 0:
+                raise ValueError("cached_statements cannot be negative.")
+            self.cached_statements = int(cached_statements)
+        if catalog_path is not None:
+            self.catalog_path = Path(catalog_path)
+        if catalog_mode is not None:
+            catalog_mode = catalog_mode.lower()
+            if catalog_mode not in CATALOG_MODES:
+                raise ValueError(f"Unsupported catalog mode: {catalog_mode}")
+            self.catalog_mode = catalog_mode
+        self.close_all()
+
+    def catalog_path_for(self, db_path: Path) -> Path:
+        """Return the catalog file attached to connections for db_path."""
+        # A configured shared catalog wins over the per-database default.
+        if self.catalog_path is not None:
+            return self.catalog_path
+        db_path = Path(db_path)
+        return db_path.with_name(f"{db_path.stem}_catalog{db_path.suffix or '.db'}")
+
+    def _catalog_uri(self, db_path: Path) -> str:
+        """Return the URI used to attach the catalog in the configured mode."""
+        # Read-only modes never create the file; immutable also skips locking entirely.
+        query = {"rw": "mode=rwc", "ro": "mode=ro", "immutable": "immutable=1"}[self.catalog_mode]
+        return f"{self.catalog_path_for(db_path).resolve().as_uri()}?{query}"
+
+    def _connections(self) -> dict[str, sqlite3.Connection]:
+        """Return the connection map owned by the calling thread."""
+        # Lazily create the per-thread map on first use.
+        connections = getattr(self._local, "connections", None)
+        if connections is None:
+            connections = {}
+            self._local.connections = connections
+        return connections
+
+    def _open_connection(self, db_path: Path) -> sqlite3.Connection:
+        """Open and configure a new connection for db_path."""
+        # check_same_thread is disabled only so close_all can close from any thread.
+        conn = sqlite3.connect(
+            db_path,
+            cached_statements=self.cached_statements,
+            check_same_thread=False,
+            factory=_TracingConnection if _TRACER.enabled else sqlite3.Connection,
+            uri=True,
+        )
+        if _TRACER.enabled:
+            conn.set_trace_callback(_TRACER.record_statement)
+        conn.execute("PRAGMA foreign_keys = ON;")
+        conn.execute(f"PRAGMA journal_mode = {self.journal_mode};")
+        conn.execute(f"PRAGMA synchronous = {self.synchronous};")
+        conn.execute(f"PRAGMA cache_size = {self.cache_size};")
+        conn.execute(f"PRAGMA mmap_size = {self.mmap_size};")
+        # The catalog keeps a rollback journal so read-only openers need no -wal/-shm files.
+        conn.execute(f"ATTACH DATABASE ? AS {CATALOG_SCHEMA};", (self._catalog_uri(db_path),))
+        if self.catalog_mode == "rw":
+            conn.execute(f"PRAGMA {CATALOG_SCHEMA}.journal_mode = DELETE;")
+        conn.execute(f"PRAGMA {CATALOG_SCHEMA}.cache_size = {self.cache_size};")
+        return conn
+
+    def open(self, db_path: Path = DB_PATH) -> sqlite3.Connection:
+        """Open a configured connection outside the per-thread pool; close_all still closes it."""
+        # For long-lived owners such as ChangeMonitor, whose PRAGMA data_version must not
+        # see the commits made through the pooled connections as its own.
+        conn = self._open_connection(Path(db_path))
+        with self._lock:
+            self._open.append(conn)
+        return conn
+
+    def get(self, db_path: Path = DB_PATH) -> sqlite3.Connection:
+        """Return the calling thread's connection for db_path, opening it if needed."""
+        # Key by resolved path so relative and absolute paths share a connection.
+        key = str(Path(db_path).resolve())
+        connections = self._connections()
+        conn = connections.get(key)
+        if conn is None:
+            conn = self._open_connection(Path(db_path))
+            connections[key] = conn
+            with self._lock:
+                self._open.append(conn)
+        return conn
+
+    def close(self, db_path: Path = DB_PATH) -> None:
+        """Close the calling thread's connection for db_path, if any."""
+        # Remove from both the thread map and the global registry.
+        key = str(Path(db_path).resolve())
+        conn = self._connections().pop(key, None)
+        if conn is None:
+            return
+        with self._lock:
+            if conn in self._open:
+                self._open.remove(conn)
+        conn.close()
+
+    def close_all(self) -> None:
+        """Close every connection opened by this manager on any thread."""
+        # Swap out the registry and thread map so later calls reconnect cleanly.
+        with self._lock:
+            connections, self._open = self._open, []
+        self._local = threading.local()
+        for conn in connections:
+            try:
+                conn.close()
+            except sqlite3.Error:
+                continue
+
+
+_CONNECTIONS = ConnectionManager(
+    catalog_path=Path(os.environ[CATALOG_ENV_VAR]) if os.environ.get(CATALOG_ENV_VAR) else None,
+    catalog_mode=os.environ.get(CATALOG_MODE_ENV_VAR) or "rw",
+)
+
+
+def configure_connections(**settings: Any) -> None:
+    """
+    Update connection settings for pooled connections.
+
+    Accepts journal_mode, synchronous, cache_size, mmap_size, cached_statements,
+    catalog_path and catalog_mode.
+    """
+    # Delegate to the shared manager so every public function picks up the settings.
+    _CONNECTIONS.configure(**settings)
+
+
+def close_all() -> None:
+    """Close all pooled database connections, e.g. on application shutdown."""
+    # Delegate to the shared manager.
+    _CONNECTIONS.close_all()
+
+
+def catalog_path_for(db_path: Path = DB_PATH) -> Path:
+    """Return the exercise catalog file used together with the user database at db_path."""
+    # Delegate to the shared manager, which knows about a configured shared catalog.
+    return _CONNECTIONS.catalog_path_for(db_path)
 
 
 def get_connection(db_path: Path = DB_PATH) -> sqlite3.Connection:
-    """Create a connection with foreign keys enabled."""
-    # Enable foreign keys on each new connection.
-    conn = sqlite3.connect(db_path)
-    conn.execute("PRAGMA foreign_keys = ON;")
-    return conn
+    """Return the pooled connection for db_path with foreign keys enabled."""
+    # Connections are reused per thread; use close_all() to release them.
+    return _CONNECTIONS.get(db_path)
+
+
+TRACE_ENV_VAR = "FITTRAINER_DB_TRACE"
+TRACE_REPORT_ENV_VAR = "FITTRAINER_DB_TRACE_REPORT"
+# Histogram upper bounds in seconds, Prometheus style; +Inf is implied.
+_LATENCY_BUCKETS = (0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0)
+_TRACE_SQL_LIMIT = 160
+
+
+class _LatencyStats:
+    """Call count, row count, error count and a fixed-bucket latency histogram for one key."""
+
+    __slots__ = ("calls", "rows", "errors", "total", "max", "buckets")
+
+    def __init__(self) -> None:
+        """Start with empty counters."""
+        # One slot per bucket plus the +Inf overflow slot.
+        self.calls = 0
+        self.rows = 0
+        self.errors = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.buckets = [0] * (len(_LATENCY_BUCKETS) + 1)
+
+    def observe(self, seconds: float) -> None:
+        """Add one latency sample."""
+        # Linear scan is fine for 13 buckets.
+        self.calls += 1
+        self.total += seconds
+        self.max = max(self.max, seconds)
+        for index, bound in enumerate(_LATENCY_BUCKETS):
+            if seconds <= bound:
+                self.buckets[index] += 1
+                return
+        self.buckets[-1] += 1
+
+    def quantile(self, fraction: float) -> float:
+        """Estimate a latency quantile as the upper bound of the bucket that contains it."""
+        # Overflow samples report the observed maximum.
+        target = fraction * self.calls
+        seen = 0
+        for index, count in enumerate(self.buckets):
+            seen += count
+            if count and seen >= target:
+                return min(_LATENCY_BUCKETS[index], self.max) if index < len(_LATENCY_BUCKETS) else self.max
+        return self.max
+
+    def summary(self) -> dict[str, Any]:
+        """Return counters and latency figures in milliseconds."""
+        # Rounded for readable reports.
+        return {
+            "calls": self.calls,
+            "rows": self.rows,
+            "errors": self.errors,
+            "total_ms": round(self.total * 1000, 3),
+            "mean_ms": round(self.total * 1000 / self.calls, 3) if self.calls else 0.0,
+            "p50_ms": round(self.quantile(0.5) * 1000, 3),
+            "p95_ms": round(self.quantile(0.95) * 1000, 3),
+            "max_ms": round(self.max * 1000, 3),
+        }
+
+
+class QueryTracer:
+    """
+    Opt-in latency and row-count instrumentation for SQLite statements and public functions.
+
+    Statements are timed by a Connection/Cursor subclass installed on new pooled connections,
+    fetch time and fetched rows included. The sqlite3 trace callback counts every executed
+    statement, trigger sub-statements included. Disabled tracers add no overhead.
+    """
+    # All counters are guarded by one lock because the background executor queries concurrently.
+    def __init__(self) -> None:
+        """Create an empty, disabled tracer."""
+        # Originals are kept so disable() can restore unwrapped functions.
+        self.enabled = False
+        self._lock = threading.Lock()
+        self._queries: dict[str, _LatencyStats] = {}
+        self._functions: dict[str, _LatencyStats] = {}
+        self._statements = 0
+        self._originals: dict[str, Callable[..., Any]] = {}
+
+    @staticmethod
+    def _query_key(sql: str) -> str:
+        """Collapse whitespace and truncate SQL text into a stable metric key."""
+        # Parameters are bound, so the text identifies the statement shape.
+        return " ".join(sql.split())[:_TRACE_SQL_LIMIT]
+
+    def record_query(self, sql: str, seconds: float, rows: int, *, new_call: bool, failed: bool = False) -> None:
+        """Add time and rows to a statement; fetches extend the call that executed it."""
+        # new_call is False for fetch time so calls counts executions only.
+        key = self._query_key(sql)
+        with self._lock:
+            stats = self._queries.get(key)
+            if stats is None:
+                stats = self._queries[key] = _LatencyStats()
+            if new_call:
+                stats.observe(seconds)
+            else:
+                stats.total += seconds
+            stats.rows += rows
+            stats.errors += int(failed)
+
+    def record_statement(self, _statement: str) -> None:
+        """Count one statement reported by the sqlite3 trace callback."""
+        # Python reports trigger sub-statements with the parent's text, so only the total is kept.
+        with self._lock:
+            self._statements += 1
+
+    def record_function(self, name: str, seconds: float, *, failed: bool) -> None:
+        """Add one call of a public exercise_database function."""
+        # Nested public calls are recorded under each function they pass through.
+        with self._lock:
+            stats = self._functions.get(name)
+            if stats is None:
+                stats = self._functions[name] = _LatencyStats()
+            stats.observe(seconds)
+            stats.errors += int(failed)
+
+    def _wrap(self, name: str, fn: Callable[..., Any]) -> Callable[..., Any]:
+        """Return fn wrapped with call timing."""
+        # functools.wraps keeps names and docstrings intact for introspection.
+        @functools.wraps(fn)
+        def traced(*args: Any, **kwargs: Any) -> Any:
+            """Time one call of the wrapped function."""
+            # Exceptions are counted and re-raised unchanged.
+            started = time.perf_counter()
+            failed = True
+            try:
+                result = fn(*args, **kwargs)
+                failed = False
+                return result
+            finally:
+                self.record_function(name, time.perf_counter() - started, failed=failed)
+
+        return traced
+
+    def enable(self) -> None:
+        """Start tracing new connections and wrap the module's public database functions."""
+        # Pooled connections are closed so they reopen with the tracing factory.
+        if self.enabled:
+            return
+        namespace = globals()
+        for name, value in list(namespace.items()):
+            if name.startswith("_") or name in _UNTRACED_FUNCTIONS or not inspect.isfunction(value):
+                continue
+            if value.__module__ != __name__:
+                continue
+            parameters = inspect.signature(value).parameters
+            if "db_path" not in parameters and "conn" not in parameters:
+                continue
+            self._originals[name] = value
+            namespace[name] = self._wrap(name, value)
+        self.enabled = True
+        _CONNECTIONS.close_all()
+
+    def disable(self) -> None:
+        """Restore unwrapped functions and stop tracing new connections."""
+        # Collected numbers are kept until reset().
+        if not self.enabled:
+            return
+        globals().update(self._originals)
+        self._originals.clear()
+        self.enabled = False
+        _CONNECTIONS.close_all()
+
+    def reset(self) -> None:
+        """Drop all collected numbers."""
+        # Wrapping and connection hooks stay in place.
+        with self._lock:
+            self._queries.clear()
+            self._functions.clear()
+            self._statements = 0
+
+    def report(self) -> dict[str, Any]:
+        """Return queries and functions sorted by total time, plus the executed statement count."""
+        # Sorting by total time puts the statements that dominate a session first.
+        with self._lock:
+            queries = [{"query": key, **stats.summary()} for key, stats in self._queries.items()]
+            functions = [{"function": key, **stats.summary()} for key, stats in self._functions.items()]
+            statements = self._statements
+        queries.sort(key=lambda item: item["total_ms"], reverse=True)
+        functions.sort(key=lambda item: item["total_ms"], reverse=True)
+        return {"queries": queries, "functions": functions, "statements": statements}
+
+    def write_report(self, path: Path) -> Path:
+        """Write the report as JSON and return the path."""
+        # Indented so the file can be read directly.
+        path = Path(path)
+        path.write_text(json.dumps(self.report(), indent=2), encoding="utf-8")
+        return path
+
+    def prometheus_text(self) -> str:
+        """Render the collected metrics in the Prometheus text exposition format."""
+        # Histograms use cumulative buckets in seconds, as Prometheus expects.
+        def label(value: str) -> str:
+            """Escape a label value."""
+            # Backslash, quote and newline are the only characters that need escaping.
+            return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+        lines: list[str] = []
+        with self._lock:
+            for metric, label_name, table, help_text in (
+                ("fittrainer_db_query", "query", self._queries, "SQLite statement latency including fetches."),
+                ("fittrainer_db_function", "function", self._functions, "exercise_database function latency."),
+            ):
+                lines.append(f"# HELP {metric}_seconds {help_text}")
+                lines.append(f"# TYPE {metric}_seconds histogram")
+                for key, stats in sorted(table.items()):
+                    labels = f'{label_name}="{label(key)}"'
+                    cumulative = 0
+                    for bound, count in zip((*_LATENCY_BUCKETS, "+Inf"), stats.buckets):
+                        cumulative += count
+                        lines.append(f'{metric}_seconds_bucket{{{labels},le="{bound}"}} {cumulative}')
+                    lines.append(f"{metric}_seconds_sum{{{labels}}} {stats.total:.6f}")
+                    lines.append(f"{metric}_seconds_count{{{labels}}} {stats.calls}")
+                lines.append(f"# TYPE {metric}_errors_total counter")
+                for key, stats in sorted(table.items()):
+                    lines.append(f'{metric}_errors_total{{{label_name}="{label(key)}"}} {stats.errors}')
+            lines.append("# TYPE fittrainer_db_query_rows_total counter")
+            for key, stats in sorted(self._queries.items()):
+                lines.append(f'fittrainer_db_query_rows_total{{query="{label(key)}"}} {stats.rows}')
+            lines.append("# TYPE fittrainer_db_statements_total counter")
+            lines.append(f"fittrainer_db_statements_total {self._statements}")
+        return "\n".join(lines) + "\n"
+
+
+class _TracingCursor(sqlite3.Cursor):
+    """Cursor that reports execute and fetch time to the module tracer."""
+    # The SQL of the last execute is kept so fetches are attributed to it.
+    _trace_sql = ""
+
+    def _timed(self, sql: str, call: Callable[[], Any], *, new_call: bool) -> Any:
+        """Run call, recording its duration and row count against sql."""
+        # DML row counts come from rowcount; fetched rows are counted by the fetch wrappers.
+        started = time.perf_counter()
+        failed = True
+        try:
+            result = call()
+            failed = False
+            return result
+        finally:
+            rows = max(self.rowcount, 0) if new_call else 0
+            _TRACER.record_query(sql, time.perf_counter() - started, rows, new_call=new_call, failed=failed)
+
+    def execute(self, sql: str, parameters: Any = ()) -> "_TracingCursor":
+        """Execute and time one statement."""
+        # Remember the SQL for later fetches.
+        self._trace_sql = sql
+        return self._timed(sql, lambda: super(_TracingCursor, self).execute(sql, parameters), new_call=True)
+
+    def executemany(self, sql: str, seq_of_parameters: Iterable[Any]) -> "_TracingCursor":
+        """Execute and time a batched statement."""
+        # rowcount sums the modified rows across the batch.
+        self._trace_sql = sql
+        return self._timed(
+            sql, lambda: super(_TracingCursor, self).executemany(sql, seq_of_parameters), new_call=True
+        )
+
+    def executescript(self, sql_script: str) -> "_TracingCursor":
+        """Execute and time a script as one entry."""
+        # Scripts are rare here (none on hot paths).
+        self._trace_sql = sql_script
+        return self._timed(sql_script, lambda: super(_TracingCursor, self).executescript(sql_script), new_call=True)
+
+    def _fetched(self, fetch: Callable[[], Any], *, single: bool = False) -> Any:
+        """Time a fetch and add the number of returned rows to the last statement."""
+        # single marks fetchone/__next__, which return one row or None.
+        started = time.perf_counter()
+        result = fetch()
+        if single:
+            rows = 0 if result is None else 1
+        else:
+            rows = len(result)
+        _TRACER.record_query(self._trace_sql, time.perf_counter() - started, rows, new_call=False)
+        return result
+
+    def fetchone(self) -> Any:
+        """Fetch one row."""
+        # See _fetched.
+        return self._fetched(super().fetchone, single=True)
+
+    def fetchmany(self, size: int = -1) -> list[Any]:
+        """Fetch up to size rows."""
+        # A negative size means the cursor's arraysize, as in sqlite3.
+        return self._fetched(lambda: super(_TracingCursor, self).fetchmany(self.arraysize if size < 0 else size))
+
+    def fetchall(self) -> list[Any]:
+        """Fetch all remaining rows."""
+        # See _fetched.
+        return self._fetched(super().fetchall)
+
+    def __next__(self) -> Any:
+        """Return the next row when the cursor is iterated."""
+        # StopIteration passes through untimed.
+        started = time.perf_counter()
+        row = super().__next__()
+        _TRACER.record_query(self._trace_sql, time.perf_counter() - started, 1, new_call=False)
+        return row
+
+
+class _TracingConnection(sqlite3.Connection):
+    """Connection whose shortcut execute methods go through _TracingCursor."""
+    # sqlite3.Connection.execute bypasses Cursor.execute in C, so the shortcuts are redefined.
+    def cursor(self, factory: Any = _TracingCursor) -> Any:
+        """Return a tracing cursor by default."""
+        # Explicit factories are honoured.
+        return super().cursor(factory)
+
+    def execute(self, sql: str, parameters: Any = ()) -> Any:
+        """Execute one statement on a new tracing cursor."""
+        # Mirrors sqlite3.Connection.execute.
+        return self.cursor().execute(sql, parameters)
+
+    def executemany(self, sql: str, seq_of_parameters: Iterable[Any]) -> Any:
+        """Execute a batched statement on a new tracing cursor."""
+        # Mirrors sqlite3.Connection.executemany.
+        return self.cursor().executemany(sql, seq_of_parameters)
+
+    def executescript(self, sql_script: str) -> Any:
+        """Execute a script on a new tracing cursor."""
+        # Mirrors sqlite3.Connection.executescript.
+        return self.cursor().executescript(sql_script)
+
+
+_TRACER = QueryTracer()
+# Infrastructure helpers stay unwrapped; they would only add noise to the function table.
+_UNTRACED_FUNCTIONS = {
+    "get_connection",
+    "catalog_path_for",
+    "configure_connections",
+    "close_all",
+    "enable_query_tracing",
+}
+
+
+def enable_query_tracing() -> QueryTracer:
+    """Turn on query and function tracing and return the tracer."""
+    # Also enabled at import time when FITTRAINER_DB_TRACE is set.
+    _TRACER.enable()
+    return _TRACER
+
+
+def disable_query_tracing() -> None:
+    """Turn off tracing; collected numbers remain readable."""
+    # Restores the original module functions.
+    _TRACER.disable()
+
+
+def query_trace_report() -> dict[str, Any]:
+    """Return the current tracing report."""
+    # Empty lists when tracing never ran.
+    return _TRACER.report()
+
+
+def write_query_trace_report(path: Path) -> Path:
+    """Write the current tracing report as JSON."""
+    # Returns the written path.
+    return _TRACER.write_report(path)
+
+
+def query_trace_prometheus() -> str:
+    """Return the current tracing metrics in Prometheus text format."""
+    # Suitable for a textfile collector or a /metrics handler.
+    return _TRACER.prometheus_text()
 
 
 def create_schema(conn: sqlite3.Connection) -> None:
-    """Create tables to store exercises and per-goal recommendations."""
+    """
+    Create the base single-file schema for users, workouts and the exercise catalog.
+
+    Migrations upgrade it from there, including moving the catalog into its own file.
+    """
     # Create tables if they do not already exist.
     conn.execute(
         """
@@ -178,6 +849,7 @@ def create_schema(conn: sqlite3.Connection) -> None:
             id INTEGER PRIMARY KEY AUTOINCREMENT,
             user_id INTEGER NOT NULL,
             performed_at TEXT NOT NULL,
+            performed_day INTEGER,
             duration_minutes INTEGER NOT NULL CHECK (duration_minutes > 0),
             duration_seconds INTEGER,
             goal TEXT,
@@ -191,15 +863,26 @@ def create_schema(conn: sqlite3.Connection) -> None:
         CREATE TABLE IF NOT EXISTS workout_exercises (
             id INTEGER PRIMARY KEY AUTOINCREMENT,
             workout_id INTEGER NOT NULL,
+            exercise_id INTEGER,
             exercise_name TEXT NOT NULL,
             status TEXT NOT NULL DEFAULT 'completed' CHECK (status IN ('completed','skipped')),
-            FOREIGN KEY (workout_id) REFERENCES workouts (id) ON DELETE CASCADE
+            FOREIGN KEY (workout_id) REFERENCES workouts (id) ON DELETE CASCADE,
+            FOREIGN KEY (exercise_id) REFERENCES exercises (id) ON DELETE SET NULL
         );
         """
     )
+    # Past the split these tables live in the attached catalog and must not be shadowed here.
+    if get_schema_version(conn) < _CATALOG_SPLIT_VERSION:
+        _create_catalog_tables(conn)
+    conn.commit()
+
+
+def _create_catalog_tables(conn: sqlite3.Connection, schema: str = "main") -> None:
+    """Create the exercise and per-goal recommendation tables in the given schema."""
+    # Shared by the legacy single-file layout and the attached catalog file.
     conn.execute(
-        """
-        CREATE TABLE IF NOT EXISTS exercises (
+        f"""
+        CREATE TABLE IF NOT EXISTS {schema}.exercises (
             id INTEGER PRIMARY KEY AUTOINCREMENT,
             name TEXT NOT NULL UNIQUE,
             icon TEXT,
@@ -212,7 +895,7 @@ def create_schema(conn: sqlite3.Connection) -> None:
     )
     conn.execute(
         f"""
-        CREATE TABLE IF NOT EXISTS goal_recommendations (
+        CREATE TABLE IF NOT EXISTS {schema}.goal_recommendations (
             id INTEGER PRIMARY KEY AUTOINCREMENT,
             exercise_id INTEGER NOT NULL,
             goal TEXT NOT NULL CHECK (goal IN {GOALS}),
@@ -225,7 +908,6 @@ def create_schema(conn: sqlite3.Connection) -> None:
         );
         """
     )
-    conn.commit()
 
 
 def _add_column_if_missing(conn: sqlite3.Connection, table: str, column: str, definition: str) -> None:
@@ -236,9 +918,9 @@ def _add_column_if_missing(conn: sqlite3.Connection, table: str, column: str, de
         conn.execute(f"ALTER TABLE {table} ADD COLUMN {definition};")
 
 
-def migrate_schema(conn: sqlite3.Connection) -> None:
+def _migration_enriched_workout_columns(conn: sqlite3.Connection) -> None:
     """Ensure newer columns exist for enriched workout logging."""
-    # Apply lightweight schema upgrades for existing databases.
+    # Databases created before versioning may lack these columns.
     _add_column_if_missing(conn, "users", "display_name", "display_name TEXT")
     _add_column_if_missing(conn, "users", "preferred_goal", "preferred_goal TEXT")
     _add_column_if_missing(conn, "workouts", "duration_seconds", "duration_seconds INTEGER")
@@ -251,74 +933,968 @@ def migrate_schema(conn: sqlite3.Connection) -> None:
         "status TEXT NOT NULL DEFAULT 'completed'",
     )
     _add_column_if_missing(conn, "exercises", "execution_instructions", "execution_instructions TEXT")
-    conn.commit()
 
 
-def seed_sample_data(conn: sqlite3.Connection) -> None:
+def _migration_secondary_indexes(conn: sqlite3.Connection) -> None:
+    """Add indexes for per-user history lookups and workout exercise joins."""
+    # Cover the user filter, the workout join and per-exercise grouping.
+    conn.execute(
+        "CREATE INDEX IF NOT EXISTS idx_workouts_user_performed ON workouts (user_id, performed_at);"
+    )
+    conn.execute(
+        "CREATE INDEX IF NOT EXISTS idx_workout_exercises_workout ON workout_exercises (workout_id);"
+    )
+    conn.execute(
+        "CREATE INDEX IF NOT EXISTS idx_workout_exercises_name ON workout_exercises (exercise_name);"
+    )
+
+
+def _migration_performed_day(conn: sqlite3.Connection) -> None:
+    """Add and backfill an integer day column for index-friendly date ranges."""
+    # Normalize mixed date/timestamp text once instead of calling date() per row in queries.
+    _add_column_if_missing(conn, "workouts", "performed_day", "performed_day INTEGER")
+    conn.execute(f"UPDATE workouts SET performed_day = {_DAY_NUMBER_SQL} WHERE performed_day IS NULL;")
+    conn.execute(
+        "CREATE INDEX IF NOT EXISTS idx_workouts_user_day ON workouts (user_id, performed_day);"
+    )
+
+
+def _exercise_count_key_sql(row: str) -> str:
+    """Return the (exercise_id, free_text) user_exercise_counts key for a workout_exercises row."""
+    # Catalog-linked attempts key on their id; free text keys on its name under exercise_id 0.
+    return f"COALESCE({row}.exercise_id, 0), CASE WHEN {row}.exercise_id IS NULL THEN {row}.exercise_name ELSE '' END"
+
+
+def _create_stats_rollup(conn: sqlite3.Connection) -> None:
+    """Create per-user stats rollup tables and the triggers that maintain them."""
+    # Triggers keep totals current for every insert path, not just log_workout.
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS user_stats (
+            user_id INTEGER PRIMARY KEY,
+            total_workouts INTEGER NOT NULL DEFAULT 0,
+            total_minutes INTEGER NOT NULL DEFAULT 0,
+            FOREIGN KEY (user_id) REFERENCES users (id) ON DELETE CASCADE
+        );
+        """
+    )
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS user_exercise_counts (
+            user_id INTEGER NOT NULL,
+            exercise_id INTEGER NOT NULL,
+            free_text TEXT NOT NULL DEFAULT '',
+            attempt_count INTEGER NOT NULL DEFAULT 0,
+            PRIMARY KEY (user_id, exercise_id, free_text),
+            FOREIGN KEY (user_id) REFERENCES users (id) ON DELETE CASCADE
+        );
+        """
+    )
+    conn.execute(
+        """
+        CREATE INDEX IF NOT EXISTS idx_user_exercise_counts_top
+        ON user_exercise_counts (user_id, attempt_count DESC);
+        """
+    )
+    conn.execute(
+        """
+        CREATE TRIGGER IF NOT EXISTS trg_workouts_stats_insert
+        AFTER INSERT ON workouts
+        BEGIN
+            INSERT INTO user_stats (user_id, total_workouts, total_minutes)
+            VALUES (NEW.user_id, 1, NEW.duration_minutes)
+            ON CONFLICT (user_id) DO UPDATE SET
+                total_workouts = total_workouts + 1,
+                total_minutes = total_minutes + excluded.total_minutes;
+        END;
+        """
+    )
+    conn.execute(
+        """
+        CREATE TRIGGER IF NOT EXISTS trg_workouts_stats_update
+        AFTER UPDATE OF duration_minutes ON workouts
+        WHEN OLD.user_id = NEW.user_id
+        BEGIN
+            UPDATE user_stats
+            SET total_minutes = total_minutes - OLD.duration_minutes + NEW.duration_minutes
+            WHERE user_id = NEW.user_id;
+        END;
+        """
+    )
+    # A workout moved to another user takes its minutes and exercise counts along.
+    conn.execute(
+        f"""
+        CREATE TRIGGER IF NOT EXISTS trg_workouts_stats_move
+        AFTER UPDATE OF user_id ON workouts
+        WHEN OLD.user_id IS NOT NEW.user_id
+        BEGIN
+            UPDATE user_stats
+            SET total_workouts = total_workouts - 1,
+                total_minutes = total_minutes - OLD.duration_minutes
+            WHERE user_id = OLD.user_id;
+            INSERT INTO user_stats (user_id, total_workouts, total_minutes)
+            VALUES (NEW.user_id, 1, NEW.duration_minutes)
+            ON CONFLICT (user_id) DO UPDATE SET
+                total_workouts = total_workouts + 1,
+                total_minutes = total_minutes + excluded.total_minutes;
+            {_release_exercise_counts_sql("OLD.user_id", "NEW.id")}
+            INSERT INTO user_exercise_counts (user_id, exercise_id, free_text, attempt_count)
+            SELECT NEW.user_id, {_exercise_count_key_sql("we")}, COUNT(*)
+            FROM workout_exercises we
+            WHERE we.workout_id = NEW.id
+            GROUP BY 2, 3
+            ON CONFLICT (user_id, exercise_id, free_text) DO UPDATE SET
+                attempt_count = attempt_count + excluded.attempt_count;
+        END;
+        """
+    )
+    # Exercise counts are released before the cascade removes the child rows.
+    conn.execute(
+        f"""
+        CREATE TRIGGER IF NOT EXISTS trg_workouts_stats_delete
+        BEFORE DELETE ON workouts
+        BEGIN
+            UPDATE user_stats
+            SET total_workouts = total_workouts - 1,
+                total_minutes = total_minutes - OLD.duration_minutes
+            WHERE user_id = OLD.user_id;
+            {_release_exercise_counts_sql("OLD.user_id", "OLD.id")}
+        END;
+        """
+    )
+    conn.execute(
+        f"""
+        CREATE TRIGGER IF NOT EXISTS trg_workout_exercises_stats_insert
+        AFTER INSERT ON workout_exercises
+        BEGIN
+            INSERT INTO user_exercise_counts (user_id, exercise_id, free_text, attempt_count)
+            SELECT w.user_id, {_exercise_count_key_sql("NEW")}, 1
+            FROM workouts w
+            WHERE w.id = NEW.workout_id
+            ON CONFLICT (user_id, exercise_id, free_text) DO UPDATE SET
+                attempt_count = attempt_count + 1;
+        END;
+        """
+    )
+    conn.execute(
+        f"""
+        CREATE TRIGGER IF NOT EXISTS trg_workout_exercises_stats_update
+        AFTER UPDATE OF exercise_id, exercise_name, workout_id ON workout_exercises
+        BEGIN
+            {_decrement_exercise_count_sql()}
+            INSERT INTO user_exercise_counts (user_id, exercise_id, free_text, attempt_count)
+            SELECT w.user_id, {_exercise_count_key_sql("NEW")}, 1
+            FROM workouts w
+            WHERE w.id = NEW.workout_id
+            ON CONFLICT (user_id, exercise_id, free_text) DO UPDATE SET
+                attempt_count = attempt_count + 1;
+        END;
+        """
+    )
+    # Direct child deletes only; cascaded deletes were handled by the workouts trigger.
+    conn.execute(
+        f"""
+        CREATE TRIGGER IF NOT EXISTS trg_workout_exercises_stats_delete
+        AFTER DELETE ON workout_exercises
+        WHEN EXISTS (SELECT 1 FROM workouts WHERE id = OLD.workout_id)
+        BEGIN
+            {_decrement_exercise_count_sql()}
+        END;
+        """
+    )
+
+
+def _release_exercise_counts_sql(user_sql: str, workout_sql: str) -> str:
+    """Return trigger statements that take one workout's attempts out of a user's exercise counts."""
+    # Only the keys the workout touches are updated, and emptied keys are removed.
+    attempt_keys = f"SELECT {_exercise_count_key_sql('we')} FROM workout_exercises we WHERE we.workout_id = {workout_sql}"
+    return f"""
+        UPDATE user_exercise_counts
+        SET attempt_count = attempt_count - (
+            SELECT COUNT(*)
+            FROM workout_exercises we
+            WHERE we.workout_id = {workout_sql}
+              AND ({_exercise_count_key_sql("we")}) = (user_exercise_counts.exercise_id, user_exercise_counts.free_text)
+        )
+        WHERE user_id = {user_sql}
+          AND (exercise_id, free_text) IN ({attempt_keys});
+        DELETE FROM user_exercise_counts
+        WHERE user_id = {user_sql}
+          AND (exercise_id, free_text) IN ({attempt_keys})
+          AND attempt_count <= 0;
     """
-    Seed a baseline set of exercises with per-goal recommendations.
 
-    Existing entries are skipped so reruns remain safe, while missing instructions are filled.
+
+def _decrement_exercise_count_sql() -> str:
+    """Return trigger statements that remove the OLD workout_exercises row from its exercise count."""
+    # Both statements are primary-key seeks on the one affected key.
+    target = f"""
+        user_id = (SELECT user_id FROM workouts WHERE id = OLD.workout_id)
+        AND (exercise_id, free_text) = ({_exercise_count_key_sql("OLD")})
+    """
+    return f"""
+        UPDATE user_exercise_counts SET attempt_count = attempt_count - 1 WHERE {target};
+        DELETE FROM user_exercise_counts WHERE {target} AND attempt_count <= 0;
     """
-    # Preload a curated set of exercises for first-time users.
-    existing_names = {row[0].strip().lower() for row in conn.execute("SELECT name FROM exercises;")}
 
-    exercises = [
-        {
-            "name": "Push-Up",
-            "icon": "push_up",
-            "short_description": "Bodyweight push for chest, shoulders, and triceps.",
-            "execution_instructions": (
-                "Start in a high plank with hands under shoulders. Lower chest until elbows are about "
-                "45 degrees, then press back up while keeping core tight."
-            ),
-            "required_equipment": "Bodyweight (mat optional)",
-            "target_muscle_group": "Chest",
-            "recommendations": {
-                "muscle_building": {
-                    "suitability_rating": 8,
-                    "recommended_sets": 4,
-                    "recommended_reps_per_set": 10,
-                    "recommended_time_seconds": None,
-                },
-                "weight_loss": {
-                    "suitability_rating": 7,
-                    "recommended_sets": 3,
-                    "recommended_reps_per_set": 15,
-                    "recommended_time_seconds": None,
-                },
-                "strength_increase": {
-                    "suitability_rating": 8,
-                    "recommended_sets": 5,
-                    "recommended_reps_per_set": 6,
-                    "recommended_time_seconds": None,
-                },
-                "endurance_increase": {
-                    "suitability_rating": 6,
-                    "recommended_sets": 3,
-                    "recommended_reps_per_set": 20,
-                    "recommended_time_seconds": None,
-                },
-            },
-        },
-        {
-            "name": "Barbell Deadlift",
-            "icon": "barbell_deadlift",
-            "short_description": "Compound lift targeting the posterior chain and grip strength.",
-            "execution_instructions": (
-                "Stand with mid-foot under the bar, hinge at hips to grip. Brace your back, drive through "
-                "heels to stand tall, then lower the bar with control."
-            ),
-            "required_equipment": "Barbell, plates",
-            "target_muscle_group": "Posterior chain",
-            "recommendations": {
-                "muscle_building": {
-                    "suitability_rating": 9,
-                    "recommended_sets": 4,
-                    "recommended_reps_per_set": 8,
-                    "recommended_time_seconds": None,
-                },
-                "weight_loss": {
+
+_STATS_TOTALS_SQL = """
+    SELECT user_id, COUNT(*), COALESCE(SUM(duration_minutes), 0)
+    FROM workouts
+    GROUP BY user_id
+"""
+_STATS_EXERCISE_COUNTS_SQL = f"""
+    SELECT w.user_id, {_exercise_count_key_sql("we")}, COUNT(*)
+    FROM workouts w
+    JOIN workout_exercises we ON w.id = we.workout_id
+    GROUP BY 1, 2, 3
+"""
+
+
+def _fill_stats_rollup(conn: sqlite3.Connection) -> None:
+    """Replace rollup contents with totals aggregated from workouts."""
+    # Callers control the surrounding transaction.
+    conn.execute("DELETE FROM user_stats;")
+    conn.execute("DELETE FROM user_exercise_counts;")
+    conn.execute(f"INSERT INTO user_stats (user_id, total_workouts, total_minutes) {_STATS_TOTALS_SQL};")
+    conn.execute(
+        "INSERT INTO user_exercise_counts (user_id, exercise_id, free_text, attempt_count) "
+        f"{_STATS_EXERCISE_COUNTS_SQL};"
+    )
+
+
+def rebuild_stats_rollup(conn: sqlite3.Connection) -> None:
+    """Recompute the per-user stats rollup and last-performed tables from workouts."""
+    # Replace rollup contents in one transaction so readers never see partial totals.
+    with conn:
+        _fill_stats_rollup(conn)
+        _fill_last_performed(conn)
+
+
+def check_stats_rollup(conn: sqlite3.Connection) -> list[tuple[int, str, object, object]]:
+    """
+    Compare the stats rollup with a full recomputation.
+
+    Returns (user_id, field, rollup_value, recomputed_value) tuples; an empty list means consistent.
+    """
+    # Diff both rollup tables against freshly aggregated values.
+    mismatches: list[tuple[int, str, object, object]] = []
+    expected_totals = {row[0]: row[1:] for row in conn.execute(_STATS_TOTALS_SQL)}
+    stored_totals = {
+        row[0]: row[1:]
+        for row in conn.execute("SELECT user_id, total_workouts, total_minutes FROM user_stats;")
+    }
+    for user_id in sorted(set(expected_totals) | set(stored_totals)):
+        expected = expected_totals.get(user_id, (0, 0))
+        stored = stored_totals.get(user_id, (0, 0))
+        for field, stored_value, expected_value in zip(("total_workouts", "total_minutes"), stored, expected):
+            if stored_value != expected_value:
+                mismatches.append((user_id, field, stored_value, expected_value))
+
+    expected_counts = {row[:3]: row[3] for row in conn.execute(_STATS_EXERCISE_COUNTS_SQL)}
+    stored_counts = {
+        row[:3]: row[3]
+        for row in conn.execute("SELECT user_id, exercise_id, free_text, attempt_count FROM user_exercise_counts;")
+    }
+    for key in sorted(set(expected_counts) | set(stored_counts)):
+        stored_value = stored_counts.get(key, 0)
+        expected_value = expected_counts.get(key, 0)
+        if stored_value != expected_value:
+            mismatches.append((key[0], f"exercise:{key[2] or key[1]}", stored_value, expected_value))
+
+    expected_last = {
+        (row[0], row[1]): row[2:]
+        for row in conn.execute(f"{_LAST_PERFORMED_SQL} GROUP BY w.user_id, we.exercise_id;")
+    }
+    stored_last = {
+        (row[0], row[1]): row[2:]
+        for row in conn.execute(f"SELECT {_LAST_PERFORMED_COLUMNS} FROM user_exercise_last_performed;")
+    }
+    for key in sorted(set(expected_last) | set(stored_last)):
+        stored_value = stored_last.get(key)
+        expected_value = expected_last.get(key)
+        if stored_value != expected_value:
+            mismatches.append((key[0], f"last_performed:{key[1]}", stored_value, expected_value))
+    return mismatches
+
+
+def _add_workout_exercise_id_column(conn: sqlite3.Connection) -> None:
+    """Add the nullable workout_exercises.exercise_id column to databases that predate it."""
+    # Rows stay NULL until _migration_workout_exercise_ids backfills them.
+    _add_column_if_missing(
+        conn,
+        "workout_exercises",
+        "exercise_id",
+        "exercise_id INTEGER REFERENCES exercises (id) ON DELETE SET NULL",
+    )
+
+
+def _migration_stats_rollup(conn: sqlite3.Connection) -> None:
+    """Add the per-user stats rollup and populate it from existing workouts."""
+    # Create structures first so the rebuild fills them for existing databases.
+    # The rollup keys on exercise_id, so older databases get the column here already.
+    _add_workout_exercise_id_column(conn)
+    _create_stats_rollup(conn)
+    _fill_stats_rollup(conn)
+
+
+def _migration_workout_exercise_ids(conn: sqlite3.Connection) -> None:
+    """
+    Link workout exercises to the catalog through an integer exercise_id.
+
+    Names are matched case-insensitively and keep the spelling the user entered.
+    Unmatched free text keeps a NULL id.
+    """
+    # Backfill ids, then rebuild the rollup because it is keyed by them.
+    _add_workout_exercise_id_column(conn)
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_exercises_lower_name ON exercises (lower(name));")
+    conn.execute(
+        """
+        UPDATE workout_exercises
+        SET exercise_id = (
+            SELECT e.id FROM exercises e WHERE lower(e.name) = lower(trim(workout_exercises.exercise_name))
+        )
+        WHERE exercise_id IS NULL;
+        """
+    )
+    conn.execute(
+        "CREATE INDEX IF NOT EXISTS idx_workout_exercises_exercise ON workout_exercises (exercise_id, workout_id);"
+    )
+    _fill_stats_rollup(conn)
+
+
+def _create_exercise_tags(conn: sqlite3.Connection, schema: str = "main") -> None:
+    """Create the normalized equipment/muscle tag table and its lookup index."""
+    # Position keeps the display order produced by the normalizers.
+    conn.execute(
+        f"""
+        CREATE TABLE IF NOT EXISTS {schema}.exercise_tags (
+            exercise_id INTEGER NOT NULL,
+            kind TEXT NOT NULL CHECK (kind IN {TAG_KINDS}),
+            tag TEXT NOT NULL,
+            position INTEGER NOT NULL DEFAULT 0,
+            PRIMARY KEY (exercise_id, kind, tag),
+            FOREIGN KEY (exercise_id) REFERENCES exercises (id) ON DELETE CASCADE
+        ) WITHOUT ROWID;
+        """
+    )
+    conn.execute(
+        f"CREATE INDEX IF NOT EXISTS {schema}.idx_exercise_tags_lookup ON exercise_tags (kind, tag, exercise_id);"
+    )
+
+
+def _write_exercise_tags(
+    conn: sqlite3.Connection,
+    exercise_id: int,
+    equipment_items: Sequence[str],
+    muscle_items: Sequence[str],
+) -> None:
+    """Replace the stored tags for one exercise."""
+    # Delete-then-insert keeps reruns idempotent.
+    conn.execute("DELETE FROM exercise_tags WHERE exercise_id = ?;", (exercise_id,))
+    rows = [(exercise_id, "equipment", tag, position) for position, tag in enumerate(equipment_items)]
+    rows.extend((exercise_id, "muscle", tag, position) for position, tag in enumerate(muscle_items))
+    conn.executemany(
+        "INSERT OR IGNORE INTO exercise_tags (exercise_id, kind, tag, position) VALUES (?, ?, ?, ?);",
+        rows,
+    )
+
+
+def _migration_exercise_tags(conn: sqlite3.Connection) -> None:
+    """Move comma-joined equipment and muscle strings into exercise_tags rows."""
+    # Normalize each exercise once here instead of on every app start.
+    _create_exercise_tags(conn)
+    rows = conn.execute("SELECT id, required_equipment, target_muscle_group FROM exercises;").fetchall()
+    for exercise_id, equipment, muscle_group in rows:
+        _write_exercise_tags(
+            conn,
+            exercise_id,
+            normalize_equipment_list(equipment or ""),
+            normalize_muscle_group_list(muscle_group or ""),
+        )
+
+
+def _migration_app_meta(conn: sqlite3.Connection, schema: str = "main") -> None:
+    """Add a key/value table for application bookkeeping such as the seed version."""
+    # Kept separate from PRAGMA user_version, which tracks the schema only.
+    conn.execute(
+        f"""
+        CREATE TABLE IF NOT EXISTS {schema}.app_meta (
+            key TEXT PRIMARY KEY,
+            value TEXT
+        ) WITHOUT ROWID;
+        """
+    )
+
+
+def get_meta(conn: sqlite3.Connection, key: str, *, schema: str = "main") -> Optional[str]:
+    """Return an app_meta value from the user database or the catalog, or None when unset."""
+    # Single primary-key lookup.
+    row = conn.execute(f"SELECT value FROM {schema}.app_meta WHERE key = ?;", (key,)).fetchone()
+    return row[0] if row else None
+
+
+def set_meta(conn: sqlite3.Connection, key: str, value: object, *, schema: str = "main") -> None:
+    """Store an app_meta value in the user database or the catalog; the caller commits."""
+    # Upsert so repeated stamps overwrite the previous value.
+    conn.execute(
+        f"INSERT INTO {schema}.app_meta (key, value) VALUES (?, ?) "
+        "ON CONFLICT (key) DO UPDATE SET value = excluded.value;",
+        (key, str(value)),
+    )
+
+
+_LAST_PERFORMED_COLUMNS = "user_id, exercise_id, last_performed_at, last_performed_day, times_performed"
+# Bare performed_day follows the MAX(performed_at) row, per SQLite's min/max aggregate rule.
+_LAST_PERFORMED_SQL = """
+    SELECT w.user_id, we.exercise_id, MAX(w.performed_at), w.performed_day, COUNT(DISTINCT w.id)
+    FROM workouts w
+    JOIN workout_exercises we ON w.id = we.workout_id
+    WHERE we.exercise_id IS NOT NULL
+"""
+
+
+def _last_performed_refresh_sql(user_sql: str, ids_sql: str, skip_workout_sql: str = "NULL") -> str:
+    """Return trigger statements that recompute last-performed rows for one user and a set of exercise ids."""
+    # Used for the rare update and delete paths; inserts take the incremental trigger.
+    return f"""
+        DELETE FROM user_exercise_last_performed
+        WHERE user_id = {user_sql} AND exercise_id IN ({ids_sql});
+        INSERT INTO user_exercise_last_performed ({_LAST_PERFORMED_COLUMNS})
+        {_LAST_PERFORMED_SQL}
+          AND w.user_id = {user_sql}
+          AND we.exercise_id IN ({ids_sql})
+          AND w.id IS NOT {skip_workout_sql}
+        GROUP BY w.user_id, we.exercise_id;
+    """
+
+
+
+def _create_last_performed(conn: sqlite3.Connection) -> None:
+    """Create the per-user last-performed table and the triggers that maintain it."""
+    # Only catalog-linked attempts count, matching what recommendation scoring can look up.
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS user_exercise_last_performed (
+            user_id INTEGER NOT NULL,
+            exercise_id INTEGER NOT NULL,
+            last_performed_at TEXT NOT NULL,
+            last_performed_day INTEGER,
+            times_performed INTEGER NOT NULL DEFAULT 0,
+            PRIMARY KEY (user_id, exercise_id),
+            FOREIGN KEY (user_id) REFERENCES users (id) ON DELETE CASCADE
+        ) WITHOUT ROWID;
+        """
+    )
+    # times_performed counts workouts, so repeats inside one workout add nothing.
+    conn.execute(
+        f"""
+        CREATE TRIGGER IF NOT EXISTS trg_workout_exercises_last_performed_insert
+        AFTER INSERT ON workout_exercises
+        WHEN NEW.exercise_id IS NOT NULL
+        BEGIN
+            INSERT INTO user_exercise_last_performed ({_LAST_PERFORMED_COLUMNS})
+            SELECT w.user_id, NEW.exercise_id, w.performed_at, w.performed_day, NOT EXISTS (
+                SELECT 1
+                FROM workout_exercises we
+                WHERE we.workout_id = NEW.workout_id
+                  AND we.exercise_id = NEW.exercise_id
+                  AND we.id <> NEW.id
+            )
+            FROM workouts w
+            WHERE w.id = NEW.workout_id
+            ON CONFLICT (user_id, exercise_id) DO UPDATE SET
+                times_performed = times_performed + excluded.times_performed,
+                last_performed_day = CASE
+                    WHEN excluded.last_performed_at > last_performed_at THEN excluded.last_performed_day
+                    ELSE last_performed_day
+                END,
+                last_performed_at = MAX(last_performed_at, excluded.last_performed_at);
+        END;
+        """
+    )
+    conn.execute(
+        f"""
+        CREATE TRIGGER IF NOT EXISTS trg_workout_exercises_last_performed_update
+        AFTER UPDATE OF exercise_id ON workout_exercises
+        BEGIN
+            {_last_performed_refresh_sql(
+                "(SELECT user_id FROM workouts WHERE id = NEW.workout_id)",
+                "OLD.exercise_id, NEW.exercise_id",
+            )}
+        END;
+        """
+    )
+    # Direct child deletes only; cascaded deletes are handled by the workouts trigger below.
+    conn.execute(
+        f"""
+        CREATE TRIGGER IF NOT EXISTS trg_workout_exercises_last_performed_delete
+        AFTER DELETE ON workout_exercises
+        WHEN EXISTS (SELECT 1 FROM workouts WHERE id = OLD.workout_id)
+        BEGIN
+            {_last_performed_refresh_sql("(SELECT user_id FROM workouts WHERE id = OLD.workout_id)", "OLD.exercise_id")}
+        END;
+        """
+    )
+    conn.execute(
+        f"""
+        CREATE TRIGGER IF NOT EXISTS trg_workouts_last_performed_delete
+        BEFORE DELETE ON workouts
+        BEGIN
+            {_last_performed_refresh_sql(
+                "OLD.user_id",
+                "SELECT exercise_id FROM workout_exercises WHERE workout_id = OLD.id",
+                "OLD.id",
+            )}
+        END;
+        """
+    )
+    conn.execute(
+        f"""
+        CREATE TRIGGER IF NOT EXISTS trg_workouts_last_performed_update
+        AFTER UPDATE OF user_id, performed_at, performed_day ON workouts
+        BEGIN
+            {_last_performed_refresh_sql(
+                "OLD.user_id", "SELECT exercise_id FROM workout_exercises WHERE workout_id = NEW.id"
+            )}
+            {_last_performed_refresh_sql(
+                "NEW.user_id", "SELECT exercise_id FROM workout_exercises WHERE workout_id = NEW.id"
+            )}
+        END;
+        """
+    )
+
+
+def _fill_last_performed(conn: sqlite3.Connection) -> None:
+    """Replace last-performed rows with values aggregated from workouts."""
+    # Callers control the surrounding transaction.
+    conn.execute("DELETE FROM user_exercise_last_performed;")
+    conn.execute(
+        f"""
+        INSERT INTO user_exercise_last_performed ({_LAST_PERFORMED_COLUMNS})
+        {_LAST_PERFORMED_SQL}
+        GROUP BY w.user_id, we.exercise_id;
+        """
+    )
+
+
+def _migration_last_performed(conn: sqlite3.Connection) -> None:
+    """Add the per-user last-performed table and populate it from existing workouts."""
+    # Replaces the recency scan over a user's full history with a primary-key range read.
+    _create_last_performed(conn)
+    _fill_last_performed(conn)
+
+
+_SEARCH_TOKEN_PATTERN = re.compile(r"\w+", re.UNICODE)
+# bm25 column weights for name, short_description and execution_instructions.
+_SEARCH_WEIGHTS = (10.0, 2.0, 1.0)
+
+
+def _has_exercise_search(conn: sqlite3.Connection) -> bool:
+    """Return True when the exercises_fts index exists in the attached catalog."""
+    # Missing when the SQLite build lacks FTS5; search then falls back to LIKE.
+    row = conn.execute(
+        f"SELECT 1 FROM {CATALOG_SCHEMA}.sqlite_master WHERE type = 'table' AND name = 'exercises_fts';"
+    ).fetchone()
+    return row is not None
+
+
+def _migration_exercise_search(conn: sqlite3.Connection, schema: str = "main") -> None:
+    """Add an FTS5 index over exercise text with triggers that keep it in sync."""
+    # External-content table: the text lives once in exercises, FTS5 stores only the index.
+    try:
+        conn.execute(
+            f"""
+            CREATE VIRTUAL TABLE IF NOT EXISTS {schema}.exercises_fts USING fts5(
+                name,
+                short_description,
+                execution_instructions,
+                content = 'exercises',
+                content_rowid = 'id',
+                tokenize = 'unicode61 remove_diacritics 2',
+                prefix = '2 3'
+            );
+            """
+        )
+    except sqlite3.OperationalError as exc:
+        if "fts5" not in str(exc):
+            raise
+        return
+    conn.execute(
+        f"""
+        CREATE TRIGGER IF NOT EXISTS {schema}.trg_exercises_fts_insert
+        AFTER INSERT ON exercises
+        BEGIN
+            INSERT INTO exercises_fts (rowid, name, short_description, execution_instructions)
+            VALUES (NEW.id, NEW.name, NEW.short_description, NEW.execution_instructions);
+        END;
+        """
+    )
+    conn.execute(
+        f"""
+        CREATE TRIGGER IF NOT EXISTS {schema}.trg_exercises_fts_delete
+        AFTER DELETE ON exercises
+        BEGIN
+            INSERT INTO exercises_fts (exercises_fts, rowid, name, short_description, execution_instructions)
+            VALUES ('delete', OLD.id, OLD.name, OLD.short_description, OLD.execution_instructions);
+        END;
+        """
+    )
+    conn.execute(
+        f"""
+        CREATE TRIGGER IF NOT EXISTS {schema}.trg_exercises_fts_update
+        AFTER UPDATE OF name, short_description, execution_instructions ON exercises
+        BEGIN
+            INSERT INTO exercises_fts (exercises_fts, rowid, name, short_description, execution_instructions)
+            VALUES ('delete', OLD.id, OLD.name, OLD.short_description, OLD.execution_instructions);
+            INSERT INTO exercises_fts (rowid, name, short_description, execution_instructions)
+            VALUES (NEW.id, NEW.name, NEW.short_description, NEW.execution_instructions);
+        END;
+        """
+    )
+    conn.execute(f"INSERT INTO {schema}.exercises_fts (exercises_fts) VALUES ('rebuild');")
+
+
+# Tables whose changes the change_counters triggers record, grouped by the cache they invalidate.
+CHANGE_TOPICS: dict[str, tuple[str, ...]] = {
+    "catalog": ("exercises", "goal_recommendations", "exercise_tags"),
+    "users": ("users",),
+    "history": ("workouts", "workout_exercises"),
+}
+
+
+def _create_change_counters(conn: sqlite3.Connection, tables: Sequence[str], schema: str = "main") -> None:
+    """Add per-table change counters and the triggers that bump them on every row change."""
+    # Counters live next to their tables so triggers never reach across files.
+    conn.execute(
+        f"""
+        CREATE TABLE IF NOT EXISTS {schema}.change_counters (
+            table_name TEXT PRIMARY KEY,
+            version INTEGER NOT NULL DEFAULT 0
+        ) WITHOUT ROWID;
+        """
+    )
+    for table in tables:
+        conn.execute(f"INSERT OR IGNORE INTO {schema}.change_counters (table_name) VALUES (?);", (table,))
+        for operation in ("INSERT", "UPDATE", "DELETE"):
+            conn.execute(
+                f"""
+                CREATE TRIGGER IF NOT EXISTS {schema}.trg_{table}_change_{operation.lower()}
+                AFTER {operation} ON {table}
+                BEGIN
+                    UPDATE change_counters SET version = version + 1 WHERE table_name = '{table}';
+                END;
+                """
+            )
+
+
+def _migration_change_counters(conn: sqlite3.Connection) -> None:
+    """Count changes to the user database tables for cross-process change detection."""
+    # The catalog file gets its counters from _create_catalog_schema.
+    _create_change_counters(conn, CHANGE_TOPICS["users"] + CHANGE_TOPICS["history"])
+
+
+CATALOG_SCHEMA_VERSION = 2
+# User schema version at which the catalog moved into its own file.
+_CATALOG_SPLIT_VERSION = 10
+_CATALOG_EXERCISE_COLUMNS = (
+    "name, icon, short_description, execution_instructions, required_equipment, target_muscle_group"
+)
+_CATALOG_RECOMMENDATION_COLUMNS = (
+    "goal, suitability_rating, recommended_sets, recommended_reps_per_set, recommended_time_seconds"
+)
+
+
+def _create_catalog_schema(conn: sqlite3.Connection) -> None:
+    """Create the catalog tables, indexes and search index in the attached catalog file."""
+    # The catalog half of create_schema in its fully migrated form, stamped with its own user_version.
+    # Every step is idempotent, so rerunning it also upgrades an older catalog.
+    _create_catalog_tables(conn, CATALOG_SCHEMA)
+    conn.execute(f"CREATE INDEX IF NOT EXISTS {CATALOG_SCHEMA}.idx_exercises_lower_name ON exercises (lower(name));")
+    _create_exercise_tags(conn, CATALOG_SCHEMA)
+    _migration_app_meta(conn, CATALOG_SCHEMA)
+    _migration_exercise_search(conn, CATALOG_SCHEMA)
+    _create_change_counters(conn, CHANGE_TOPICS["catalog"], CATALOG_SCHEMA)
+    conn.execute(f"PRAGMA {CATALOG_SCHEMA}.user_version = {CATALOG_SCHEMA_VERSION};")
+
+
+def _require_catalog(conn: sqlite3.Connection) -> None:
+    """Raise when a read-only catalog has not been prepared by a writable run."""
+    # Read-only and immutable catalogs can neither be created nor migrated here.
+    if get_schema_version(conn, CATALOG_SCHEMA) < CATALOG_SCHEMA_VERSION:
+        raise sqlite3.OperationalError(
+            "The exercise catalog is missing or outdated; initialize it once with catalog_mode='rw'."
+        )
+
+
+def _copy_catalog_rows(conn: sqlite3.Connection) -> None:
+    """
+    Copy exercises, recommendations and tags from the user database into the catalog.
+
+    An empty catalog receives every row with its id. A populated catalog, e.g. one shared
+    by several installs, only gains exercises it does not already know by case-insensitive
+    name, one per name, so running the copy again after it committed adds nothing.
+    """
+    # Catalog triggers keep the search index in step with the inserted exercises.
+    if conn.execute(f"SELECT NOT EXISTS (SELECT 1 FROM {CATALOG_SCHEMA}.exercises);").fetchone()[0]:
+        conn.execute(
+            f"""
+            INSERT INTO {CATALOG_SCHEMA}.exercises (id, {_CATALOG_EXERCISE_COLUMNS})
+            SELECT id, {_CATALOG_EXERCISE_COLUMNS} FROM main.exercises;
+            """
+        )
+        conn.execute(
+            f"""
+            INSERT INTO {CATALOG_SCHEMA}.goal_recommendations (id, exercise_id, {_CATALOG_RECOMMENDATION_COLUMNS})
+            SELECT id, exercise_id, {_CATALOG_RECOMMENDATION_COLUMNS} FROM main.goal_recommendations;
+            """
+        )
+        conn.execute(
+            f"""
+            INSERT INTO {CATALOG_SCHEMA}.exercise_tags (exercise_id, kind, tag, position)
+            SELECT exercise_id, kind, tag, position FROM main.exercise_tags;
+            """
+        )
+        return
+    first_new_id = conn.execute(f"SELECT MAX(id) + 1 FROM {CATALOG_SCHEMA}.exercises;").fetchone()[0]
+    conn.execute(
+        f"""
+        INSERT INTO {CATALOG_SCHEMA}.exercises ({_CATALOG_EXERCISE_COLUMNS})
+        SELECT {_CATALOG_EXERCISE_COLUMNS}
+        FROM main.exercises m
+        WHERE NOT EXISTS (SELECT 1 FROM {CATALOG_SCHEMA}.exercises c WHERE lower(c.name) = lower(m.name))
+          AND m.id = (SELECT MIN(d.id) FROM main.exercises d WHERE lower(d.name) = lower(m.name))
+        ORDER BY m.id;
+        """
+    )
+    conn.execute(
+        f"""
+        INSERT OR IGNORE INTO {CATALOG_SCHEMA}.goal_recommendations (exercise_id, {_CATALOG_RECOMMENDATION_COLUMNS})
+        SELECT c.id, r.goal, r.suitability_rating, r.recommended_sets, r.recommended_reps_per_set,
+               r.recommended_time_seconds
+        FROM main.goal_recommendations r
+        JOIN main.exercises m ON m.id = r.exercise_id
+        JOIN {CATALOG_SCHEMA}.exercises c ON lower(c.name) = lower(m.name) AND c.id >= ?;
+        """,
+        (first_new_id,),
+    )
+    conn.execute(
+        f"""
+        INSERT OR IGNORE INTO {CATALOG_SCHEMA}.exercise_tags (exercise_id, kind, tag, position)
+        SELECT c.id, t.kind, t.tag, t.position
+        FROM main.exercise_tags t
+        JOIN main.exercises m ON m.id = t.exercise_id
+        JOIN {CATALOG_SCHEMA}.exercises c ON lower(c.name) = lower(m.name) AND c.id >= ?;
+        """,
+        (first_new_id,),
+    )
+
+
+def _prepare_catalog_split(conn: sqlite3.Connection, catalog_mode: str) -> None:
+    """
+    Copy the local catalog into the catalog file before _migration_split_catalog runs.
+
+    A writable catalog is created and receives the rows; a read-only one must already
+    be prepared. The copy is idempotent, so a crash before the split itself commits only
+    means it runs again on the next start.
+    """
+    # Runs in a transaction of its own: with a WAL user database SQLite commits the two
+    # files separately, so the local tables must only be dropped once the catalog holds the rows.
+    if catalog_mode != "rw":
+        _require_catalog(conn)
+        return
+    _create_catalog_schema(conn)
+    if conn.execute("SELECT 1 FROM main.sqlite_master WHERE type = 'table' AND name = 'exercises';").fetchone():
+        _copy_catalog_rows(conn)
+
+
+def _migration_split_catalog(conn: sqlite3.Connection) -> None:
+    """
+    Drop the local exercise catalog once _prepare_catalog_split has copied it.
+
+    workout_exercises is rebuilt without its foreign key to exercises, which SQLite
+    cannot enforce across files, and its exercise ids are relinked to the catalog by name.
+    Exercises a read-only shared catalog lacks keep their names with a NULL id.
+    """
+    # Dropping every trigger first lets the table swap run without dangling references.
+    for (trigger_name,) in conn.execute("SELECT name FROM main.sqlite_master WHERE type = 'trigger';").fetchall():
+        conn.execute(f"DROP TRIGGER main.{trigger_name};")
+    conn.execute(
+        """
+        CREATE TABLE main.workout_exercises_split (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            workout_id INTEGER NOT NULL,
+            exercise_id INTEGER,
+            exercise_name TEXT NOT NULL,
+            status TEXT NOT NULL DEFAULT 'completed' CHECK (status IN ('completed','skipped')),
+            FOREIGN KEY (workout_id) REFERENCES workouts (id) ON DELETE CASCADE
+        );
+        """
+    )
+    conn.execute(
+        f"""
+        INSERT INTO main.workout_exercises_split (id, workout_id, exercise_id, exercise_name, status)
+        SELECT we.id, we.workout_id, e.id, we.exercise_name, we.status
+        FROM main.workout_exercises we
+        LEFT JOIN {CATALOG_SCHEMA}.exercises e ON e.id = (
+            SELECT c.id FROM {CATALOG_SCHEMA}.exercises c
+            WHERE lower(c.name) = lower(trim(we.exercise_name))
+            ORDER BY c.id
+            LIMIT 1
+        );
+        """
+    )
+    sequence_row = conn.execute("SELECT seq FROM main.sqlite_sequence WHERE name = 'workout_exercises';").fetchone()
+    conn.execute("DROP TABLE main.workout_exercises;")
+    conn.execute("ALTER TABLE main.workout_exercises_split RENAME TO workout_exercises;")
+    if sequence_row:
+        conn.execute(
+            "UPDATE main.sqlite_sequence SET seq = MAX(seq, ?) WHERE name = 'workout_exercises';",
+            sequence_row,
+        )
+    _migration_secondary_indexes(conn)
+    conn.execute(
+        "CREATE INDEX IF NOT EXISTS idx_workout_exercises_exercise ON workout_exercises (exercise_id, workout_id);"
+    )
+
+    for table in ("exercises_fts", "exercise_tags", "goal_recommendations", "exercises"):
+        conn.execute(f"DROP TABLE IF EXISTS main.{table};")
+    conn.execute("DELETE FROM main.sqlite_sequence WHERE name IN ('exercises', 'goal_recommendations');")
+    _create_stats_rollup(conn)
+    _create_last_performed(conn)
+    _fill_stats_rollup(conn)
+    _fill_last_performed(conn)
+
+
+# Ordered (version, migration) pairs; append new steps with the next version number.
+_MIGRATIONS: list[tuple[int, Callable[[sqlite3.Connection], None]]] = [
+    (1, _migration_enriched_workout_columns),
+    (2, _migration_secondary_indexes),
+    (3, _migration_performed_day),
+    (4, _migration_stats_rollup),
+    (5, _migration_workout_exercise_ids),
+    (6, _migration_exercise_tags),
+    (7, _migration_app_meta),
+    (8, _migration_last_performed),
+    (9, _migration_exercise_search),
+    (_CATALOG_SPLIT_VERSION, _migration_split_catalog),
+    (11, _migration_change_counters),
+]
+SCHEMA_VERSION = _MIGRATIONS[-1][0]
+# Steps that must first write the catalog file, committed separately before the step runs.
+_MIGRATION_PREPARES: dict[int, Callable[[sqlite3.Connection, str], None]] = {
+    _CATALOG_SPLIT_VERSION: _prepare_catalog_split,
+}
+
+
+def get_schema_version(conn: sqlite3.Connection, schema: str = "main") -> int:
+    """Return the schema version stored in PRAGMA user_version of the user database or the catalog."""
+    # user_version defaults to 0 for databases created before versioning.
+    return conn.execute(f"PRAGMA {schema}.user_version;").fetchone()[0]
+
+
+def migrate_schema(conn: sqlite3.Connection, *, catalog_mode: str = "rw") -> None:
+    """
+    Apply pending schema migrations tracked by PRAGMA user_version.
+
+    Each step runs in its own transaction and bumps user_version on success,
+    so an up-to-date database returns after a single PRAGMA read. catalog_mode is
+    the mode the attached catalog was opened with; preparation steps in
+    _MIGRATION_PREPARES commit before their step and must be idempotent.
+    """
+    # Skip all introspection when the stored version is current.
+    current = get_schema_version(conn)
+    if current >= SCHEMA_VERSION:
+        return
+    if conn.in_transaction:
+        conn.commit()
+    for version, migration in _MIGRATIONS:
+        if version <= current:
+            continue
+        prepare = _MIGRATION_PREPARES.get(version)
+        if prepare is not None:
+            conn.execute("BEGIN;")
+            try:
+                prepare(conn, catalog_mode)
+            except Exception:
+                conn.rollback()
+                raise
+            conn.commit()
+        conn.execute("BEGIN;")
+        try:
+            migration(conn)
+            conn.execute(f"PRAGMA user_version = {version};")
+        except Exception:
+            conn.rollback()
+            raise
+        conn.commit()
+
+
+def seed_sample_data(conn: sqlite3.Connection) -> None:
+    """
+    Seed a baseline set of exercises with per-goal recommendations.
+
+    Existing entries are skipped so reruns remain safe, while missing instructions are filled.
+    """
+    # Preload a curated set of exercises for first-time users.
+    existing_names = {row[0].strip().lower() for row in conn.execute("SELECT name FROM exercises;")}
+
+    exercises = [
+        {
+            "name": "Push-Up",
+            "icon": "push_up",
+            "short_description": "Bodyweight push for chest, shoulders, and triceps.",
+            "execution_instructions": (
+                "Start in a high plank with hands under shoulders. Lower chest until elbows are about "
+                "45 degrees, then press back up while keeping core tight."
+            ),
+            "required_equipment": "Bodyweight (mat optional)",
+            "target_muscle_group": "Chest",
+            "recommendations": {
+                "muscle_building": {
+                    "suitability_rating": 8,
+                    "recommended_sets": 4,
+                    "recommended_reps_per_set": 10,
+                    "recommended_time_seconds": None,
+                },
+                "weight_loss": {
+                    "suitability_rating": 7,
+                    "recommended_sets": 3,
+                    "recommended_reps_per_set": 15,
+                    "recommended_time_seconds": None,
+                },
+                "strength_increase": {
+                    "suitability_rating": 8,
+                    "recommended_sets": 5,
+                    "recommended_reps_per_set": 6,
+                    "recommended_time_seconds": None,
+                },
+                "endurance_increase": {
+                    "suitability_rating": 6,
+                    "recommended_sets": 3,
+                    "recommended_reps_per_set": 20,
+                    "recommended_time_seconds": None,
+                },
+            },
+        },
+        {
+            "name": "Barbell Deadlift",
+            "icon": "barbell_deadlift",
+            "short_description": "Compound lift targeting the posterior chain and grip strength.",
+            "execution_instructions": (
+                "Stand with mid-foot under the bar, hinge at hips to grip. Brace your back, drive through "
+                "heels to stand tall, then lower the bar with control."
+            ),
+            "required_equipment": "Barbell, plates",
+            "target_muscle_group": "Posterior chain",
+            "recommendations": {
+                "muscle_building": {
+                    "suitability_rating": 9,
+                    "recommended_sets": 4,
+                    "recommended_reps_per_set": 8,
+                    "recommended_time_seconds": None,
+                },
+                "weight_loss": {
                     "suitability_rating": 6,
                     "recommended_sets": 3,
                     "recommended_reps_per_set": 12,
@@ -1113,8 +2689,10 @@ def seed_sample_data(conn: sqlite3.Connection) -> None:
                     (instructions, name_key),
                 )
             continue
-        equipment_value = format_tag_list(normalize_equipment_list(exercise["required_equipment"]))
-        muscle_value = format_tag_list(normalize_muscle_group_list(exercise["target_muscle_group"]))
+        equipment_items = normalize_equipment_list(exercise["required_equipment"])
+        muscle_items = normalize_muscle_group_list(exercise["target_muscle_group"])
+        equipment_value = format_tag_list(equipment_items)
+        muscle_value = format_tag_list(muscle_items)
         cursor = conn.execute(
             exercise_stmt,
             (
@@ -1127,6 +2705,7 @@ def seed_sample_data(conn: sqlite3.Connection) -> None:
             ),
         )
         exercise_id = cursor.lastrowid
+        _write_exercise_tags(conn, exercise_id, equipment_items, muscle_items)
 
         for goal, recommendation in exercise["recommendations"].items():
             conn.execute(
@@ -1216,16 +2795,18 @@ def seed_example_user(conn: sqlite3.Connection) -> None:
             INSERT INTO workouts (
                 user_id,
                 performed_at,
+                performed_day,
                 duration_minutes,
                 goal,
                 duration_seconds,
                 total_sets_completed
             )
-            VALUES (?, ?, ?, ?, ?, ?);
+            VALUES (?, ?, ?, ?, ?, ?, ?);
             """,
             (
                 user_id,
                 workout["performed_at"],
+                day_number(workout["performed_at"]),
                 duration_minutes,
                 workout["goal"],
                 duration_minutes * 60,
@@ -1234,24 +2815,266 @@ def seed_example_user(conn: sqlite3.Connection) -> None:
         )
         workout_id = cursor.lastrowid
         conn.executemany(
-            "INSERT INTO workout_exercises (workout_id, exercise_name, status) VALUES (?, ?, ?);",
-            [(workout_id, name, "completed") for name in workout["exercises"]],
+            "INSERT INTO workout_exercises (workout_id, exercise_id, exercise_name, status) VALUES (?, ?, ?, ?);",
+            _workout_exercise_rows(conn, workout_id, [(name, "completed") for name in workout["exercises"]]),
         )
     conn.commit()
 
 
 def initialize_database(db_path: Optional[Path] = None) -> Path:
-    """Create the SQLite database file with schema and seed data."""
-    # Initialize schema and sample content in a single entry point.
+    """
+    Create the SQLite database file with schema and seed data.
+
+    A warm start with a current schema and seed stamps only reads the user_version and
+    one app_meta row of each file. A read-only catalog is never created or seeded here.
+    Live session journals left behind by a crash or failed save are replayed afterwards.
+    """
+    # The catalog is seeded before the example user, whose workouts link to its exercises.
     target_path = db_path or DB_PATH
     with get_connection(target_path) as conn:
-        create_schema(conn)
-        migrate_schema(conn)
-        seed_sample_data(conn)
-        seed_example_user(conn)
+        if get_schema_version(conn) < SCHEMA_VERSION:
+            create_schema(conn)
+            migrate_schema(conn, catalog_mode=_CONNECTIONS.catalog_mode)
+        if _CONNECTIONS.catalog_mode == "rw":
+            if get_schema_version(conn, CATALOG_SCHEMA) < CATALOG_SCHEMA_VERSION:
+                _create_catalog_schema(conn)
+                conn.commit()
+            if get_meta(conn, "seed_version", schema=CATALOG_SCHEMA) != str(SEED_VERSION):
+                seed_sample_data(conn)
+                set_meta(conn, "seed_version", SEED_VERSION, schema=CATALOG_SCHEMA)
+                conn.commit()
+        else:
+            _require_catalog(conn)
+        if get_meta(conn, "seed_version") != str(SEED_VERSION):
+            seed_example_user(conn)
+            set_meta(conn, "seed_version", SEED_VERSION)
+            conn.commit()
+    replay_session_journals(target_path)
     return target_path
 
 
+def read_change_versions(conn: sqlite3.Connection) -> dict[str, int]:
+    """Return the change counter of every tracked table in the user database and the catalog."""
+    # Both files keep a change_counters table; table names are unique across them.
+    return dict(
+        conn.execute(
+            f"""
+            SELECT table_name, version FROM main.change_counters
+            UNION ALL
+            SELECT table_name, version FROM {CATALOG_SCHEMA}.change_counters;
+            """
+        ).fetchall()
+    )
+
+
+class ChangeMonitor:
+    """
+    Report which caches other connections and processes invalidated since the last poll.
+
+    Each poll reads PRAGMA data_version of the user database and the catalog on a
+    dedicated connection. It only changes when another connection commits, so an idle
+    poll costs two PRAGMA reads. After a change the per-table change_counters show
+    which CHANGE_TOPICS ("catalog", "users", "history") were touched. Writes this
+    process makes through acknowledge are left out, so only other processes' commits
+    (and unacknowledged local ones) are reported.
+    """
+    # The lock serializes polls and acknowledged writes on the monitor's connection.
+    def __init__(self, db_path: Path = DB_PATH) -> None:
+        """Create a monitor for db_path; the first poll records the baseline."""
+        # Nothing is opened until the first poll.
+        self.db_path = Path(db_path)
+        self.counter_reads = 0
+        self._conn: Optional[sqlite3.Connection] = None
+        self._data_versions: Optional[tuple[int, int]] = None
+        self._versions: Optional[dict[str, int]] = None
+        self._lock = threading.Lock()
+
+    def _read_data_versions(self) -> tuple[int, int]:
+        """Return PRAGMA data_version of both files, reconnecting after close_all."""
+        # A fresh connection has fresh data_version values, so the counters decide instead.
+        for _attempt in range(2):
+            if self._conn is None:
+                self._conn = _CONNECTIONS.open(self.db_path)
+                self._data_versions = None
+            try:
+                return (
+                    self._conn.execute("PRAGMA main.data_version;").fetchone()[0],
+                    self._conn.execute(f"PRAGMA {CATALOG_SCHEMA}.data_version;").fetchone()[0],
+                )
+            except sqlite3.ProgrammingError:
+                self._conn = None
+        raise sqlite3.ProgrammingError("Could not reopen the change monitor connection.")
+
+    def poll(self) -> list[str]:
+        """Return the topics with changes since the previous poll, in CHANGE_TOPICS order."""
+        # Reading data_version first means a commit racing the counter read is reported now
+        # or, via a changed data_version, on the next poll; it is never lost.
+        with self._lock:
+            data_versions = self._read_data_versions()
+            if data_versions == self._data_versions:
+                return []
+            self._data_versions = data_versions
+            versions = read_change_versions(self._conn)
+            self.counter_reads += 1
+            previous, self._versions = self._versions, versions
+            if previous is None:
+                return []
+        changed = {table for table, version in versions.items() if previous.get(table) != version}
+        return [topic for topic, tables in CHANGE_TOPICS.items() if changed.intersection(tables)]
+
+    def acknowledge(self, topics: Sequence[str], write: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """
+        Run a local write and keep its changes to topics out of later polls.
+
+        Returns write's result. A table's baseline only moves when it had no unreported
+        change before the write, so earlier commits by other processes are still reported.
+        Only a foreign commit landing during the write itself can be absorbed.
+        """
+        # Holding the lock across the write keeps a concurrent poll from seeing it half-acknowledged.
+        with self._lock:
+            before = None
+            if self._versions is not None:
+                self._read_data_versions()
+                before = read_change_versions(self._conn)
+            result = write(*args, **kwargs)
+            if before is not None and self._versions is not None:
+                after = read_change_versions(self._conn)
+                for topic in topics:
+                    for table in CHANGE_TOPICS[topic]:
+                        if self._versions.get(table) == before.get(table):
+                            self._versions[table] = after.get(table)
+        return result
+
+    def close(self) -> None:
+        """Close the monitor's connection; the next poll reopens it."""
+        # Counters survive, so changes made while closed are still reported.
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+
+# Change counters that version cached history, stats and usage results; writes through
+# log_workout, add_user and update_user_profile (or any other connection) bump them.
+_QUERY_CACHE_TABLES = (*CHANGE_TOPICS["users"], *CHANGE_TOPICS["history"])
+# Results that also show catalog columns, such as the stats' exercise names, add the catalog counters.
+_QUERY_CACHE_CATALOG_TABLES = (*_QUERY_CACHE_TABLES, *CHANGE_TOPICS["catalog"])
+QUERY_CACHE_SIZE = 128
+
+
+class QueryCache:
+    """
+    Bounded LRU cache of query results tagged with the data version they were read at.
+
+    An entry is only served while its version is still current; otherwise the lookup
+    counts as a miss and the entry is replaced. Once maxsize entries are held the least
+    recently used one is evicted. Safe to share between threads.
+    """
+
+    def __init__(self, maxsize: int = QUERY_CACHE_SIZE) -> None:
+        """Create an empty cache holding at most maxsize results."""
+        # Counters are plain attributes so callers can read them without a lock.
+        if maxsize <= 0:
+            raise ValueError("Cache size must be positive.")
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: OrderedDict[tuple, tuple[tuple, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: tuple, version: tuple) -> tuple[bool, Any]:
+        """Return (True, value) when key is cached at version, else (False, None)."""
+        # Stale entries stay until they are replaced or evicted.
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] != version:
+                self.misses += 1
+                return False, None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return True, entry[1]
+
+    def put(self, key: tuple, version: tuple, value: Any) -> None:
+        """Store value for key at version, evicting the least recently used entries."""
+        # Values must not be mutated afterwards; callers cache tuples or copy on the way out.
+        with self._lock:
+            self._entries[key] = (version, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def stats(self) -> dict[str, int]:
+        """Return hit, miss and eviction counters plus the current and maximum size."""
+        # A snapshot; the counters keep moving while other threads query.
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "size": len(self._entries),
+                "maxsize": self.maxsize,
+            }
+
+    def clear(self) -> None:
+        """Drop every entry and reset the counters."""
+        # Used by tests and benchmarks that need cold reads.
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = self.evictions = 0
+
+
+_QUERY_CACHE = QueryCache()
+
+
+def query_cache_stats() -> dict[str, int]:
+    """Return the hit, miss and eviction counters of the shared query cache."""
+    # Covers fetch_workout_history(_page), fetch_workout_stats, fetch_workout_series and
+    # fetch_recent_exercise_usage.
+    return _QUERY_CACHE.stats()
+
+
+def clear_query_cache() -> None:
+    """Drop every cached history, stats and usage result."""
+    # Never needed for correctness; cached entries are versioned by the change counters.
+    _QUERY_CACHE.clear()
+
+
+def _cached_query(
+    db_path: Path,
+    key: tuple,
+    load: Callable[[sqlite3.Connection], Any],
+    *,
+    tables: Sequence[str] = _QUERY_CACHE_TABLES,
+) -> Any:
+    """
+    Return load(conn) for key, reusing the cached result while the data version is unchanged.
+
+    The version is read from the change counters of tables, which must list every table
+    load reads from; catalog tables are looked up in the attached catalog file.
+    """
+    # The version is read before loading, so a racing commit can only make the entry look older.
+    conn = get_connection(db_path)
+    placeholders = ", ".join("?" for _ in tables)
+    version = tuple(
+        conn.execute(
+            f"""
+            SELECT table_name, version FROM main.change_counters WHERE table_name IN ({placeholders})
+            UNION ALL
+            SELECT table_name, version FROM {CATALOG_SCHEMA}.change_counters WHERE table_name IN ({placeholders})
+            ORDER BY table_name;
+            """,
+            (*tables, *tables),
+        )
+    )
+    cache_key = (str(Path(db_path).resolve()), *key)
+    found, value = _QUERY_CACHE.get(cache_key, version)
+    if not found:
+        value = load(conn)
+        _QUERY_CACHE.put(cache_key, version, value)
+    return value
+
+
 def fetch_all(conn: sqlite3.Connection) -> list[tuple]:
     """Helper for quick manual inspection when debugging."""
     # Return all exercise rows with goal recommendations attached.
@@ -1268,6 +3091,119 @@ def fetch_all(conn: sqlite3.Connection) -> list[tuple]:
     ).fetchall()
 
 
+def _split_packed_tags(value: Optional[str]) -> list[str]:
+    """Split a tag list packed by group_concat with the unit separator."""
+    # The unit separator cannot appear in normalized tags.
+    return value.split("\x1f") if value else []
+
+
+def query_exercises(
+    *,
+    goal: Optional[str] = None,
+    muscle_groups: Optional[Iterable[str]] = None,
+    equipment: Optional[Iterable[str]] = None,
+    db_path: Path = DB_PATH,
+) -> list[tuple]:
+    """
+    Return exercise/goal rows filtered by goal, muscle groups and equipment inside SQLite.
+
+    Rows match fetch_all's columns, prefixed by the exercise id and followed by the
+    equipment and muscle tag lists. An exercise matches a tag filter when it has any
+    of the requested tags; None or empty filters are ignored.
+    """
+    # Filter through the indexed exercise_tags table instead of parsing strings in Python.
+    filters: list[str] = []
+    params: list[object] = []
+    if goal:
+        filters.append("r.goal = ?")
+        params.append(goal)
+    for kind, values in (("muscle", muscle_groups), ("equipment", equipment)):
+        tags = sorted({value for value in values or () if value})
+        if not tags:
+            continue
+        placeholders = ", ".join("?" for _ in tags)
+        filters.append(
+            f"e.id IN (SELECT exercise_id FROM exercise_tags WHERE kind = ? AND tag IN ({placeholders}))"
+        )
+        params.extend([kind, *tags])
+    where_clause = f"WHERE {' AND '.join(filters)}" if filters else ""
+    with get_connection(db_path) as conn:
+        rows = conn.execute(
+            f"""
+            SELECT e.id, e.name, e.icon, e.short_description, e.execution_instructions,
+                   e.required_equipment, e.target_muscle_group,
+                   r.goal, r.suitability_rating, r.recommended_sets,
+                   r.recommended_reps_per_set, r.recommended_time_seconds,
+                   (SELECT group_concat(tag, char(31)) FROM (
+                        SELECT tag FROM exercise_tags
+                        WHERE exercise_id = e.id AND kind = 'equipment' ORDER BY position
+                   )),
+                   (SELECT group_concat(tag, char(31)) FROM (
+                        SELECT tag FROM exercise_tags
+                        WHERE exercise_id = e.id AND kind = 'muscle' ORDER BY position
+                   ))
+            FROM exercises e
+            JOIN goal_recommendations r ON e.id = r.exercise_id
+            {where_clause}
+            ORDER BY e.name, r.goal;
+            """,
+            params,
+        ).fetchall()
+    return [(*row[:-2], _split_packed_tags(row[-2]), _split_packed_tags(row[-1])) for row in rows]
+
+
+def _search_match_expression(query: str) -> str:
+    """Turn free text into an FTS5 query where every word must match as a prefix."""
+    # Quoting each token keeps punctuation and FTS5 operators in user text inert.
+    return " ".join(f'"{token}"*' for token in _SEARCH_TOKEN_PATTERN.findall(query))
+
+
+def search_exercises(query: str, *, limit: int = 50, db_path: Path = DB_PATH) -> list[int]:
+    """
+    Return exercise ids matching every word of the query as a prefix, best match first.
+
+    Name matches outrank description and instruction matches. An empty query returns [].
+    """
+    # Rank with bm25 on FTS5 builds; otherwise fall back to an unranked LIKE scan.
+    tokens = _SEARCH_TOKEN_PATTERN.findall(query or "")
+    if not tokens:
+        return []
+    with get_connection(db_path) as conn:
+        if _has_exercise_search(conn):
+            weights = ", ".join(str(weight) for weight in _SEARCH_WEIGHTS)
+            rows = conn.execute(
+                f"""
+                SELECT rowid
+                FROM exercises_fts
+                WHERE exercises_fts MATCH ?
+                ORDER BY bm25(exercises_fts, {weights})
+                LIMIT ?;
+                """,
+                (_search_match_expression(query), limit),
+            ).fetchall()
+        else:
+            text_sql = "(name || ' ' || short_description || ' ' || COALESCE(execution_instructions, ''))"
+            filters = " AND ".join(f"{text_sql} LIKE ?" for _ in tokens)
+            rows = conn.execute(
+                f"SELECT id FROM exercises WHERE {filters} ORDER BY name LIMIT ?;",
+                (*(f"%{token}%" for token in tokens), limit),
+            ).fetchall()
+    return [row[0] for row in rows]
+
+
+def fetch_tag_values(kind: str, *, db_path: Path = DB_PATH) -> list[str]:
+    """Return the distinct tags of one kind ("equipment" or "muscle") in sorted order."""
+    # Read straight from the tag index for filter option lists.
+    if kind not in TAG_KINDS:
+        raise ValueError(f"Unknown tag kind: {kind}")
+    with get_connection(db_path) as conn:
+        rows = conn.execute(
+            "SELECT DISTINCT tag FROM exercise_tags WHERE kind = ? ORDER BY tag;",
+            (kind,),
+        ).fetchall()
+    return [row[0] for row in rows]
+
+
 def add_exercise(
     *,
     name: str,
@@ -1291,13 +3227,57 @@ def add_exercise(
     Missing goal ratings fall back to DEFAULT_GOAL_RATING.
     Equipment and muscle group inputs are normalized into atomic tags.
     """
+    # add_exercise_rows does the work; callers that only need the id use this.
+    rows = add_exercise_rows(
+        name=name,
+        short_description=short_description,
+        execution_instructions=execution_instructions,
+        required_equipment=required_equipment,
+        target_muscle_group=target_muscle_group,
+        goal=goal,
+        suitability_rating=suitability_rating,
+        goal_ratings=goal_ratings,
+        recommended_sets=recommended_sets,
+        recommended_reps_per_set=recommended_reps_per_set,
+        recommended_time_seconds=recommended_time_seconds,
+        icon=icon,
+        db_path=db_path,
+    )
+    return rows[0][0]
+
+
+def add_exercise_rows(
+    *,
+    name: str,
+    short_description: str,
+    execution_instructions: str = "",
+    required_equipment: Iterable[str] | str,
+    target_muscle_group: Iterable[str] | str,
+    goal: str,
+    suitability_rating: int,
+    goal_ratings: Optional[dict[str, int]] = None,
+    recommended_sets: Optional[int] = None,
+    recommended_reps_per_set: Optional[int] = None,
+    recommended_time_seconds: Optional[int] = None,
+    icon: str = "",
+    db_path: Path = DB_PATH,
+) -> list[tuple]:
+    """
+    Insert a new exercise like add_exercise and return its rows as query_exercises would.
+
+    The rows are built from the values just written, so callers holding a loaded
+    catalog can patch it in place without querying the whole catalog again.
+    """
     # Normalize inputs and insert both exercise and goal recommendation rows.
     if goal_ratings is None:
         goal_ratings = {}
     execution_instructions = (execution_instructions or "").strip()
     fallback_rating = suitability_rating if suitability_rating is not None else DEFAULT_GOAL_RATING
-    equipment_value = format_tag_list(normalize_equipment_list(required_equipment)) or str(required_equipment)
-    muscle_value = format_tag_list(normalize_muscle_group_list(target_muscle_group)) or str(target_muscle_group)
+    equipment_items = normalize_equipment_list(required_equipment)
+    muscle_items = normalize_muscle_group_list(target_muscle_group)
+    equipment_value = format_tag_list(equipment_items) or str(required_equipment)
+    muscle_value = format_tag_list(muscle_items) or str(target_muscle_group)
+    rows: list[tuple] = []
     with get_connection(db_path) as conn:
         cursor = conn.execute(
             """
@@ -1321,6 +3301,7 @@ def add_exercise(
             ),
         )
         exercise_id = cursor.lastrowid
+        _write_exercise_tags(conn, exercise_id, equipment_items, muscle_items)
         for goal_code in GOALS:
             rating = goal_ratings.get(goal_code)
             if rating is None:
@@ -1348,8 +3329,276 @@ def add_exercise(
                     time_value,
                 ),
             )
+            rows.append(
+                (
+                    exercise_id,
+                    name,
+                    icon,
+                    short_description,
+                    execution_instructions,
+                    equipment_value,
+                    muscle_value,
+                    goal_code,
+                    rating,
+                    sets_value,
+                    reps_value,
+                    time_value,
+                    list(equipment_items),
+                    list(muscle_items),
+                )
+            )
         conn.commit()
-        return exercise_id
+    # query_exercises orders an exercise's rows by goal code.
+    rows.sort(key=lambda row: row[7])
+    return rows
+
+
+_RECOMMENDATION_FIELDS = (
+    "suitability_rating",
+    "recommended_sets",
+    "recommended_reps_per_set",
+    "recommended_time_seconds",
+)
+
+
+def read_catalog_records(
+    path: Path, *, on_error: Optional[Callable[[int, str], None]] = None
+) -> Iterator[dict[str, Any]]:
+    """
+    Stream exercise records from a JSONL or CSV catalog file.
+
+    JSONL lines use the seed_sample_data shape with a "recommendations" mapping.
+    CSV rows use flat "<goal>_<field>" columns such as "weight_loss_suitability_rating".
+    A malformed JSONL line raises ValueError naming the line, or is passed to
+    on_error(line_number, message) and skipped when on_error is given.
+    """
+    # Read line by line so large catalogs never load fully into memory.
+    path = Path(path)
+    suffix = path.suffix.lower()
+    if suffix in {".jsonl", ".ndjson"}:
+        with path.open(encoding="utf-8") as handle:
+            for line_number, line in enumerate(handle, start=1):
+                if not line.strip():
+                    continue
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError as exc:
+                    message = f"Line {line_number}: invalid JSON: {exc.msg}"
+                    if on_error is None:
+                        raise ValueError(message) from exc
+                    on_error(line_number, message)
+                    continue
+                yield record
+    elif suffix == ".csv":
+        with path.open(encoding="utf-8", newline="") as handle:
+            for row in csv.DictReader(handle):
+                recommendations: dict[str, dict[str, Any]] = {}
+                for goal_code in GOALS:
+                    values = {
+                        field: row.pop(f"{goal_code}_{field}", None) or None for field in _RECOMMENDATION_FIELDS
+                    }
+                    if any(value is not None for value in values.values()):
+                        recommendations[goal_code] = values
+                record: dict[str, Any] = dict(row)
+                record["recommendations"] = recommendations
+                yield record
+    else:
+        raise ValueError(f"Unsupported catalog format: {path.suffix or path.name}")
+
+
+def _optional_positive_int(value: Any, field: str) -> Optional[int]:
+    """Coerce an optional catalog value into a positive integer."""
+    # CSV values arrive as strings; blank means not set.
+    if value is None or value == "":
+        return None
+    parsed = int(value)
+    if parsed <= 0:
+        raise ValueError(f"{field} must be positive.")
+    return parsed
+
+
+def _prepare_catalog_record(
+    record: dict[str, Any],
+) -> tuple[tuple[object, ...], list[str], list[str], dict[str, tuple[object, ...]]]:
+    """Validate one catalog record and return exercise values, tags and per-goal rows."""
+    # Tag strings repeat heavily across a catalog; the shared normalizers memoize them.
+    name = str(record.get("name") or "").strip()
+    description = str(record.get("short_description") or "").strip()
+    raw_equipment = record.get("required_equipment") or ""
+    raw_muscles = record.get("target_muscle_group") or ""
+    if not name:
+        raise ValueError("Exercise name is required.")
+    if not description:
+        raise ValueError("Short description is required.")
+    equipment_items = EQUIPMENT_NORMALIZER.normalize(raw_equipment)
+    muscle_items = MUSCLE_NORMALIZER.normalize(raw_muscles)
+    if not equipment_items or not muscle_items:
+        raise ValueError("Equipment and target muscle group are required.")
+
+    recommendations: dict[str, tuple[object, ...]] = {}
+    for goal_code, values in (record.get("recommendations") or {}).items():
+        if goal_code not in GOALS:
+            raise ValueError(f"Unknown goal: {goal_code}")
+        rating = _optional_positive_int(values.get("suitability_rating"), "suitability_rating")
+        if rating is None or rating > 10:
+            raise ValueError(f"Suitability rating for {goal_code} must be 1-10.")
+        recommendations[goal_code] = (
+            goal_code,
+            rating,
+            _optional_positive_int(values.get("recommended_sets"), "recommended_sets"),
+            _optional_positive_int(values.get("recommended_reps_per_set"), "recommended_reps_per_set"),
+            _optional_positive_int(values.get("recommended_time_seconds"), "recommended_time_seconds"),
+        )
+    exercise_values = (
+        name,
+        str(record.get("icon") or ""),
+        description,
+        str(record.get("execution_instructions") or "").strip(),
+        format_tag_list(equipment_items),
+        format_tag_list(muscle_items),
+    )
+    return exercise_values, equipment_items, muscle_items, recommendations
+
+
+def _upsert_catalog_batch(
+    conn: sqlite3.Connection,
+    batch: dict[str, tuple[tuple[object, ...], list[str], list[str], dict[str, tuple[object, ...]]]],
+) -> tuple[int, int]:
+    """Upsert one batch of prepared catalog records and return (inserted, updated)."""
+    # Existing exercises are matched case-insensitively and keep their stored spelling.
+    existing = _resolve_exercise_ids(conn, batch.keys())
+    exercise_rows = []
+    for key, (values, _, _, _) in batch.items():
+        name = existing[key][1] if key in existing else values[0]
+        exercise_rows.append((name, *values[1:]))
+    conn.executemany(
+        """
+        INSERT INTO exercises (
+            name, icon, short_description, execution_instructions, required_equipment, target_muscle_group
+        )
+        VALUES (?, ?, ?, ?, ?, ?)
+        ON CONFLICT (name) DO UPDATE SET
+            icon = excluded.icon,
+            short_description = excluded.short_description,
+            execution_instructions = excluded.execution_instructions,
+            required_equipment = excluded.required_equipment,
+            target_muscle_group = excluded.target_muscle_group;
+        """,
+        exercise_rows,
+    )
+    ids = _resolve_exercise_ids(conn, batch.keys())
+    batch_ids = [ids[key][0] for key in batch]
+    for start in range(0, len(batch_ids), _SQL_IN_CHUNK):
+        chunk_ids = batch_ids[start : start + _SQL_IN_CHUNK]
+        placeholders = ", ".join("?" for _ in chunk_ids)
+        conn.execute(f"DELETE FROM exercise_tags WHERE exercise_id IN ({placeholders});", chunk_ids)
+    tag_rows: list[tuple[int, str, str, int]] = []
+    recommendation_rows: list[tuple[object, ...]] = []
+    default_rows: list[tuple[object, ...]] = []
+    for key, (_, equipment_items, muscle_items, recommendations) in batch.items():
+        exercise_id = ids[key][0]
+        tag_rows.extend((exercise_id, "equipment", tag, position) for position, tag in enumerate(equipment_items))
+        tag_rows.extend((exercise_id, "muscle", tag, position) for position, tag in enumerate(muscle_items))
+        for goal_code in GOALS:
+            if goal_code in recommendations:
+                recommendation_rows.append((exercise_id, *recommendations[goal_code]))
+            else:
+                default_rows.append((exercise_id, goal_code, DEFAULT_GOAL_RATING))
+    conn.executemany(
+        "INSERT OR IGNORE INTO exercise_tags (exercise_id, kind, tag, position) VALUES (?, ?, ?, ?);",
+        tag_rows,
+    )
+    conn.executemany(
+        """
+        INSERT INTO goal_recommendations (
+            exercise_id,
+            goal,
+            suitability_rating,
+            recommended_sets,
+            recommended_reps_per_set,
+            recommended_time_seconds
+        )
+        VALUES (?, ?, ?, ?, ?, ?)
+        ON CONFLICT (exercise_id, goal) DO UPDATE SET
+            suitability_rating = excluded.suitability_rating,
+            recommended_sets = excluded.recommended_sets,
+            recommended_reps_per_set = excluded.recommended_reps_per_set,
+            recommended_time_seconds = excluded.recommended_time_seconds;
+        """,
+        recommendation_rows,
+    )
+    conn.executemany(
+        "INSERT OR IGNORE INTO goal_recommendations (exercise_id, goal, suitability_rating) VALUES (?, ?, ?);",
+        default_rows,
+    )
+    return len(batch) - len(existing), len(existing)
+
+
+def import_exercise_catalog(
+    source: Path | Iterable[dict[str, Any]],
+    *,
+    batch_size: int = 500,
+    db_path: Path = DB_PATH,
+) -> dict[str, Any]:
+    """
+    Upsert a catalog of exercises and goal recommendations in large batches.
+
+    source is a JSONL/CSV path (see read_catalog_records) or an iterable of records.
+    Goals missing from a record keep existing values, or DEFAULT_GOAL_RATING for new
+    exercises. Returns counts for "inserted", "updated" and "errors" ((index, message)
+    tuples; malformed JSONL lines count as records and name their line) plus
+    "elapsed_seconds" and "records_per_second".
+    """
+    # Validate while streaming, then write each batch in one transaction.
+    if batch_size <= 0:
+        raise ValueError("Batch size must be positive.")
+    started = time.perf_counter()
+    report: dict[str, Any] = {"inserted": 0, "updated": 0, "errors": [], "processed": 0}
+
+    def skip_line(_line_number: int, message: str) -> None:
+        """Report a malformed catalog line as a failed record."""
+        # The message already carries the line number.
+        report["errors"].append((report["processed"], message))
+        report["processed"] += 1
+
+    records = read_catalog_records(source, on_error=skip_line) if isinstance(source, (str, Path)) else source
+    conn = get_connection(db_path)
+    if conn.in_transaction:
+        conn.commit()
+
+    def flush(batch: dict[str, tuple[tuple[object, ...], list[str], list[str], dict[str, tuple[object, ...]]]]) -> None:
+        """Write one batch atomically and accumulate its counts."""
+        # A failing batch is rolled back and its error propagates; earlier batches stay committed.
+        conn.execute("BEGIN IMMEDIATE;")
+        try:
+            inserted, updated = _upsert_catalog_batch(conn, batch)
+        except BaseException:
+            conn.rollback()
+            raise
+        conn.commit()
+        report["inserted"] += inserted
+        report["updated"] += updated
+
+    batch: dict[str, tuple[tuple[object, ...], list[str], list[str], dict[str, tuple[object, ...]]]] = {}
+    for record in records:
+        index = report["processed"]
+        report["processed"] += 1
+        try:
+            prepared = _prepare_catalog_record(record)
+        except (TypeError, ValueError, AttributeError) as exc:
+            report["errors"].append((index, str(exc)))
+            continue
+        # Later duplicates in the same batch replace earlier ones.
+        batch[_name_key(prepared[0][0])] = prepared
+        if len(batch) >= batch_size:
+            flush(batch)
+            batch = {}
+    if batch:
+        flush(batch)
+    elapsed = time.perf_counter() - started
+    report["elapsed_seconds"] = round(elapsed, 4)
+    report["records_per_second"] = round(report["processed"] / elapsed, 1) if elapsed > 0 else 0.0
+    return report
 
 
 def add_user(
@@ -1404,7 +3653,70 @@ def update_user_profile(
         conn.commit()
 
 
-def log_workout(
+# Bound parameters per IN (...) list; SQLite builds before 3.32 cap a statement at 999 variables.
+_SQL_IN_CHUNK = 500
+
+
+def _name_key(name: str) -> str:
+    """Return the case-insensitive lookup key for an exercise name, matching SQLite's lower()."""
+    # SQLite's built-in lower() only folds ASCII letters, so Python must do the same.
+    return name.strip().translate(_ASCII_LOWER)
+
+
+def _resolve_exercise_ids(conn: sqlite3.Connection, names: Iterable[str]) -> dict[str, tuple[int, str]]:
+    """Map lower-cased exercise names to (exercise_id, catalog name) for names found in the catalog."""
+    # One indexed lookup per chunk of names instead of a query per exercise.
+    keys = sorted({_name_key(name) for name in names if name and name.strip()})
+    resolved: dict[str, tuple[int, str]] = {}
+    for start in range(0, len(keys), _SQL_IN_CHUNK):
+        chunk = keys[start : start + _SQL_IN_CHUNK]
+        placeholders = ", ".join("?" for _ in chunk)
+        rows = conn.execute(
+            f"SELECT lower(name), id, name FROM exercises WHERE lower(name) IN ({placeholders});",
+            chunk,
+        ).fetchall()
+        resolved.update((key, (exercise_id, name)) for key, exercise_id, name in rows)
+    return resolved
+
+
+def _workout_exercise_rows(
+    conn: sqlite3.Connection,
+    workout_id: int,
+    attempts: Sequence[Tuple[str, str]],
+    catalog: Optional[dict[str, tuple[int, str]]] = None,
+) -> list[tuple[int, Optional[int], str, str]]:
+    """Build workout_exercises rows, linking catalog exercises by id and keeping the entered names as-is."""
+    # Rollups and stats group by exercise_id, so the user's spelling never needs rewriting.
+    if catalog is None:
+        catalog = _resolve_exercise_ids(conn, [name for name, _ in attempts])
+    rows: list[tuple[int, Optional[int], str, str]] = []
+    for name, status in attempts:
+        match = catalog.get(_name_key(name))
+        if match:
+            rows.append((workout_id, match[0], name, status))
+        else:
+            rows.append((workout_id, None, name, status))
+    return rows
+
+
+_WORKOUT_INSERT_SQL = """
+    INSERT INTO workouts (
+        user_id,
+        performed_at,
+        performed_day,
+        duration_minutes,
+        goal,
+        duration_seconds,
+        total_sets_completed
+    )
+    VALUES (?, ?, ?, ?, ?, ?, ?);
+"""
+_WORKOUT_EXERCISE_INSERT_SQL = (
+    "INSERT INTO workout_exercises (workout_id, exercise_id, exercise_name, status) VALUES (?, ?, ?, ?);"
+)
+
+
+def _prepare_workout(
     *,
     user_id: int,
     performed_at: str,
@@ -1414,18 +3726,14 @@ def log_workout(
     duration_seconds: Optional[int] = None,
     total_sets_completed: Optional[int] = None,
     exercise_statuses: Optional[Iterable[Tuple[str, str]]] = None,
-    db_path: Path = DB_PATH,
-) -> int:
-    """
-    Persist a completed workout for a user and return the workout id.
-
-    When exercise_statuses is provided, it must contain tuples of (name, status)
-    where status is either "completed" or "skipped". If not provided, all
-    exercises are stored as completed.
-    """
-    # Validate inputs and write workout plus exercise rows.
+) -> tuple[tuple[object, ...], list[Tuple[str, str]]]:
+    """Validate workout inputs and return (workouts row values, normalized exercise statuses)."""
+    # Shared by log_workout and log_workouts_bulk so both enforce the same rules.
     if duration_minutes <= 0:
         raise ValueError("Duration must be positive.")
+    performed_day = day_number(performed_at)
+    if performed_day is None:
+        raise ValueError("Workout date must be in YYYY-MM-DD format.")
     cleaned_exercises = [ex.strip() for ex in exercises if ex.strip()]
     if not cleaned_exercises:
         raise ValueError("At least one exercise is required.")
@@ -1449,31 +3757,467 @@ def log_workout(
     sets_completed = total_sets_completed if total_sets_completed is not None else 0
     if sets_completed < 0:
         raise ValueError("Total sets completed cannot be negative.")
+    values = (user_id, performed_at, performed_day, duration_minutes, goal, duration_seconds, sets_completed)
+    return values, normalized_statuses
+
+
+def log_workout(
+    *,
+    user_id: int,
+    performed_at: str,
+    duration_minutes: int,
+    exercises: Sequence[str],
+    goal: Optional[str] = None,
+    duration_seconds: Optional[int] = None,
+    total_sets_completed: Optional[int] = None,
+    exercise_statuses: Optional[Iterable[Tuple[str, str]]] = None,
+    db_path: Path = DB_PATH,
+) -> int:
+    """
+    Persist a completed workout for a user and return the workout id.
 
+    When exercise_statuses is provided, it must contain tuples of (name, status)
+    where status is either "completed" or "skipped". If not provided, all
+    exercises are stored as completed.
+    """
+    # Validate inputs and write workout plus exercise rows.
+    values, normalized_statuses = _prepare_workout(
+        user_id=user_id,
+        performed_at=performed_at,
+        duration_minutes=duration_minutes,
+        exercises=exercises,
+        goal=goal,
+        duration_seconds=duration_seconds,
+        total_sets_completed=total_sets_completed,
+        exercise_statuses=exercise_statuses,
+    )
     with get_connection(db_path) as conn:
-        cursor = conn.execute(
-            """
-            INSERT INTO workouts (
-                user_id,
-                performed_at,
-                duration_minutes,
-                goal,
-                duration_seconds,
-                total_sets_completed
-            )
-            VALUES (?, ?, ?, ?, ?, ?);
-            """,
-            (user_id, performed_at, duration_minutes, goal, duration_seconds, sets_completed),
-        )
+        cursor = conn.execute(_WORKOUT_INSERT_SQL, values)
         workout_id = cursor.lastrowid
         conn.executemany(
-            "INSERT INTO workout_exercises (workout_id, exercise_name, status) VALUES (?, ?, ?);",
-            [(workout_id, name, status) for name, status in normalized_statuses],
+            _WORKOUT_EXERCISE_INSERT_SQL,
+            _workout_exercise_rows(conn, workout_id, normalized_statuses),
         )
         conn.commit()
         return workout_id
 
 
+def _insert_workout_chunk(
+    conn: sqlite3.Connection,
+    chunk: list[tuple[int, tuple[object, ...], list[Tuple[str, str]]]],
+) -> list[int]:
+    """Insert validated workouts with two executemany calls and return their ids."""
+    # Ids are assigned up front; BEGIN IMMEDIATE holds the write lock so they cannot collide.
+    next_id = conn.execute("SELECT COALESCE(MAX(id), 0) + 1 FROM workouts;").fetchone()[0]
+    sequence_row = conn.execute("SELECT seq FROM sqlite_sequence WHERE name = 'workouts';").fetchone()
+    if sequence_row and sequence_row[0] >= next_id:
+        next_id = sequence_row[0] + 1
+    workout_ids = list(range(next_id, next_id + len(chunk)))
+    conn.executemany(
+        """
+        INSERT INTO workouts (
+            id,
+            user_id,
+            performed_at,
+            performed_day,
+            duration_minutes,
+            goal,
+            duration_seconds,
+            total_sets_completed
+        )
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?);
+        """,
+        [(workout_id, *values) for workout_id, (_, values, _) in zip(workout_ids, chunk)],
+    )
+    catalog = _resolve_exercise_ids(conn, (name for _, _, statuses in chunk for name, _ in statuses))
+    exercise_rows: list[tuple[int, Optional[int], str, str]] = []
+    for workout_id, (_, _, statuses) in zip(workout_ids, chunk):
+        exercise_rows.extend(_workout_exercise_rows(conn, workout_id, statuses, catalog))
+    conn.executemany(_WORKOUT_EXERCISE_INSERT_SQL, exercise_rows)
+    return workout_ids
+
+
+def log_workouts_bulk(
+    workouts: Iterable[dict[str, Any]],
+    *,
+    chunk_size: int = 1000,
+    collect_ids: bool = True,
+    db_path: Path = DB_PATH,
+) -> dict[str, Any]:
+    """
+    Import many workouts in chunked transactions and report per-row outcomes.
+
+    Each item takes log_workout's keyword arguments (without db_path) and is
+    validated as it streams in, so generators of any length are consumed with
+    memory bounded by chunk_size. Returns a dict with "inserted" (count),
+    "inserted_ids" (empty when collect_ids is False) and "errors", a list of
+    (row_index, message) tuples for rows that were skipped.
+    """
+    # Buffer one chunk of validated rows, then write it in a single transaction.
+    if chunk_size <= 0:
+        raise ValueError("Chunk size must be positive.")
+    result: dict[str, Any] = {"inserted": 0, "inserted_ids": [], "errors": []}
+    conn = get_connection(db_path)
+    known_users: set[int] = set()
+
+    def flush(chunk: list[tuple[int, tuple[object, ...], list[Tuple[str, str]]]]) -> None:
+        """Write one chunk, falling back to row-by-row inserts to isolate failures."""
+        # Unknown users are reported per row instead of failing the whole chunk.
+        missing = {values[0] for _, values, _ in chunk} - known_users
+        if missing:
+            placeholders = ", ".join("?" for _ in missing)
+            known_users.update(
+                row[0] for row in conn.execute(f"SELECT id FROM users WHERE id IN ({placeholders});", list(missing))
+            )
+        valid: list[tuple[int, tuple[object, ...], list[Tuple[str, str]]]] = []
+        for item in chunk:
+            if item[1][0] in known_users:
+                valid.append(item)
+            else:
+                result["errors"].append((item[0], f"Unknown user id: {item[1][0]}"))
+        if not valid:
+            return
+        conn.execute("BEGIN IMMEDIATE;")
+        try:
+            workout_ids = _insert_workout_chunk(conn, valid)
+        except sqlite3.DatabaseError:
+            conn.rollback()
+            workout_ids = []
+            for item in valid:
+                conn.execute("BEGIN IMMEDIATE;")
+                try:
+                    workout_ids.extend(_insert_workout_chunk(conn, [item]))
+                except sqlite3.DatabaseError as exc:
+                    conn.rollback()
+                    result["errors"].append((item[0], str(exc)))
+                    continue
+                except BaseException:
+                    conn.rollback()
+                    raise
+                conn.commit()
+        except BaseException:
+            # Anything else aborts the import, but never leaves the pooled connection mid-transaction.
+            conn.rollback()
+            raise
+        else:
+            conn.commit()
+        result["inserted"] += len(workout_ids)
+        if collect_ids:
+            result["inserted_ids"].extend(workout_ids)
+
+    if conn.in_transaction:
+        conn.commit()
+    chunk: list[tuple[int, tuple[object, ...], list[Tuple[str, str]]]] = []
+    for index, workout in enumerate(workouts):
+        try:
+            values, statuses = _prepare_workout(**workout)
+        except (TypeError, ValueError, AttributeError) as exc:
+            result["errors"].append((index, str(exc)))
+            continue
+        chunk.append((index, values, statuses))
+        if len(chunk) >= chunk_size:
+            flush(chunk)
+            chunk = []
+    if chunk:
+        flush(chunk)
+    return result
+
+
+def session_journal_dir(db_path: Path = DB_PATH) -> Path:
+    """Return the directory holding this host's live session journals for a database file."""
+    # Kept beside the database so each database replays only its own sessions, and split
+    # per host so a kiosk sharing the database never replays another kiosk's live session.
+    path = Path(db_path)
+    host = re.sub(r"[^A-Za-z0-9._-]", "_", socket.gethostname()) or "localhost"
+    return path.with_name(f"{path.stem}_sessions") / host
+
+
+# Journals still being written by this process; replay must not flush them underneath the writer.
+_ACTIVE_JOURNALS: set[str] = set()
+# Flush errors that retrying cannot fix; such journals are set aside instead of replayed again.
+SESSION_JOURNAL_REJECT_ERRORS: tuple[type[Exception], ...] = (ValueError, KeyError, sqlite3.IntegrityError)
+
+
+class SessionJournal:
+    """
+    Append-only JSONL journal for one live workout session.
+
+    Every record is flushed and fsynced before the call returns, so a session survives
+    a failed database write or the process dying and is replayed by initialize_database.
+    Sessions the user abandons are discarded instead.
+    """
+    # One "start" record, then "set" and "exercise" records, then an optional "end" record.
+    __slots__ = ("path", "session_id", "_handle")
+
+    def __init__(self, path: Path, session_id: str) -> None:
+        """Open the journal file for appending."""
+        # Callers normally use SessionJournal.start instead.
+        self.path = Path(path)
+        self.session_id = session_id
+        self._handle = self.path.open("a", encoding="utf-8")
+        _ACTIVE_JOURNALS.add(str(self.path.resolve()))
+
+    @classmethod
+    def start(
+        cls,
+        user_id: int,
+        *,
+        started_at: str,
+        goal: Optional[str] = None,
+        db_path: Path = DB_PATH,
+    ) -> "SessionJournal":
+        """Create a journal for a new session and write its start record."""
+        # The random suffix keeps ids unique when sessions start within the same second.
+        directory = session_journal_dir(db_path)
+        directory.mkdir(parents=True, exist_ok=True)
+        session_id = f"{re.sub(r'[^0-9]', '', started_at)}-{uuid.uuid4().hex[:8]}"
+        journal = cls(directory / f"{session_id}.jsonl", session_id)
+        journal._append(
+            {"type": "start", "session_id": session_id, "user_id": user_id, "goal": goal, "started_at": started_at}
+        )
+        return journal
+
+    def _append(self, record: dict[str, Any]) -> None:
+        """Write one record durably."""
+        # fsync per record: live sessions write a handful of records per minute.
+        self._handle.write(json.dumps(record, separators=(",", ":")) + "\n")
+        self._handle.flush()
+        os.fsync(self._handle.fileno())
+
+    def record_set(self, exercise: str) -> None:
+        """Record one completed set of an exercise."""
+        # Timestamps let replay estimate the duration of an unfinished session.
+        self._append({"type": "set", "exercise": exercise, "at": datetime.now().isoformat(timespec="seconds")})
+
+    def record_exercise(self, name: str, status: str) -> None:
+        """Record an exercise as completed or skipped."""
+        # Mirrors the attempt log kept by the live screen.
+        self._append(
+            {"type": "exercise", "name": name, "status": status, "at": datetime.now().isoformat(timespec="seconds")}
+        )
+
+    def finish(
+        self,
+        *,
+        performed_at: str,
+        duration_seconds: int,
+        total_sets_completed: int,
+        attempts: Sequence[Tuple[str, str]],
+    ) -> Path:
+        """Write the end record with the final attempt list, close the file and return its path."""
+        # The end record is authoritative; earlier records only matter for unfinished sessions.
+        self._append(
+            {
+                "type": "end",
+                "performed_at": performed_at,
+                "duration_seconds": duration_seconds,
+                "total_sets_completed": total_sets_completed,
+                "attempts": [list(attempt) for attempt in attempts],
+            }
+        )
+        self.close()
+        return self.path
+
+    def close(self) -> None:
+        """Close the file without finishing or deleting it."""
+        # Safe to call more than once.
+        if not self._handle.closed:
+            self._handle.close()
+        _ACTIVE_JOURNALS.discard(str(self.path.resolve()))
+
+    def discard(self) -> bool:
+        """Close and delete the journal of an abandoned session; return False if replay could still log it."""
+        # A file that cannot be deleted is set aside instead, since replay would log it as a workout.
+        self.close()
+        try:
+            self.path.unlink(missing_ok=True)
+        except OSError:
+            try:
+                set_aside_session_journal(self.path)
+            except OSError:
+                return False
+        return True
+
+
+def read_session_journal(path: Path) -> Optional[dict[str, Any]]:
+    """
+    Rebuild a workout from a session journal.
+
+    Returns None for journals without a start record. A torn final line from a crash
+    is ignored; unfinished sessions use the start time and the last record's timestamp.
+    """
+    # Exercises with journaled sets but no exercise record are stored as skipped, as when ending early.
+    lines = Path(path).read_text(encoding="utf-8").splitlines()
+    records: list[dict[str, Any]] = []
+    for index, line in enumerate(lines):
+        if not line.strip():
+            continue
+        try:
+            records.append(json.loads(line))
+        except json.JSONDecodeError:
+            if index == len(lines) - 1:
+                break
+            raise ValueError(f"Corrupt session journal line {index + 1}: {path}") from None
+    if not records or records[0].get("type") != "start":
+        return None
+    start = records[0]
+    session = {
+        "session_id": start["session_id"],
+        "user_id": start["user_id"],
+        "goal": start.get("goal"),
+        "finished": False,
+    }
+    end = next((record for record in records if record.get("type") == "end"), None)
+    if end is not None:
+        session.update(
+            finished=True,
+            performed_at=end["performed_at"],
+            duration_seconds=end["duration_seconds"],
+            total_sets_completed=end["total_sets_completed"],
+            attempts=[(name, status) for name, status in end["attempts"]],
+        )
+        return session
+
+    attempts = [(record["name"], record["status"]) for record in records if record.get("type") == "exercise"]
+    set_exercises = [record["exercise"] for record in records if record.get("type") == "set"]
+    attempted = {name for name, _ in attempts}
+    for name in dict.fromkeys(set_exercises):
+        if name not in attempted:
+            attempts.append((name, "skipped"))
+    started = datetime.fromisoformat(start["started_at"])
+    last_at = max((datetime.fromisoformat(record["at"]) for record in records if "at" in record), default=started)
+    session.update(
+        performed_at=start["started_at"],
+        duration_seconds=max(1, int((last_at - started).total_seconds())),
+        total_sets_completed=len(set_exercises),
+        attempts=attempts,
+    )
+    return session
+
+
+def flush_session_journal(path: Path, *, db_path: Path = DB_PATH) -> Optional[int]:
+    """
+    Write a journaled session into workouts and delete the journal.
+
+    Returns the workout id, or None when the journal held no attempts. Journals without
+    an end record are logged as reconstructed by read_session_journal. A marker row
+    committed with the workout makes a repeated flush of the same journal a no-op.
+    """
+    # Order: commit workout + marker, unlink the file, then drop the marker.
+    path = Path(path)
+    session = read_session_journal(path)
+    if session is None or not session["attempts"]:
+        path.unlink(missing_ok=True)
+        return None
+    marker = f"session_journal:{session['session_id']}"
+    conn = get_connection(db_path)
+    if conn.in_transaction:
+        conn.commit()
+    stored = get_meta(conn, marker)
+    if stored is None:
+        duration_seconds = session["duration_seconds"]
+        values, normalized_statuses = _prepare_workout(
+            user_id=session["user_id"],
+            performed_at=session["performed_at"],
+            duration_minutes=max(1, (duration_seconds + 59) // 60),
+            exercises=[name for name, _ in session["attempts"]],
+            goal=session["goal"] or "",
+            duration_seconds=duration_seconds,
+            total_sets_completed=session["total_sets_completed"],
+            exercise_statuses=session["attempts"],
+        )
+        conn.execute("BEGIN IMMEDIATE;")
+        try:
+            workout_id = conn.execute(_WORKOUT_INSERT_SQL, values).lastrowid
+            conn.executemany(
+                _WORKOUT_EXERCISE_INSERT_SQL,
+                _workout_exercise_rows(conn, workout_id, normalized_statuses),
+            )
+            set_meta(conn, marker, workout_id)
+            conn.commit()
+        except BaseException:
+            conn.rollback()
+            raise
+    else:
+        workout_id = int(stored)
+    path.unlink(missing_ok=True)
+    conn.execute("DELETE FROM app_meta WHERE key = ?;", (marker,))
+    conn.commit()
+    return workout_id
+
+
+def set_aside_session_journal(path: Path) -> Path:
+    """Rename a journal that must not be replayed to *.failed and return the new path."""
+    # The file is kept for inspection; replay only globs *.jsonl.
+    target = Path(path).with_suffix(".failed")
+    Path(path).rename(target)
+    return target
+
+
+def replay_session_journals(db_path: Path = DB_PATH) -> list[int]:
+    """
+    Flush every session journal this host left for db_path and return the new workout ids.
+
+    Journals cut short by a crash are logged from their set and exercise records.
+    Corrupt journals and ones that fail validation are set aside as *.failed so they
+    are kept but never retried.
+    """
+    # Journals still open in this process belong to a running session and are skipped.
+    directory = session_journal_dir(db_path)
+    if not directory.is_dir():
+        return []
+    workout_ids: list[int] = []
+    for path in sorted(directory.glob("*.jsonl")):
+        if str(path.resolve()) in _ACTIVE_JOURNALS:
+            continue
+        try:
+            workout_id = flush_session_journal(path, db_path=db_path)
+        except SESSION_JOURNAL_REJECT_ERRORS:
+            set_aside_session_journal(path)
+            continue
+        if workout_id is not None:
+            workout_ids.append(workout_id)
+    return workout_ids
+
+
+# One row per workout: attempts are packed into a JSON array of [name, status] pairs
+# in insertion order, so callers never see the workout x exercise fan-out.
+_HISTORY_COLUMNS_SQL = """
+    w.id,
+    w.performed_at,
+    w.duration_minutes,
+    w.goal,
+    w.duration_seconds,
+    w.total_sets_completed,
+    (
+        SELECT json_group_array(json_array(attempt.exercise_name, attempt.status))
+        FROM (
+            SELECT we.exercise_name, lower(COALESCE(NULLIF(we.status, ''), 'completed')) AS status
+            FROM workout_exercises we
+            WHERE we.workout_id = w.id AND we.exercise_name <> ''
+            ORDER BY we.id
+        ) AS attempt
+    ) AS attempts
+"""
+
+
+def _history_entry(row: tuple) -> dict[str, object]:
+    """Build a history entry dict from a row selected with _HISTORY_COLUMNS_SQL."""
+    # Decode the packed attempts once and derive both exercise lists from them.
+    workout_id, performed_at, duration_minutes, goal, duration_seconds, total_sets_completed, attempts = row
+    pairs = json.loads(attempts) if attempts else []
+    return {
+        "workout_id": workout_id,
+        "performed_at": performed_at,
+        "duration_minutes": duration_minutes,
+        "goal": goal,
+        "duration_seconds": duration_seconds,
+        "total_sets_completed": total_sets_completed,
+        "exercises": [name for name, _ in pairs],
+        "exercise_attempts": [{"name": name, "status": status} for name, status in pairs],
+    }
+
+
 def fetch_workout_history(
     user_id: int,
     *,
@@ -1484,68 +4228,124 @@ def fetch_workout_history(
     """
     Return workouts for a user with exercises aggregated per session.
 
-    Dates are compared using SQLite's date() to respect YYYY-MM-DD strings.
-    """
-    # Build a query with optional date filters, then group by workout id.
-    query = """
-        SELECT
-            w.id,
-            w.performed_at,
-            w.duration_minutes,
-            w.goal,
-            w.duration_seconds,
-            w.total_sets_completed,
-            we.exercise_name,
-            we.status
-        FROM workouts w
-        LEFT JOIN workout_exercises we ON w.id = we.workout_id
-        WHERE w.user_id = ?
+    Date bounds are inclusive YYYY-MM-DD strings compared on the indexed performed_day column.
+    Rows are served from the query cache until the user or history tables change.
     """
+    # SQLite aggregates the attempts, so each returned row is already one workout.
+    query = f"SELECT {_HISTORY_COLUMNS_SQL} FROM workouts w WHERE w.user_id = ?"
     params: list[object] = [user_id]
-    if start_date:
-        query += " AND date(w.performed_at) >= date(?)"
-        params.append(start_date)
-    if end_date:
-        query += " AND date(w.performed_at) <= date(?)"
-        params.append(end_date)
+    day_filters, day_params = _day_range_filters("w.performed_day", start_date, end_date)
+    for day_filter in day_filters:
+        query += f" AND {day_filter}"
+    params.extend(day_params)
     query += " ORDER BY w.performed_at DESC, w.id DESC;"
 
-    with get_connection(db_path) as conn:
-        rows = conn.execute(query, params).fetchall()
+    rows = _cached_query(
+        db_path,
+        ("history", user_id, start_date or None, end_date or None),
+        lambda conn: tuple(conn.execute(query, params).fetchall()),
+    )
+    # Entries are rebuilt from the cached rows so callers may mutate them freely.
+    return [_history_entry(row) for row in rows]
 
-    grouped: dict[int, dict[str, object]] = {}
-    for (
-        workout_id,
-        performed_at,
-        duration_minutes,
-        goal,
-        duration_seconds,
-        total_sets_completed,
-        exercise_name,
-        status,
-    ) in rows:
-        entry = grouped.setdefault(
-            workout_id,
-            {
-                "workout_id": workout_id,
-                "performed_at": performed_at,
-                "duration_minutes": duration_minutes,
-                "goal": goal,
-                "duration_seconds": duration_seconds,
-                "total_sets_completed": total_sets_completed,
-                "exercises": [],
-                "exercise_attempts": [],
-            },
+
+def _encode_history_cursor(performed_at: str, workout_id: int) -> str:
+    """Encode a (performed_at, id) keyset position as an opaque token."""
+    # URL-safe base64 keeps the token printable and free of separators.
+    payload = json.dumps([performed_at, workout_id], separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(payload).decode("ascii")
+
+
+def _decode_history_cursor(cursor: str) -> tuple[str, int]:
+    """Decode a history continuation token into (performed_at, id)."""
+    # Reject tampered or truncated tokens with a ValueError.
+    try:
+        performed_at, workout_id = json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+    except (ValueError, TypeError, UnicodeError) as exc:
+        raise ValueError("Invalid history cursor.") from exc
+    if not isinstance(performed_at, str) or not isinstance(workout_id, int):
+        raise ValueError("Invalid history cursor.")
+    return performed_at, workout_id
+
+
+def fetch_workout_history_page(
+    user_id: int,
+    *,
+    cursor: Optional[str] = None,
+    page_size: int = 25,
+    start_date: Optional[str] = None,
+    end_date: Optional[str] = None,
+    db_path: Path = DB_PATH,
+) -> tuple[list[dict[str, object]], Optional[str]]:
+    """
+    Return one page of workouts plus a continuation token for the next page.
+
+    Pages are ordered newest first and keyed on (performed_at, id), so each page
+    seeks into the index instead of skipping rows. The token is None on the last page.
+    Entries have the same shape as fetch_workout_history and pages are cached the same way.
+    """
+    # Fetch one extra row to learn whether another page follows.
+    if page_size <= 0:
+        raise ValueError("Page size must be positive.")
+    day_filters, day_params = _day_range_filters("w.performed_day", start_date, end_date)
+    filters = ["w.user_id = ?", *day_filters]
+    params: list[object] = [user_id, *day_params]
+    if cursor:
+        after_performed_at, after_id = _decode_history_cursor(cursor)
+        filters.append("(w.performed_at, w.id) < (?, ?)")
+        params.extend([after_performed_at, after_id])
+    filter_clause = " AND ".join(filters)
+
+    rows = _cached_query(
+        db_path,
+        ("history_page", user_id, start_date or None, end_date or None, cursor or None, page_size),
+        lambda conn: tuple(
+            conn.execute(
+                f"""
+                SELECT {_HISTORY_COLUMNS_SQL}
+                FROM workouts w
+                WHERE {filter_clause}
+                ORDER BY w.performed_at DESC, w.id DESC
+                LIMIT ?;
+                """,
+                (*params, page_size + 1),
+            ).fetchall()
+        ),
+    )
+    has_more = len(rows) > page_size
+    rows = rows[:page_size]
+    entries = [_history_entry(row) for row in rows]
+
+    next_cursor = None
+    if has_more and rows:
+        last_id, last_performed_at = rows[-1][0], rows[-1][1]
+        next_cursor = _encode_history_cursor(last_performed_at, last_id)
+    return entries, next_cursor
+
+
+def iter_workout_history(
+    user_id: int,
+    *,
+    cursor: Optional[str] = None,
+    page_size: int = 100,
+    start_date: Optional[str] = None,
+    end_date: Optional[str] = None,
+    db_path: Path = DB_PATH,
+) -> Iterator[dict[str, object]]:
+    """Yield workouts newest first, fetching one keyset page at a time as the caller iterates."""
+    # Only one page is held in memory; stop when the continuation token runs out.
+    while True:
+        entries, cursor = fetch_workout_history_page(
+            user_id,
+            cursor=cursor,
+            page_size=page_size,
+            start_date=start_date,
+            end_date=end_date,
+            db_path=db_path,
         )
-        if exercise_name:
-            entry["exercises"].append(exercise_name)
-            entry["exercise_attempts"].append(
-                {
-                    "name": exercise_name,
-                    "status": (status or "completed").lower(),
-                }
-            )
-    return list(grouped.values())
+        yield from entries
+        if not cursor:
+            return
 
 
 def fetch_workout_stats(
@@ -1555,7 +4355,27 @@ def fetch_workout_stats(
     end_date: Optional[str] = None,
     db_path: Path = DB_PATH,
 ) -> dict[str, object]:
-    """Aggregate stats for a user's workouts."""
+    """
+    Aggregate stats for a user's workouts.
+
+    Without a date range the totals come from the trigger-maintained rollup tables.
+    Results are served from the query cache until the user, history or catalog tables change.
+    """
+    # The dict is copied so the cached one is never mutated by callers.
+    return dict(
+        _cached_query(
+            db_path,
+            ("stats", user_id, start_date or None, end_date or None),
+            lambda conn: _load_workout_stats(conn, user_id, start_date, end_date),
+            tables=_QUERY_CACHE_CATALOG_TABLES,
+        )
+    )
+
+
+def _load_workout_stats(
+    conn: sqlite3.Connection, user_id: int, start_date: Optional[str], end_date: Optional[str]
+) -> dict[str, object]:
+    """Run the stats queries behind fetch_workout_stats on conn."""
     # Compute totals and top exercise counts with optional date filters.
     stats = {
         "total_workouts": 0,
@@ -1563,47 +4383,164 @@ def fetch_workout_stats(
         "top_exercise": None,
         "top_exercise_count": 0,
     }
-
-    filters = ["user_id = ?"]
-    params: list[object] = [user_id]
-    if start_date:
-        filters.append("date(performed_at) >= date(?)")
-        params.append(start_date)
-    if end_date:
-        filters.append("date(performed_at) <= date(?)")
-        params.append(end_date)
-    filter_clause = " AND ".join(filters)
-
-    with get_connection(db_path) as conn:
+    if not start_date and not end_date:
         total_row = conn.execute(
-            f"""
-            SELECT COUNT(*), COALESCE(SUM(duration_minutes), 0)
-            FROM workouts
-            WHERE {filter_clause};
-            """,
-            params,
+            "SELECT total_workouts, total_minutes FROM user_stats WHERE user_id = ?;",
+            (user_id,),
         ).fetchone()
-        stats["total_workouts"] = total_row[0]
-        stats["total_minutes"] = total_row[1]
-
+        # Catalog-linked counts show the catalog name; free-text counts carry their own.
         top_row = conn.execute(
-            f"""
-            SELECT we.exercise_name, COUNT(*) AS cnt
-            FROM workouts w
-            JOIN workout_exercises we ON w.id = we.workout_id
-            WHERE {filter_clause}
-            GROUP BY we.exercise_name
-            ORDER BY cnt DESC, we.exercise_name ASC
+            """
+            SELECT COALESCE(e.name, NULLIF(c.free_text, ''), (
+                SELECT we.exercise_name FROM workout_exercises we WHERE we.exercise_id = c.exercise_id LIMIT 1
+            )) AS name, c.attempt_count
+            FROM user_exercise_counts c
+            LEFT JOIN exercises e ON e.id = c.exercise_id
+            WHERE c.user_id = ?
+            ORDER BY c.attempt_count DESC, name ASC
             LIMIT 1;
             """,
-            params,
+            (user_id,),
         ).fetchone()
+        if total_row:
+            stats["total_workouts"] = total_row[0]
+            stats["total_minutes"] = total_row[1]
         if top_row:
             stats["top_exercise"] = top_row[0]
             stats["top_exercise_count"] = top_row[1]
+        return stats
+
+    day_filters, day_params = _day_range_filters("w.performed_day", start_date, end_date)
+    filters = ["w.user_id = ?", *day_filters]
+    params: list[object] = [user_id, *day_params]
+    filter_clause = " AND ".join(filters)
+
+    total_row = conn.execute(
+        f"""
+        SELECT COUNT(*), COALESCE(SUM(w.duration_minutes), 0)
+        FROM workouts w
+        WHERE {filter_clause};
+        """,
+        params,
+    ).fetchone()
+    stats["total_workouts"] = total_row[0]
+    stats["total_minutes"] = total_row[1]
+
+    top_row = conn.execute(
+        f"""
+        SELECT MIN(COALESCE(e.name, we.exercise_name)) AS name, COUNT(*) AS cnt
+        FROM workouts w
+        JOIN workout_exercises we ON w.id = we.workout_id
+        LEFT JOIN exercises e ON e.id = we.exercise_id
+        WHERE {filter_clause}
+        GROUP BY we.exercise_id, CASE WHEN we.exercise_id IS NULL THEN we.exercise_name END
+        ORDER BY cnt DESC, name ASC
+        LIMIT 1;
+        """,
+        params,
+    ).fetchone()
+    if top_row:
+        stats["top_exercise"] = top_row[0]
+        stats["top_exercise_count"] = top_row[1]
     return stats
 
 
+SERIES_BUCKETS = ("week", "month")
+# Bucket start as a day number: weeks start on Monday (1970-01-01 was a Thursday).
+_SERIES_BUCKET_SQL = {
+    "week": "performed_day - ((performed_day + 3) % 7 + 7) % 7",
+    "month": "CAST(julianday(performed_day * 86400, 'unixepoch', 'start of month') - 2440587.5 AS INTEGER)",
+}
+
+
+def _series_period_start(value: date, bucket: str) -> date:
+    """Return the first day of the week or month containing value."""
+    # Mirrors _SERIES_BUCKET_SQL on the Python side.
+    if bucket == "week":
+        return value - timedelta(days=value.weekday())
+    return value.replace(day=1)
+
+
+def _next_series_period(value: date, bucket: str) -> date:
+    """Return the first day of the period after the one starting at value."""
+    # Months roll over the year boundary by hand.
+    if bucket == "week":
+        return value + timedelta(days=7)
+    return date(value.year + value.month // 12, value.month % 12 + 1, 1)
+
+
+def _parse_series_day(value: str, label: str) -> int:
+    """Return the day number for a series bound or raise ValueError."""
+    # Same message style as _day_range_filters.
+    day = day_number(value)
+    if day is None:
+        raise ValueError(f"{label} date must be in YYYY-MM-DD format.")
+    return day
+
+
+def fetch_workout_series(
+    user_id: int,
+    *,
+    bucket: str = "week",
+    start_date: Optional[str] = None,
+    end_date: Optional[str] = None,
+    periods: int = 12,
+    db_path: Path = DB_PATH,
+) -> list[dict[str, object]]:
+    """
+    Return a dense weekly or monthly series of sessions, minutes and sets for a user.
+
+    end_date defaults to today and start_date to `periods` buckets before it. Every
+    bucket in the range is present, oldest first, with zeros where nothing was logged.
+    Rows are served from the query cache until the user or history tables change.
+    """
+    # One GROUP BY over (user_id, performed_day); empty buckets are filled in Python.
+    if bucket not in SERIES_BUCKETS:
+        raise ValueError(f"Bucket must be one of: {', '.join(SERIES_BUCKETS)}.")
+    if periods <= 0:
+        raise ValueError("Periods must be positive.")
+    last_day = date.today() if not end_date else _EPOCH + timedelta(days=_parse_series_day(end_date, "End"))
+    if start_date:
+        first_day = _EPOCH + timedelta(days=_parse_series_day(start_date, "Start"))
+    else:
+        first_day = _series_period_start(last_day, bucket)
+        for _ in range(periods - 1):
+            first_day = _series_period_start(first_day - timedelta(days=1), bucket)
+    if first_day > last_day:
+        raise ValueError("Start date must not be after the end date.")
+    start_day, end_day = (first_day - _EPOCH).days, (last_day - _EPOCH).days
+
+    rows = _cached_query(
+        db_path,
+        ("series", user_id, bucket, start_day, end_day),
+        lambda conn: tuple(
+            conn.execute(
+                f"""
+                SELECT
+                    {_SERIES_BUCKET_SQL[bucket]} AS period,
+                    COUNT(*),
+                    COALESCE(SUM(duration_minutes), 0),
+                    COALESCE(SUM(total_sets_completed), 0)
+                FROM workouts
+                WHERE user_id = ? AND performed_day BETWEEN ? AND ?
+                GROUP BY period;
+                """,
+                (user_id, start_day, end_day),
+            ).fetchall()
+        ),
+    )
+    totals = {period: (sessions, minutes, sets) for period, sessions, minutes, sets in rows}
+    series: list[dict[str, object]] = []
+    period_start = _series_period_start(first_day, bucket)
+    while period_start <= last_day:
+        sessions, minutes, sets = totals.get((period_start - _EPOCH).days, (0, 0, 0))
+        series.append(
+            {"period_start": period_start.isoformat(), "sessions": sessions, "minutes": minutes, "sets": sets}
+        )
+        period_start = _next_series_period(period_start, bucket)
+    return series
+
+
 def fetch_recent_exercise_usage(
     user_id: int,
     *,
@@ -1616,33 +4553,101 @@ def fetch_recent_exercise_usage(
     Return a list of (exercise_name, performed_at) sorted from newest to oldest.
 
     Used to bias recommendations toward less recently performed movements.
+    Rows are served from the query cache until the user or history tables change.
     """
     # Limit output to keep the recommendation query efficient.
-    filters = ["w.user_id = ?"]
-    params: list[object] = [user_id]
-    if start_date:
-        filters.append("date(w.performed_at) >= date(?)")
-        params.append(start_date)
-    if end_date:
-        filters.append("date(w.performed_at) <= date(?)")
-        params.append(end_date)
+    day_filters, day_params = _day_range_filters("w.performed_day", start_date, end_date)
+    filters = ["w.user_id = ?", *day_filters]
+    params: list[object] = [user_id, *day_params]
     filter_clause = " AND ".join(filters)
 
+    rows = _cached_query(
+        db_path,
+        ("recent_usage", user_id, start_date or None, end_date or None, limit),
+        lambda conn: tuple(
+            conn.execute(
+                f"""
+                SELECT we.exercise_name, w.performed_at
+                FROM workouts w
+                JOIN workout_exercises we ON w.id = we.workout_id
+                WHERE {filter_clause}
+                ORDER BY w.performed_at DESC
+                LIMIT ?;
+                """,
+                (*params, limit),
+            ).fetchall()
+        ),
+    )
+    return list(rows)
+
+
+def fetch_exercise_last_performed_days(user_id: int, *, db_path: Path = DB_PATH) -> dict[int, int]:
+    """
+    Return catalog exercise ids mapped to the day number they were last performed.
+
+    Reads the trigger-maintained user_exercise_last_performed table, so the cost depends on
+    the number of distinct exercises rather than the length of the user's history.
+    """
+    # One primary-key range read; free-text attempts are never stored there.
     with get_connection(db_path) as conn:
         rows = conn.execute(
-            f"""
-            SELECT we.exercise_name, w.performed_at
-            FROM workouts w
-            JOIN workout_exercises we ON w.id = we.workout_id
-            WHERE {filter_clause}
-            ORDER BY w.performed_at DESC
-            LIMIT ?;
+            """
+            SELECT exercise_id, last_performed_day
+            FROM user_exercise_last_performed
+            WHERE user_id = ? AND last_performed_day IS NOT NULL;
             """,
-            (*params, limit),
+            (user_id,),
         ).fetchall()
-    return rows
+    return {exercise_id: last_day for exercise_id, last_day in rows}
+
+
+def _enable_tracing_from_env() -> None:
+    """Enable tracing when FITTRAINER_DB_TRACE is set and schedule the report file."""
+    # FITTRAINER_DB_TRACE_REPORT names a JSON file written at interpreter exit.
+    if os.environ.get(TRACE_ENV_VAR, "").strip().lower() not in {"1", "true", "yes", "on"}:
+        return
+    enable_query_tracing()
+    report_path = os.environ.get(TRACE_REPORT_ENV_VAR, "").strip()
+    if report_path:
+        atexit.register(write_query_trace_report, Path(report_path))
+
 
+_enable_tracing_from_env()
 
 if __name__ == "__main__":
-    path = initialize_database()
-    print(f"Database ready at {path.resolve()}")
+    parser = argparse.ArgumentParser(description="Initialize and maintain the FitTrainer database.")
+    parser.add_argument("--db", type=Path, default=DB_PATH, help="user database file to use")
+    parser.add_argument("--catalog", type=Path, metavar="FILE", help="shared exercise catalog file (default: <db stem>_catalog.db)")
+    parser.add_argument("--catalog-mode", choices=CATALOG_MODES, help="how to open the catalog (default: rw)")
+    parser.add_argument("--rebuild-stats", action="store_true", help="recompute the per-user stats rollup and last-performed tables")
+    parser.add_argument("--check-stats", action="store_true", help="compare the stats rollup with a recomputation")
+    parser.add_argument("--import-catalog", type=Path, metavar="FILE", help="upsert exercises from a JSONL or CSV file")
+    parser.add_argument("--trace-report", type=Path, metavar="FILE", help="trace queries and write a JSON latency report")
+    args = parser.parse_args()
+    if args.trace_report:
+        enable_query_tracing()
+    if args.catalog or args.catalog_mode:
+        configure_connections(catalog_path=args.catalog, catalog_mode=args.catalog_mode)
+
+    path = initialize_database(args.db)
+    print(f"Database ready at {path.resolve()} with catalog {catalog_path_for(path).resolve()}")
+    if args.rebuild_stats:
+        rebuild_stats_rollup(get_connection(path))
+        print("Stats rollup rebuilt.")
+    if args.check_stats:
+        mismatches = check_stats_rollup(get_connection(path))
+        for user_id, field, stored, expected in mismatches:
+            print(f"user {user_id}: {field} is {stored}, expected {expected}")
+        print("Stats rollup consistent." if not mismatches else f"{len(mismatches)} mismatch(es) found.")
+    if args.import_catalog:
+        report = import_exercise_catalog(args.import_catalog, db_path=path)
+        for index, message in report["errors"]:
+            print(f"record {index}: {message}")
+        print(
+            f"Imported {report['processed']} record(s): {report['inserted']} inserted, {report['updated']} updated, "
+            f"{len(report['errors'])} rejected in {report['elapsed_seconds']}s "
+            f"({report['records_per_second']} records/s)."
+        )
+    if args.trace_report:
+        print(f"Trace report written to {write_query_trace_report(args.trace_report)}")
+    close_all()
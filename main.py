@@ -1,11 +1,14 @@
 from __future__ import annotations
 
+import bisect
 import calendar
 import sqlite3
+import sys
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import date, datetime
 from functools import partial
 from pathlib import Path
-from typing import Any, Optional, Sequence
+from typing import Any, Callable, Iterable, Optional, Sequence
 
 from kivy.config import Config
 
@@ -15,6 +18,7 @@ Config.remove_option("input", "%(name)s")
 from kivy.app import App
 from kivy.animation import Animation
 from kivy.clock import Clock
+from kivy.graphics import Color, Rectangle
 from kivy.lang import Builder
 from kivy.properties import BooleanProperty, ListProperty, NumericProperty, StringProperty
 from kivy.uix.button import Button
@@ -27,6 +31,11 @@ from kivy.metrics import dp
 
 import exercise_database
 
+# Workouts fetched per history page; more pages load as the list is scrolled.
+HISTORY_PAGE_SIZE = 25
+# Seconds between checks for changes other kiosks made to a shared database.
+CHANGE_POLL_SECONDS = 2.0
+
 KV = """
 #:import dp kivy.metrics.dp
 
@@ -1272,6 +1281,20 @@ KV = """
             Rectangle:
                 pos: self.pos
                 size: self.size
+        BoxLayout:
+            size_hint_y: None
+            height: dp(36)
+            spacing: dp(6)
+            TextInput:
+                id: browse_search_input
+                multiline: False
+                hint_text: "Search exercises by name, description or instructions"
+                on_text: app.root.on_browse_search(self.text)
+            Button:
+                text: "Clear"
+                size_hint_x: None
+                width: dp(70)
+                on_release: browse_search_input.text = ""
         BoxLayout:
             size_hint_y: None
             height: dp(70)
@@ -1319,7 +1342,7 @@ KV = """
                     background_color: app.root.filter_equipment_color
                     color: app.root.filter_equipment_text_color
         EmptyStateCard:
-            text: "No exercise currently available for these filters." if app.root.browse_empty else ""
+            text: ("No exercise matches this search and these filters." if app.root.browse_search_text.strip() else "No exercise currently available for these filters.") if app.root.browse_empty else ""
         RecycleView:
             id: exercise_list
             viewclass: "ExerciseCard"
@@ -1664,7 +1687,9 @@ KV = """
 
 <HistoryScreen>:
     ScrollView:
+        id: history_scroll
         do_scroll_x: False
+        on_scroll_y: app.root.on_history_scroll(self)
         BoxLayout:
             orientation: "vertical"
             padding: dp(12)
@@ -1785,6 +1810,41 @@ KV = """
                     halign: "left"
                     size_hint_y: None
                     height: dp(20)
+                BoxLayout:
+                    size_hint_y: None
+                    height: dp(30)
+                    spacing: dp(6)
+                    Label:
+                        text: "Sessions per {}".format(app.root.stats_series_bucket)
+                        font_size: "14sp"
+                        color: 0.16, 0.18, 0.26, 1
+                        text_size: self.size
+                        halign: "left"
+                        valign: "middle"
+                    Button:
+                        text: "Weekly"
+                        size_hint_x: None
+                        width: dp(80)
+                        disabled: app.root.stats_series_bucket == "week"
+                        on_release: app.root.set_stats_series_bucket("week")
+                    Button:
+                        text: "Monthly"
+                        size_hint_x: None
+                        width: dp(80)
+                        disabled: app.root.stats_series_bucket == "month"
+                        on_release: app.root.set_stats_series_bucket("month")
+                SeriesChart:
+                    size_hint_y: None
+                    height: dp(64)
+                    values: app.root.stats_series_values
+                Label:
+                    text: app.root.stats_series_caption
+                    font_size: "13sp"
+                    color: 0.3, 0.32, 0.4, 1
+                    text_size: self.width, None
+                    halign: "left"
+                    size_hint_y: None
+                    height: dp(18)
             BoxLayout:
                 size_hint_y: None
                 height: dp(40)
@@ -2185,6 +2245,37 @@ class ProgressRing(Widget):
     background_color = ListProperty((0.86, 0.9, 0.96, 1))
 
 
+class SeriesChart(Widget):
+    """Canvas widget that renders a compact bar chart scaled to its largest value."""
+    # Bars depend on the number of values, so they are drawn in Python rather than KV.
+    values = ListProperty()
+    color = ListProperty((0.18, 0.4, 0.85, 1))
+    baseline_color = ListProperty((0.7, 0.76, 0.86, 1))
+
+    def __init__(self, **kwargs):
+        """Redraw whenever the values, colors or geometry change."""
+        # Bind after super() so KV-assigned values trigger the first draw.
+        super().__init__(**kwargs)
+        self.bind(values=self._redraw, pos=self._redraw, size=self._redraw, color=self._redraw)
+
+    def _redraw(self, *_: Any) -> None:
+        """Draw one bar per value above a thin baseline."""
+        # Leave a small gap between bars; an all-zero series shows only the baseline.
+        self.canvas.clear()
+        with self.canvas:
+            Color(rgba=self.baseline_color)
+            Rectangle(pos=self.pos, size=(self.width, dp(1)))
+            if not self.values:
+                return
+            peak = max(self.values) or 1
+            slot = self.width / len(self.values)
+            gap = min(dp(4), slot * 0.25)
+            Color(rgba=self.color)
+            for index, value in enumerate(self.values):
+                height = (self.height - dp(1)) * value / peak
+                Rectangle(pos=(self.x + index * slot + gap / 2, self.y + dp(1)), size=(slot - gap, height))
+
+
 class RecommendationCard(BoxLayout):
     """Card widget that presents a recommended exercise."""
     # Kivy properties bound by recommendation list entries.
@@ -2364,6 +2455,586 @@ class RecommendationDetailsModal(ModalView):
     time_display = StringProperty("—")
 
 
+def deep_sizeof(root: Any) -> int:
+    """Return the sys.getsizeof total of an object and everything reachable from it."""
+    # Shared objects are counted once, so interned strings and reused tag sets are not double-billed.
+    seen: set[int] = set()
+    stack = [root]
+    total = 0
+    while stack:
+        obj = stack.pop()
+        if id(obj) in seen:
+            continue
+        seen.add(id(obj))
+        total += sys.getsizeof(obj)
+        if isinstance(obj, dict):
+            stack.extend(obj.keys())
+            stack.extend(obj.values())
+        elif isinstance(obj, (list, tuple, set, frozenset)):
+            stack.extend(obj)
+        else:
+            for slot in getattr(type(obj), "__slots__", ()):
+                if hasattr(obj, slot):
+                    stack.append(getattr(obj, slot))
+    return total
+
+
+def _recommendation_text(sets: Optional[int], reps: Optional[int], time_seconds: Optional[int]) -> str:
+    """Describe the recommended volume for one exercise/goal pairing."""
+    # Combine sets/reps and hold time, falling back to a generic hint.
+    parts = []
+    if sets is not None and reps is not None:
+        parts.append(f"{sets} sets x {reps} reps")
+    elif sets is not None:
+        parts.append(f"{sets} sets")
+    if time_seconds is not None:
+        parts.append(f"{time_seconds}s hold")
+    return " • ".join(parts) if parts else "Adjust volume to preference"
+
+
+def _bits_from_positions(positions: Iterable[int], size: int) -> int:
+    """Pack record positions into an int bitset with room for size records."""
+    # Filling a bytearray avoids building a new, ever larger int for every bit.
+    bitmap = bytearray((size + 7) // 8)
+    for position in positions:
+        bitmap[position >> 3] |= 1 << (position & 7)
+    return int.from_bytes(bitmap, "little")
+
+
+_GOAL_POSITIONS = {goal: position for position, goal in enumerate(exercise_database.GOALS)}
+
+
+class CatalogExercise:
+    """Goal-independent exercise fields, stored once however many goals rate the exercise."""
+
+    __slots__ = (
+        "id",
+        "name",
+        "icon",
+        "icon_source",
+        "description",
+        "execution_instructions",
+        "equipment",
+        "equipment_items",
+        "muscle_group",
+        "muscle_groups",
+        "recommendations",
+    )
+
+    def __init__(
+        self,
+        exercise_id: int,
+        name: str,
+        icon: str,
+        icon_source: str,
+        description: str,
+        execution_instructions: str,
+        equipment: str,
+        equipment_items: frozenset[str],
+        muscle_group: str,
+        muscle_groups: frozenset[str],
+    ) -> None:
+        """Store the shared fields and an empty per-goal recommendation slot array."""
+        # recommendations is indexed by position in exercise_database.GOALS.
+        self.id = exercise_id
+        self.name = name
+        self.icon = icon
+        self.icon_source = icon_source
+        self.description = description
+        self.execution_instructions = execution_instructions
+        self.equipment = equipment
+        self.equipment_items = equipment_items
+        self.muscle_group = muscle_group
+        self.muscle_groups = muscle_groups
+        self.recommendations: list[Optional[CatalogRecord]] = [None] * len(exercise_database.GOALS)
+
+    def records(self) -> list["CatalogRecord"]:
+        """Return this exercise's goal records in GOALS order."""
+        # Goals without a recommendation leave their slot empty.
+        return [record for record in self.recommendations if record is not None]
+
+
+class CatalogRecord:
+    """One exercise/goal recommendation that reads shared fields through its exercise."""
+
+    __slots__ = (
+        "exercise",
+        "goal",
+        "goal_label",
+        "rating",
+        "suitability_display",
+        "sets",
+        "reps",
+        "time_seconds",
+        "recommendation",
+    )
+
+    def __init__(
+        self,
+        exercise: CatalogExercise,
+        goal: str,
+        goal_label: str,
+        rating: int,
+        suitability_display: str,
+        sets: Optional[int],
+        reps: Optional[int],
+        time_seconds: Optional[int],
+        recommendation: str,
+    ) -> None:
+        """Store the goal-specific fields alongside a reference to the shared exercise."""
+        # Everything else (name, description, tags, ...) lives on the exercise.
+        self.exercise = exercise
+        self.goal = goal
+        self.goal_label = goal_label
+        self.rating = rating
+        self.suitability_display = suitability_display
+        self.sets = sets
+        self.reps = reps
+        self.time_seconds = time_seconds
+        self.recommendation = recommendation
+
+    def __getitem__(self, key: str) -> Any:
+        """Read a field dict-style, so records work where the old record dicts did."""
+        # Goal fields come from the record itself; the rest from the shared exercise.
+        if key in CatalogRecord.__slots__:
+            return getattr(self, key)
+        if key in CatalogExercise.__slots__:
+            return getattr(self.exercise, key)
+        raise KeyError(key)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Return a field by name, or default when the record has no such field."""
+        # Mirrors dict.get for helpers shared with plan and recommendation dicts.
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+
+class ExerciseCatalog:
+    """
+    In-memory exercise catalog with id, name and goal indexes.
+
+    Each exercise is stored once as a CatalogExercise; its per-goal CatalogRecords only
+    hold the recommendation fields. Lookups by id, name (exact or case-insensitive) and
+    goal are dict hits instead of scans over every exercise/goal pairing.
+
+    Browse filtering runs on an inverted index of int bitsets over record positions:
+    bit i of a goal, muscle group or equipment bitset is set when records[i] carries
+    that value. Filters are ANDs of bitsets and facet counts are popcounts.
+
+    The catalog only grows in place (add_rows): records are appended, so existing bit
+    positions never move and a new exercise costs the same however large the catalog is.
+    """
+
+    def __init__(
+        self,
+        *,
+        icon_resolver: Callable[[str], str] = lambda _name: "",
+        goal_labeler: Callable[[str], str] = lambda goal: goal.replace("_", " ").title(),
+    ) -> None:
+        """Create an empty catalog that resolves icons and goal labels with the given helpers."""
+        # Records are append-only so bit positions stay valid; name order is tracked separately.
+        self._icon_resolver = icon_resolver
+        self._goal_labeler = goal_labeler
+        self._goal_labels: dict[str, str] = {}
+        self.records: list[CatalogRecord] = []
+        self._by_id: dict[int, CatalogExercise] = {}
+        self._by_name: dict[str, CatalogExercise] = {}
+        self._by_lower_name: dict[str, CatalogExercise] = {}
+        self._by_goal: dict[str, list[CatalogRecord]] = {goal: [] for goal in exercise_database.GOALS}
+        self._facet_bits: dict[str, dict[str, int]] = {"goal": {}, "muscle_groups": {}, "equipment_items": {}}
+        self._exercise_positions: dict[int, list[int]] = {}
+        # Best record per exercise (highest rating, then GOALS order) for the "All goals" view.
+        self._best_positions: dict[int, int] = {}
+        self._best_bits = 0
+        self._name_order: list[int] = []
+        self._name_rank: list[int] = []
+
+    @classmethod
+    def from_rows(
+        cls,
+        rows: Sequence[tuple],
+        *,
+        icon_resolver: Callable[[str], str] = lambda _name: "",
+        goal_labeler: Callable[[str], str] = lambda goal: goal.replace("_", " ").title(),
+    ) -> "ExerciseCatalog":
+        """Build a catalog from query_exercises rows, skipping incomplete exercises."""
+        # Name order is ranked once for the whole batch.
+        catalog = cls(icon_resolver=icon_resolver, goal_labeler=goal_labeler)
+        catalog._ingest(rows)
+        catalog._rank_names()
+        return catalog
+
+    def add_rows(self, rows: Sequence[tuple]) -> list[CatalogRecord]:
+        """Patch new exercises' query_exercises rows into the catalog and return their records."""
+        # Only the name order needs more than appends: new positions are inserted by bisection.
+        # Rows of exercises already loaded (e.g. by a concurrent full reload) are ignored.
+        start = len(self.records)
+        self._ingest([row for row in rows if row[0] not in self._by_id])
+        records = self.records
+        for position in range(start, len(records)):
+            bisect.insort(
+                self._name_order,
+                position,
+                key=lambda index: (records[index].exercise.name, records[index].goal),
+            )
+        if len(records) > start:
+            self._rank_from_order()
+        return records[start:]
+
+    def _ingest(self, rows: Sequence[tuple]) -> None:
+        """Append query_exercises rows to the records and every index."""
+        # Rows repeat the exercise columns once per goal; only the first copy is kept.
+        icon_resolver = self._icon_resolver
+        goal_labels = self._goal_labels
+        facet_positions: dict[str, dict[str, list[int]]] = {field: {} for field in self._facet_bits}
+        added: dict[int, CatalogExercise] = {}
+        for (
+            exercise_id,
+            name,
+            icon,
+            description,
+            execution_instructions,
+            equipment,
+            muscle_group,
+            goal,
+            rating,
+            sets,
+            reps,
+            time_seconds,
+            equipment_items,
+            muscle_items,
+        ) in rows:
+            if not name or not description:
+                continue
+            exercise = self._by_id.get(exercise_id)
+            if exercise is None:
+                icon_value = icon or ""
+                exercise = CatalogExercise(
+                    exercise_id,
+                    name,
+                    icon_value,
+                    icon_resolver(icon_value) or icon_resolver(name),
+                    description,
+                    execution_instructions or "",
+                    exercise_database.format_tag_list(equipment_items) or equipment,
+                    frozenset(equipment_items),
+                    exercise_database.format_tag_list(muscle_items) or muscle_group,
+                    frozenset(muscle_items),
+                )
+                self._add_exercise(exercise)
+            added[exercise_id] = exercise
+            goal_label = goal_labels.get(goal)
+            if goal_label is None:
+                goal_label = goal_labels[goal] = self._goal_labeler(goal)
+            self._add_record(
+                CatalogRecord(
+                    exercise,
+                    goal,
+                    goal_label,
+                    rating,
+                    f"{rating}/10",
+                    sets,
+                    reps,
+                    time_seconds,
+                    _recommendation_text(sets, reps, time_seconds),
+                ),
+                facet_positions["goal"],
+            )
+        # Callers never pass rows for exercises loaded by an earlier batch, so every
+        # exercise seen here is new and owns only positions from this batch.
+        records = self.records
+        best_positions: list[int] = []
+        for exercise_id, exercise in added.items():
+            positions = self._exercise_positions.get(exercise_id)
+            if not positions:
+                continue
+            for field in ("muscle_groups", "equipment_items"):
+                tag_positions = facet_positions[field]
+                for tag in getattr(exercise, field):
+                    tag_positions.setdefault(tag, []).extend(positions)
+            best = positions[0]
+            for position in positions[1:]:
+                if self._outranks(records[position], records[best]):
+                    best = position
+            self._best_positions[exercise_id] = best
+            best_positions.append(best)
+        size = len(records)
+        for field, values in facet_positions.items():
+            index = self._facet_bits[field]
+            for value, positions in values.items():
+                index[value] = index.get(value, 0) | _bits_from_positions(positions, size)
+        self._best_bits |= _bits_from_positions(best_positions, size)
+
+    def _add_exercise(self, exercise: CatalogExercise) -> None:
+        """Register an exercise in the id and name indexes."""
+        # The lower-case index backs case-insensitive duplicate checks.
+        self._by_id[exercise.id] = exercise
+        self._by_name[exercise.name] = exercise
+        self._by_lower_name[exercise.name.strip().lower()] = exercise
+
+    def _add_record(self, record: CatalogRecord, goal_positions: dict[str, list[int]]) -> None:
+        """Register a goal record on its exercise, in the goal index and in the pending goal positions."""
+        # Tag and best-record indexes are per exercise, so _ingest fills them once per exercise.
+        position = len(self.records)
+        exercise = record.exercise
+        self.records.append(record)
+        self._by_goal.setdefault(record.goal, []).append(record)
+        goal_position = _GOAL_POSITIONS.get(record.goal)
+        if goal_position is not None:
+            exercise.recommendations[goal_position] = record
+        goal_positions.setdefault(record.goal, []).append(position)
+        self._exercise_positions.setdefault(exercise.id, []).append(position)
+
+    @staticmethod
+    def _outranks(record: CatalogRecord, other: CatalogRecord) -> bool:
+        """Return whether record should represent its exercise instead of other."""
+        # Higher rating wins; ties go to the goal listed first in GOALS.
+        if record.rating != other.rating:
+            return record.rating > other.rating
+        return _GOAL_POSITIONS.get(record.goal, 0) < _GOAL_POSITIONS.get(other.goal, 0)
+
+    def _rank_names(self) -> None:
+        """Precompute each record's position in name order."""
+        # records_for_bits sorts matches by this rank instead of comparing strings.
+        records = self.records
+        self._name_order = sorted(
+            range(len(records)), key=lambda position: (records[position].exercise.name, records[position].goal)
+        )
+        self._rank_from_order()
+
+    def _rank_from_order(self) -> None:
+        """Rebuild the position -> name rank table from the name order."""
+        # A single linear pass; no strings are compared.
+        rank = [0] * len(self._name_order)
+        for index, position in enumerate(self._name_order):
+            rank[position] = index
+        self._name_rank = rank
+
+    def __len__(self) -> int:
+        """Return the number of distinct exercises."""
+        # Records outnumber exercises by roughly the number of goals.
+        return len(self._by_id)
+
+    def exercise(self, name: str) -> Optional[CatalogExercise]:
+        """Return the exercise with exactly this name, if any."""
+        # Exact-match lookup used for plan and history names.
+        return self._by_name.get(name)
+
+    def has_name(self, name: str) -> bool:
+        """Return whether an exercise name exists, ignoring case and surrounding spaces."""
+        # Matches the normalization used when validating typed names.
+        return name.strip().lower() in self._by_lower_name
+
+    def names(self) -> list[str]:
+        """Return every exercise name in sorted order."""
+        # Used for history exercise pickers.
+        return sorted(self._by_name)
+
+    def lower_names(self) -> set[str]:
+        """Return the normalized (stripped, lower-case) exercise names."""
+        # Callers validating many names at once can reuse one set.
+        return set(self._by_lower_name)
+
+    def record(self, name: str, goal: Optional[str] = None) -> Optional[CatalogRecord]:
+        """Return the record for an exercise and goal, or its first record without a goal."""
+        # The per-goal array makes the goal lookup a list index.
+        exercise = self._by_name.get(name)
+        if exercise is None:
+            return None
+        position = _GOAL_POSITIONS.get(goal) if goal else None
+        if position is not None:
+            return exercise.recommendations[position]
+        return next((record for record in exercise.recommendations if record is not None), None)
+
+    def for_goal(self, goal: str) -> list[CatalogRecord]:
+        """Return the records rated for a goal, in catalog order."""
+        # Callers must not mutate the returned index list.
+        return self._by_goal.get(goal, [])
+
+    def records_for_id(self, exercise_id: int) -> list[CatalogRecord]:
+        """Return every goal record of the exercise with this id."""
+        # Search results come back as ids, so this backs ranked browsing.
+        exercise = self._by_id.get(exercise_id)
+        return exercise.records() if exercise is not None else []
+
+    def tag_values(self, field: str) -> list[str]:
+        """Return the sorted distinct tags of an exercise tag field ("muscle_groups"/"equipment_items")."""
+        # Tags live on exercises, so each set is visited once rather than once per goal.
+        return sorted({tag for exercise in self._by_id.values() for tag in getattr(exercise, field)})
+
+    @property
+    def all_bits(self) -> int:
+        """Return a bitset with every record set."""
+        # Neutral element for the AND-ed filters.
+        return (1 << len(self.records)) - 1
+
+    def goal_bits(self, goal: Optional[str]) -> int:
+        """Return the records rated for a goal, or each exercise's best record for None."""
+        # None backs the "All goals" view, which shows every exercise once.
+        if goal is None:
+            return self._best_bits
+        return self._facet_bits["goal"].get(goal, 0)
+
+    def tag_bits(self, field: str, values: Iterable[str]) -> int:
+        """Return the records carrying any of the tag values, or every record when none are given."""
+        # field is "muscle_groups" or "equipment_items".
+        values = list(values)
+        if not values:
+            return self.all_bits
+        index = self._facet_bits[field]
+        bits = 0
+        for value in values:
+            bits |= index.get(value, 0)
+        return bits
+
+    def search_bits(self, exercise_ids: Optional[Iterable[int]]) -> int:
+        """Return the records of the given exercises, or every record for None."""
+        # None means no search is active.
+        if exercise_ids is None:
+            return self.all_bits
+        positions = self._exercise_positions
+        return _bits_from_positions(
+            (position for exercise_id in exercise_ids for position in positions.get(exercise_id, ())),
+            len(self.records),
+        )
+
+    def facet_counts(self, field: str, bits: int) -> dict[str, int]:
+        """Count the records in bits for every value of a facet ("goal", "muscle_groups", "equipment_items")."""
+        # One AND and popcount per value; no record is visited.
+        return {value: (bits & value_bits).bit_count() for value, value_bits in self._facet_bits[field].items()}
+
+    def records_for_bits(self, bits: int, rank: Optional[dict[int, int]] = None) -> list[CatalogRecord]:
+        """Return the records in a bitset, in name order or by an exercise-id rank."""
+        # Peel off the lowest set bit until none remain.
+        positions: list[int] = []
+        while bits:
+            low = bits & -bits
+            positions.append(low.bit_length() - 1)
+            bits ^= low
+        records = self.records
+        if rank is None:
+            positions.sort(key=self._name_rank.__getitem__)
+        else:
+            positions.sort(key=lambda position: rank[records[position].exercise.id])
+        return [records[position] for position in positions]
+
+    def memory_footprint(self) -> int:
+        """Return the approximate memory used by the catalog and its indexes, in bytes."""
+        # Counts every reachable object once via deep_sizeof.
+        return deep_sizeof(
+            (
+                self.records,
+                self._by_id,
+                self._by_name,
+                self._by_lower_name,
+                self._by_goal,
+                self._facet_bits,
+                self._exercise_positions,
+                self._best_positions,
+                self._name_order,
+                self._name_rank,
+            )
+        )
+
+
+class DatabaseExecutor:
+    """
+    Run exercise_database calls on worker threads and deliver results on the main thread.
+
+    Requests submitted under a key supersede earlier ones with the same key: a queued
+    request is cancelled and a running one has its result dropped, so only the newest
+    reload reaches the UI. Requests without a key (saves) are never superseded.
+    """
+    # Each worker thread gets its own pooled SQLite connection from exercise_database.
+    def __init__(
+        self,
+        max_workers: int = 2,
+        *,
+        schedule: Optional[Callable[[Callable[[float], None]], Any]] = None,
+    ) -> None:
+        """Create the worker pool; schedule defaults to Clock.schedule_once."""
+        # Tests pass a synchronous schedule so callbacks run without a Kivy loop.
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="fittrainer-db")
+        self._schedule = schedule or (lambda callback: Clock.schedule_once(callback, 0))
+        self._latest: dict[str, Future] = {}
+
+    def submit(
+        self,
+        fn: Callable[..., Any],
+        *args: Any,
+        key: Optional[str] = None,
+        on_success: Optional[Callable[[Any], None]] = None,
+        on_error: Optional[Callable[[Exception], None]] = None,
+        **kwargs: Any,
+    ) -> Future:
+        """
+        Run fn(*args, **kwargs) on a worker and return its future.
+
+        on_success receives the result and on_error receives any exception, both on the
+        main thread; without on_error the exception is re-raised there.
+        """
+        # Must be called from the main thread, which owns the key registry.
+        if key is not None:
+            previous = self._latest.get(key)
+            if previous is not None:
+                previous.cancel()
+        future = self._pool.submit(fn, *args, **kwargs)
+        if key is not None:
+            self._latest[key] = future
+        future.add_done_callback(
+            lambda done: self._schedule(lambda _dt: self._deliver(key, done, on_success, on_error))
+        )
+        return future
+
+    def _deliver(
+        self,
+        key: Optional[str],
+        future: Future,
+        on_success: Optional[Callable[[Any], None]],
+        on_error: Optional[Callable[[Exception], None]],
+    ) -> None:
+        """Hand a finished future to its callbacks unless it was cancelled or superseded."""
+        # Runs on the main thread via the schedule function.
+        if future.cancelled():
+            return
+        if key is not None:
+            if self._latest.get(key) is not future:
+                return
+            del self._latest[key]
+        exc = future.exception()
+        if exc is None:
+            if on_success is not None:
+                on_success(future.result())
+            return
+        # Failures such as OSError from a network volume must not take down the main loop.
+        if on_error is not None and isinstance(exc, Exception):
+            on_error(exc)
+            return
+        raise exc
+
+    def pending(self, key: str) -> bool:
+        """Return True while a request under key has not been delivered."""
+        # Used to ignore repeated triggers such as scroll events or double taps.
+        return key in self._latest
+
+    def cancel(self, key: str) -> None:
+        """Drop the pending request under key, if any."""
+        # A running call still completes, but its result is discarded.
+        future = self._latest.pop(key, None)
+        if future is not None:
+            future.cancel()
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop the workers, cancelling queued keyed reloads and finishing everything else."""
+        # Unkeyed requests are saves: queued ones still run and commit before connections close.
+        for future in self._latest.values():
+            future.cancel()
+        self._latest.clear()
+        self._pool.shutdown(wait=wait)
+
+
 class RootWidget(BoxLayout):
     """Main application controller and data/state hub."""
     # Centralized Kivy properties that drive the UI bindings.
@@ -2422,6 +3093,9 @@ class RootWidget(BoxLayout):
     stats_total_workouts = StringProperty("0")
     stats_total_minutes = StringProperty("0")
     stats_top_exercise = StringProperty("—")
+    stats_series_bucket = StringProperty("week")
+    stats_series_values = ListProperty()
+    stats_series_caption = StringProperty("")
     rec_status_text = StringProperty("")
     rec_status_color = ListProperty((0.14, 0.4, 0.2, 1))
     rec_status_is_error = BooleanProperty(False)
@@ -2432,6 +3106,7 @@ class RootWidget(BoxLayout):
     rec_total_minutes = StringProperty("0")
     rec_plan_height = NumericProperty(dp(70))
     browse_empty = BooleanProperty(False)
+    browse_search_text = StringProperty("")
     live_active = BooleanProperty(False)
     live_paused = BooleanProperty(False)
     live_started = BooleanProperty(False)
@@ -2480,11 +3155,19 @@ class RootWidget(BoxLayout):
         if app and app.root is None:
             app.root = self
         super().__init__(**kwargs)
-        self.records: list[dict[str, Any]] = []
+        self.catalog = ExerciseCatalog()
+        self._recommendations_by_name: dict[str, dict[str, Any]] = {}
+        self._browse_search_rank: Optional[dict[int, int]] = None
+        self._browse_search_event = None
+        self.db_executor = DatabaseExecutor()
+        self._change_monitor = exercise_database.ChangeMonitor()
+        self._saves_in_flight: set[str] = set()
         self._users: list[dict[str, Any]] = []
         self.current_user_id: Optional[int] = None
         self.history_start: Optional[str] = None
         self.history_end: Optional[str] = None
+        self._history_cursor: Optional[str] = None
+        self._history_loaded_count = 0
         self._goal_label_map = {self._pretty_goal(goal): goal for goal in exercise_database.GOALS}
         self._goal_code_label_map = {goal: self._pretty_goal(goal) for goal in exercise_database.GOALS}
         self._workout_log_modal: Optional[WorkoutLogModal] = None
@@ -2498,6 +3181,7 @@ class RootWidget(BoxLayout):
         self._live_rest_remaining = 0.0
         self._live_set_target_seconds = 0.0
         self._live_session_started_at: Optional[datetime] = None
+        self._live_journal: Optional[exercise_database.SessionJournal] = None
         self._live_completed: list[str] = []
         self._live_skipped: list[str] = []
         self._live_attempt_log: list[dict[str, str]] = []
@@ -2521,16 +3205,6 @@ class RootWidget(BoxLayout):
         # Keep label formatting consistent across screens.
         return goal.replace("_", " ").title()
 
-    def _normalize_equipment_items(self, equipment: str) -> list[str]:
-        """Normalize equipment tags into canonical display values."""
-        # Delegate normalization to shared database helpers.
-        return exercise_database.normalize_equipment_list(equipment)
-
-    def _normalize_muscle_groups(self, muscle_group: str) -> list[str]:
-        """Normalize muscle group tags into canonical display values."""
-        # Delegate normalization to shared database helpers.
-        return exercise_database.normalize_muscle_group_list(muscle_group)
-
     def _format_tag_display(self, items: Sequence[str]) -> str:
         """Join normalized tags for UI presentation."""
         # Use the shared formatting helper for consistent output.
@@ -2648,15 +3322,11 @@ class RootWidget(BoxLayout):
         self._sync_recommendation_goal()
 
     def _bootstrap_data(self, *_: Any) -> None:
-        """Load initial records/users and prepare screen state."""
+        """Prepare screen state and start loading initial records and users in the background."""
         # Run once after KV has created widgets.
-        self.records = self._load_records()
         self.goal_choice_options = list(self._goal_label_map.keys())
         if not self.add_goal_spinner_text and self.goal_choice_options:
             self.add_goal_spinner_text = self._preferred_goal_label()
-        self._update_filter_options()
-        self.apply_filters()
-        self._load_users()
         self._prefill_workout_date()
         # Start on the user screen so a user is chosen or created immediately.
         try:
@@ -2665,76 +3335,40 @@ class RootWidget(BoxLayout):
             pass
         if self.goal_choice_options and not self.rec_goal_spinner_text:
             self.rec_goal_spinner_text = self.goal_choice_options[0]
+        self.db_executor.submit(
+            self._load_bootstrap_rows,
+            key="records",
+            on_success=self._apply_bootstrap_rows,
+            on_error=lambda exc: self._set_status(f"Database error: {exc}", error=True),
+        )
 
-    def _load_records(self) -> list[dict[str, Any]]:
-        """Fetch exercise rows and normalize them for UI usage."""
-        # Convert database rows into dictionaries used by filters and lists.
-        with exercise_database.get_connection() as conn:
-            rows = exercise_database.fetch_all(conn)
-        records: list[dict[str, Any]] = []
-        for (
-            name,
-            icon,
-            description,
-            execution_instructions,
-            equipment,
-            muscle_group,
-            goal,
-            rating,
-            sets,
-            reps,
-            time_seconds,
-        ) in rows:
-            if not name or not description:
-                continue
-            muscle_items = self._normalize_muscle_groups(muscle_group)
-            equipment_items = self._normalize_equipment_items(equipment)
-            muscle_display = self._format_tag_display(muscle_items) or muscle_group
-            equipment_display = self._format_tag_display(equipment_items) or equipment
-            recommendation_parts = []
-            if sets is not None and reps is not None:
-                recommendation_parts.append(f"{sets} sets x {reps} reps")
-            elif sets is not None:
-                recommendation_parts.append(f"{sets} sets")
-            if time_seconds is not None:
-                recommendation_parts.append(f"{time_seconds}s hold")
-            recommendation = " • ".join(recommendation_parts) if recommendation_parts else "Adjust volume to preference"
-            icon_value = icon or ""
-            icon_source = self._resolve_icon_source(icon_value)
-            if not icon_source and name:
-                icon_source = self._resolve_icon_source(name)
-            records.append(
-                {
-                    "name": name,
-                    "icon": icon_value,
-                    "icon_source": icon_source,
-                    "description": description,
-                    "execution_instructions": execution_instructions or "",
-                    "equipment": equipment_display,
-                    "equipment_items": set(equipment_items),
-                    "muscle_group": muscle_display,
-                    "muscle_groups": set(muscle_items),
-                    "goal": goal,
-                    "goal_label": self._pretty_goal(goal),
-                    "suitability_display": f"{rating}/10",
-                    "rating": rating,
-                    "sets": sets,
-                    "reps": reps,
-                    "time_seconds": time_seconds,
-                    "recommendation": recommendation,
-                }
-            )
-        return records
+    def _load_bootstrap_rows(self) -> list[tuple]:
+        """Take the change-poll baseline, then query the catalog rows; runs on a worker."""
+        # The baseline comes first so nothing committed during the startup loads is missed.
+        self._change_monitor.poll()
+        return exercise_database.query_exercises()
+
+    def _apply_bootstrap_rows(self, rows: list[tuple]) -> None:
+        """Build the startup catalog, then load users and start polling for changes."""
+        # Users load only after the baseline poll, for the same reason as the catalog.
+        self.catalog = self._load_catalog(rows)
+        self._update_filter_options()
+        self.apply_filters()
+        self._load_users()
+        Clock.schedule_interval(self._poll_changes, CHANGE_POLL_SECONDS)
+
+    def _load_catalog(self, rows: list[tuple]) -> ExerciseCatalog:
+        """Build the exercise catalog from query_exercises rows."""
+        # Icons and goal labels are resolved with the same helpers the screens use.
+        return ExerciseCatalog.from_rows(
+            rows, icon_resolver=self._resolve_icon_source, goal_labeler=self._pretty_goal
+        )
 
     def _update_filter_options(self) -> None:
         """Refresh filter option lists and spinner defaults."""
         # Regenerate filter choices based on available records.
-        muscle_choices = sorted(
-            {item for record in self.records for item in record.get("muscle_groups", set())}
-        )
-        equipment_choices = sorted(
-            {item for record in self.records for item in record.get("equipment_items", set())}
-        )
+        muscle_choices = self.catalog.tag_values("muscle_groups")
+        equipment_choices = self.catalog.tag_values("equipment_items")
         if "Dumbbell" not in equipment_choices:
             equipment_choices.append("Dumbbell")
         self.muscle_choice_options = muscle_choices
@@ -2748,23 +3382,19 @@ class RootWidget(BoxLayout):
         self.equipment_choice_display = ", ".join(self.equipment_choice_options) if self.equipment_choice_options else ""
         self.add_equipment_spinner_text = self._resolve_equipment_choice(self.add_equipment_spinner_text)
 
-        self.goal_options = ["All goals"] + self.goal_choice_options
         self.user_goal_options = ["No goal"] + self.goal_choice_options
-        muscle_options = ["All muscle groups"] + muscle_choices
-        equipment_options = ["All equipment"] + equipment_choices
-        if self.muscle_spinner_text not in muscle_options:
-            self.muscle_spinner_text = "All muscle groups"
+        # Browse spinner options carry facet counts and are rebuilt by apply_filters.
+        if self.filter_muscle_group != "All" and self.filter_muscle_group not in muscle_choices:
             self.filter_muscle_group = "All"
-        if self.equipment_spinner_text not in equipment_options:
-            self.equipment_spinner_text = "All equipment"
+            self.muscle_spinner_text = "All muscle groups"
+        if self.filter_equipment != "All" and self.filter_equipment not in self.equipment_choice_options:
             self.filter_equipment = "All"
-        self.muscle_options = muscle_options
-        self.equipment_options = equipment_options
+            self.equipment_spinner_text = "All equipment"
         if self.goal_choice_options and self.add_goal_spinner_text not in self.goal_choice_options:
             self.add_goal_spinner_text = self._preferred_goal_label()
         if self.user_profile_goal not in self.user_goal_options:
             self.user_profile_goal = "No goal"
-        self.history_exercise_options = sorted({r["name"] for r in self.records})
+        self.history_exercise_options = self.catalog.names()
         self._refresh_history_exercise_filtered_options()
         self.workout_goal_options = ["No goal"] + self.goal_choice_options
         if self.workout_goal_spinner_text not in self.workout_goal_options:
@@ -2829,20 +3459,13 @@ class RootWidget(BoxLayout):
             return {item for item in selection if item and item != "All"}
         return {str(selection)}
 
-    def _record_matches_tag_filters(self, record: dict[str, Any]) -> bool:
-        """Check whether a record matches selected muscle/equipment filters."""
-        # Compare record tags against the selected filter values.
-        selected_muscles = self._normalize_filter_selection(self.filter_muscle_group)
-        if selected_muscles:
-            record_muscles = set(record.get("muscle_groups") or [])
-            if not selected_muscles.intersection(record_muscles):
-                return False
-        selected_equipment = self._normalize_filter_selection(self.filter_equipment)
-        if selected_equipment:
-            record_equipment = set(record.get("equipment_items") or [])
-            if not selected_equipment.intersection(record_equipment):
-                return False
-        return True
+    def _strip_facet_count(self, label: str) -> str:
+        """Remove a trailing facet count such as " (12)" from a spinner label."""
+        # Tags never contain parentheses (the normalizer drops them), so this is unambiguous.
+        name, separator, count = label.rpartition(" (")
+        if separator and count.endswith(")") and count[:-1].isdigit():
+            return name
+        return label
 
     def _sync_recommendation_goal(self) -> None:
         """Align recommendation goal with the user profile when possible."""
@@ -2857,6 +3480,11 @@ class RootWidget(BoxLayout):
         # Keep plan list height in sync with item count.
         self._update_rec_plan_height()
 
+    def on_rec_recommendations(self, *_: Any) -> None:
+        """Re-index recommendations by exercise name when the list changes."""
+        # ListProperty also fires on in-place append/sort, so the index never goes stale.
+        self._recommendations_by_name = {rec["name"]: rec for rec in self.rec_recommendations}
+
     def _compute_rec_plan_height(self) -> float:
         """Calculate plan list height within min/max limits."""
         # Cap the height so the list remains scrollable.
@@ -3025,86 +3653,113 @@ class RootWidget(BoxLayout):
 
     def on_goal_change(self, value: str) -> None:
         """Handle selection changes for the goal filter."""
-        # Update filter state and refresh the browse list.
-        self.filter_goal = "All" if value == "All goals" else self._goal_label_map.get(value, "All")
+        # Relabelling by _refresh_filter_facets echoes back here and is ignored.
+        goal = "All" if value == "All goals" else self._goal_label_map.get(self._strip_facet_count(value), "All")
+        if value == self.goal_spinner_text and goal == self.filter_goal:
+            return
+        self.filter_goal = goal
         self.goal_spinner_text = value
         self._update_filter_colors()
         self.apply_filters()
 
     def on_muscle_change(self, value: str) -> None:
         """Handle selection changes for the muscle filter."""
-        # Update filter state and refresh the browse list.
-        self.filter_muscle_group = "All" if value == "All muscle groups" else value
+        # Relabelling by _refresh_filter_facets echoes back here and is ignored.
+        muscle_group = "All" if value == "All muscle groups" else self._strip_facet_count(value)
+        if value == self.muscle_spinner_text and muscle_group == self.filter_muscle_group:
+            return
+        self.filter_muscle_group = muscle_group
         self.muscle_spinner_text = value
         self._update_filter_colors()
         self.apply_filters()
 
     def on_equipment_change(self, value: str) -> None:
         """Handle selection changes for the equipment filter."""
-        # Update filter state and refresh the browse list.
-        self.filter_equipment = "All" if value == "All equipment" else value
+        # Relabelling by _refresh_filter_facets echoes back here and is ignored.
+        equipment = "All" if value == "All equipment" else self._strip_facet_count(value)
+        if value == self.equipment_spinner_text and equipment == self.filter_equipment:
+            return
+        self.filter_equipment = equipment
         self.equipment_spinner_text = value
         self._update_filter_colors()
         self.apply_filters()
 
+    def on_browse_search(self, text: str) -> None:
+        """Schedule a catalog search shortly after the user stops typing."""
+        # Debounce keystrokes so each burst of typing runs one FTS query.
+        self.browse_search_text = text
+        if self._browse_search_event is not None:
+            self._browse_search_event.cancel()
+        self._browse_search_event = Clock.schedule_once(self._run_browse_search, 0.15)
+
+    def _run_browse_search(self, *_: Any) -> None:
+        """Run the current browse search in the background and refresh the list."""
+        # A newer search supersedes one still running; clearing the query needs no query at all.
+        self._browse_search_event = None
+        query = self.browse_search_text.strip()
+        if not query:
+            self.db_executor.cancel("browse_search")
+            self._browse_search_rank = None
+            self.apply_filters()
+            return
+        self.db_executor.submit(
+            exercise_database.search_exercises,
+            query,
+            limit=len(self.catalog) or 50,
+            key="browse_search",
+            on_success=self._apply_browse_search,
+            on_error=lambda exc: self._set_status(f"Search failed: {exc}", error=True),
+        )
+
+    def _apply_browse_search(self, exercise_ids: list[int]) -> None:
+        """Store search ranks by exercise id and refresh the browse list."""
+        # None in _browse_search_rank means no search is active.
+        self._browse_search_rank = {exercise_id: position for position, exercise_id in enumerate(exercise_ids)}
+        self.apply_filters()
+
+    def _browse_filter_bits(self) -> tuple[int, int, int, int]:
+        """Return the catalog bitsets for the active search, muscle, equipment and goal filters."""
+        # "All goals" maps to each exercise's best record.
+        catalog = self.catalog
+        goal = None if self.filter_goal == "All" else self.filter_goal
+        return (
+            catalog.search_bits(self._browse_search_rank),
+            catalog.tag_bits("muscle_groups", self._normalize_filter_selection(self.filter_muscle_group)),
+            catalog.tag_bits("equipment_items", self._normalize_filter_selection(self.filter_equipment)),
+            catalog.goal_bits(goal),
+        )
+
+    def _browse_entry(self, record: CatalogRecord) -> dict[str, str]:
+        """Build the ExerciseCard data for one browse record."""
+        # The "All goals" view names the goal next to the rating.
+        exercise = record.exercise
+        suitability_display = record.suitability_display
+        if self.filter_goal == "All":
+            suitability_display = f"{record.goal_label} ({suitability_display})"
+        return {
+            "name": exercise.name,
+            "icon_source": exercise.icon_source,
+            "description": exercise.description,
+            "execution_instructions": exercise.execution_instructions,
+            "goal_label": record.goal_label,
+            "muscle_group": exercise.muscle_group,
+            "equipment": exercise.equipment,
+            "suitability_display": suitability_display,
+            "recommendation": record.recommendation,
+        }
+
     def apply_filters(self) -> None:
         """Apply current filters and refresh the browse list."""
-        # Build the filtered list with goal-aware grouping.
-        filtered: list[dict[str, str]] = []
-        goal_priority = {goal: idx for idx, goal in enumerate(exercise_database.GOALS)}
-        if self.filter_goal == "All":
-            grouped: dict[str, dict[str, Any]] = {}
-            for record in self.records:
-                if not record.get("name") or not record.get("description"):
-                    continue
-                if not self._record_matches_tag_filters(record):
-                    continue
-                existing = grouped.get(record["name"])
-                if not existing:
-                    grouped[record["name"]] = record
-                    continue
-                if record["rating"] > existing["rating"]:
-                    grouped[record["name"]] = record
-                elif record["rating"] == existing["rating"]:
-                    if goal_priority.get(record["goal"], 0) < goal_priority.get(existing["goal"], 0):
-                        grouped[record["name"]] = record
-            for record in sorted(grouped.values(), key=lambda r: r["name"]):
-                suitability_display = f'{record["goal_label"]} ({record["suitability_display"]})'
-                filtered.append(
-                    {
-                        "name": record["name"],
-                        "icon_source": record.get("icon_source", ""),
-                        "description": record["description"],
-                        "execution_instructions": record.get("execution_instructions", ""),
-                        "goal_label": record["goal_label"],
-                        "muscle_group": record["muscle_group"],
-                        "equipment": record["equipment"],
-                        "suitability_display": suitability_display,
-                        "recommendation": record["recommendation"],
-                    }
-                )
-        else:
-            for record in self.records:
-                if not record.get("name") or not record.get("description"):
-                    continue
-                if record["goal"] != self.filter_goal:
-                    continue
-                if not self._record_matches_tag_filters(record):
-                    continue
-                suitability_display = record["suitability_display"]
-                filtered.append(
-                    {
-                        "name": record["name"],
-                        "icon_source": record.get("icon_source", ""),
-                        "description": record["description"],
-                        "execution_instructions": record.get("execution_instructions", ""),
-                        "goal_label": record["goal_label"],
-                        "muscle_group": record["muscle_group"],
-                        "equipment": record["equipment"],
-                        "suitability_display": suitability_display,
-                        "recommendation": record["recommendation"],
-                    }
-                )
+        # Intersect the catalog's bitsets instead of visiting every record.
+        filter_bits = self._browse_filter_bits()
+        search_bits, muscle_bits, equipment_bits, goal_bits = filter_bits
+        filtered = [
+            self._browse_entry(record)
+            for record in self.catalog.records_for_bits(
+                search_bits & muscle_bits & equipment_bits & goal_bits, self._browse_search_rank
+            )
+        ]
+        self._refresh_filter_facets(filter_bits)
         exercise_list = self._browse_screen().ids.exercise_list
         # Clear first to avoid stale/blank items from previous data set.
         exercise_list.data = []
@@ -3113,11 +3768,50 @@ class RootWidget(BoxLayout):
         exercise_list.refresh_from_data()
         self.browse_empty = not filtered
 
+    def _refresh_filter_facets(self, filter_bits: tuple[int, int, int, int]) -> None:
+        """Show facet counts in the browse spinners, e.g. "Chest (12)"."""
+        # Each facet is counted under every other active filter, so a count is what picking it would show.
+        search_bits, muscle_bits, equipment_bits, goal_bits = filter_bits
+        goal_counts = self.catalog.facet_counts("goal", search_bits & muscle_bits & equipment_bits)
+        muscle_counts = self.catalog.facet_counts("muscle_groups", search_bits & equipment_bits & goal_bits)
+        equipment_counts = self.catalog.facet_counts("equipment_items", search_bits & muscle_bits & goal_bits)
+        # Selected spinners are relabelled too; the change handlers strip the count again.
+        self.goal_options = ["All goals"] + [
+            f"{label} ({goal_counts.get(code, 0)})" for label, code in self._goal_label_map.items()
+        ]
+        self.muscle_options = ["All muscle groups"] + [
+            f"{tag} ({muscle_counts.get(tag, 0)})" for tag in self.muscle_choice_options
+        ]
+        self.equipment_options = ["All equipment"] + [
+            f"{tag} ({equipment_counts.get(tag, 0)})" for tag in self.equipment_choice_options
+        ]
+        if self.filter_goal != "All":
+            label = self._goal_code_label_map.get(self.filter_goal, self.filter_goal)
+            self.goal_spinner_text = f"{label} ({goal_counts.get(self.filter_goal, 0)})"
+        if self.filter_muscle_group != "All":
+            self.muscle_spinner_text = f"{self.filter_muscle_group} ({muscle_counts.get(self.filter_muscle_group, 0)})"
+        if self.filter_equipment != "All":
+            self.equipment_spinner_text = f"{self.filter_equipment} ({equipment_counts.get(self.filter_equipment, 0)})"
+
     def _load_users(self) -> None:
-        """Load users from the database and refresh UI state."""
-        # Keep current user selection consistent across reloads.
+        """Load users from the database in the background and refresh UI state."""
+        # A newer reload supersedes one still running.
+        self.db_executor.submit(
+            self._fetch_user_rows,
+            key="users",
+            on_success=self._apply_users,
+            on_error=lambda exc: self._set_user_status(f"Could not load users: {exc}", error=True),
+        )
+
+    def _fetch_user_rows(self) -> list[tuple]:
+        """Query user rows; runs on a worker with its pooled connection."""
+        # fetch_users takes a connection rather than a database path.
         with exercise_database.get_connection() as conn:
-            rows = exercise_database.fetch_users(conn)
+            return exercise_database.fetch_users(conn)
+
+    def _apply_users(self, rows: list[tuple]) -> None:
+        """Replace the loaded users with fresh rows and refresh the selection."""
+        # Keep current user selection consistent across reloads.
         self._users = [
             {
                 "id": user_id,
@@ -3210,22 +3904,24 @@ class RootWidget(BoxLayout):
                 self._set_register_status("Select a valid goal option.", error=True)
                 return
 
-        try:
-            new_user_id = exercise_database.add_user(
-                username=username,
-                display_name=display_name,
-                preferred_goal=preferred_goal,
-            )
-        except ValueError as exc:
-            self._set_register_status(str(exc), error=True)
-            return
-        except sqlite3.IntegrityError:
-            self._set_register_status("Username already exists. Choose another.", error=True)
-            return
-        except sqlite3.DatabaseError as exc:
-            self._set_register_status(f"Database error: {exc}", error=True)
+        if "register" in self._saves_in_flight:
             return
+        self._submit_save(
+            "register",
+            self._change_monitor.acknowledge,
+            ("users",),
+            exercise_database.add_user,
+            username=username,
+            display_name=display_name,
+            preferred_goal=preferred_goal,
+            on_success=partial(self._user_registered, username),
+            on_error=self._register_failed,
+        )
 
+    def _user_registered(self, username: str, new_user_id: int) -> None:
+        """Clear the register form and switch to the new user."""
+        # The user list reloads in the background.
+        ids = self._register_screen().ids
         ids.register_username_input.text = ""
         ids.register_display_input.text = ""
         self.register_goal_spinner_text = "No goal"
@@ -3235,8 +3931,18 @@ class RootWidget(BoxLayout):
         self._set_register_status(f"User '{username}' registered.")
         self.go_home()
 
+    def _register_failed(self, exc: Exception) -> None:
+        """Report why a user could not be registered."""
+        # A unique-username violation gets a message of its own.
+        if isinstance(exc, sqlite3.IntegrityError):
+            self._set_register_status("Username already exists. Choose another.", error=True)
+        elif isinstance(exc, ValueError):
+            self._set_register_status(str(exc), error=True)
+        else:
+            self._set_register_status(f"Database error: {exc}", error=True)
+
     def save_user_profile(self) -> bool:
-        """Persist profile edits for the selected user."""
+        """Save profile edits for the selected user in the background; return True once submitted."""
         # Validate the name and goal selection before updating.
         if not self.current_user_id:
             self._set_user_profile_status("Select a user to update the profile.", error=True)
@@ -3251,20 +3957,28 @@ class RootWidget(BoxLayout):
             if not preferred_goal:
                 self._set_user_profile_status("Select a valid goal option.", error=True)
                 return False
-        try:
-            exercise_database.update_user_profile(
-                user_id=self.current_user_id,
-                display_name=display_name,
-                preferred_goal=preferred_goal,
-            )
-        except sqlite3.DatabaseError as exc:
-            self._set_user_profile_status(f"Database error: {exc}", error=True)
+        if "profile" in self._saves_in_flight:
             return False
+        self._submit_save(
+            "profile",
+            self._change_monitor.acknowledge,
+            ("users",),
+            exercise_database.update_user_profile,
+            user_id=self.current_user_id,
+            display_name=display_name,
+            preferred_goal=preferred_goal,
+            on_success=partial(self._profile_saved, display_name),
+            on_error=lambda exc: self._set_user_profile_status(f"Database error: {exc}", error=True),
+        )
+        return True
+
+    def _profile_saved(self, display_name: str, _result: Any) -> None:
+        """Show the saved profile and reload users in the background."""
+        # The goal spinner already shows the saved goal.
         self.current_user_display = display_name
         self._load_users()
         self._set_user_profile_status("Profile saved.")
         self._sync_recommendation_goal()
-        return True
 
     def on_user_selected(self, username: str) -> None:
         """Update state when a user is selected from the spinner."""
@@ -3294,7 +4008,7 @@ class RootWidget(BoxLayout):
     def _known_exercise_names(self) -> set[str]:
         """Return a set of known exercise names for validation."""
         # Normalize names to lower-case for comparisons.
-        return {record["name"].strip().lower() for record in self.records if record.get("name")}
+        return self.catalog.lower_names()
 
     def _validate_history_exercises(self, exercises: list[str]) -> Optional[str]:
         """Validate exercise names against known records."""
@@ -3471,69 +4185,119 @@ class RootWidget(BoxLayout):
         self._set_history_status(f"Added {selected}.")
         self.history_exercise_spinner_text = "Select exercise"
 
+    def _build_workout_card(self, entry: dict[str, Any]) -> WorkoutCard:
+        """Create a workout card widget for a history entry."""
+        # Convert stored values into display strings.
+        exercises_display = ", ".join(entry.get("exercises", [])) if entry.get("exercises") else "No exercises recorded"
+        attempts = entry.get("exercise_attempts") or []
+        attempts_display = (
+            "Attempts: "
+            + ", ".join(
+                f"{att.get('name', 'Exercise')} ({att.get('status', 'completed').title()})" for att in attempts
+            )
+            if attempts
+            else "Attempts: none recorded"
+        )
+        goal_display = entry.get("goal") or "—"
+        sets_display = str(entry.get("total_sets_completed") or 0)
+        duration_minutes = entry.get("duration_minutes") or 0
+        duration_seconds = entry.get("duration_seconds")
+        if duration_seconds is not None:
+            duration_display = f"{duration_minutes} min ({duration_seconds}s)"
+        else:
+            duration_display = f"{duration_minutes} min"
+        return WorkoutCard(
+            date_display=entry["performed_at"],
+            duration_display=duration_display,
+            exercises_display=exercises_display,
+            goal_display=goal_display,
+            sets_display=sets_display,
+            attempts_display=attempts_display,
+        )
+
+    def _set_history_loaded_status(self) -> None:
+        """Report how many workouts are shown and whether more pages exist."""
+        # Mention scrolling only while a continuation token is pending.
+        if not self._history_loaded_count:
+            self._set_history_status("No workouts in this date range.", error=False)
+        elif self._history_cursor:
+            self._set_history_status(f"{self._history_loaded_count} workout(s) loaded. Scroll down for more.")
+        else:
+            self._set_history_status(f"{self._history_loaded_count} workout(s) loaded.")
+
     def _load_history(self, *_: Any) -> None:
-        """Load workout history entries and update the history UI."""
+        """Load the first page of workout history and update the history UI."""
         # Fetch data from the database and rebuild cards.
         try:
             history_screen = self._history_screen()
         except Exception:
             return
 
+        self._history_cursor = None
+        self._history_loaded_count = 0
         if not self.current_user_id:
+            self.db_executor.cancel("history")
             history_list = history_screen.ids.history_list
             history_list.clear_widgets()
             self._set_history_status("Select or register a user to see history.", error=False)
             self._load_stats(clear=True)
             return
 
-        try:
-            history_entries = exercise_database.fetch_workout_history(
-                self.current_user_id,
-                start_date=self.history_start,
-                end_date=self.history_end,
-            )
-        except sqlite3.DatabaseError as exc:
-            self._set_history_status(f"Database error: {exc}", error=True)
+        # Superseding under the "history" key also drops any in-flight "load more" page.
+        self.db_executor.submit(
+            exercise_database.fetch_workout_history_page,
+            self.current_user_id,
+            page_size=HISTORY_PAGE_SIZE,
+            start_date=self.history_start,
+            end_date=self.history_end,
+            key="history",
+            on_success=partial(self._show_history_page, append=False),
+            on_error=self._history_load_failed,
+        )
+        self._load_stats()
+
+    def load_more_history(self) -> None:
+        """Append the next page of workout history, if any."""
+        # Continue from the stored keyset cursor; scroll events during a fetch are ignored.
+        if not self.current_user_id or not self._history_cursor or self.db_executor.pending("history"):
             return
+        self.db_executor.submit(
+            exercise_database.fetch_workout_history_page,
+            self.current_user_id,
+            cursor=self._history_cursor,
+            page_size=HISTORY_PAGE_SIZE,
+            start_date=self.history_start,
+            end_date=self.history_end,
+            key="history",
+            on_success=partial(self._show_history_page, append=True),
+            on_error=self._history_load_failed,
+        )
 
-        cards: list[WorkoutCard] = []
+    def _show_history_page(self, page: tuple[list[dict[str, Any]], Optional[str]], *, append: bool) -> None:
+        """Render a fetched history page, replacing or extending the list."""
+        # Runs on the main thread once the executor delivers the page.
+        history_entries, next_cursor = page
+        history_list = self._history_screen().ids.history_list
+        if not append:
+            history_list.clear_widgets()
+            self._history_loaded_count = 0
         for entry in history_entries:
-            exercises_display = ", ".join(entry.get("exercises", [])) if entry.get("exercises") else "No exercises recorded"
-            attempts = entry.get("exercise_attempts") or []
-            attempts_display = (
-                "Attempts: "
-                + ", ".join(
-                    f"{att.get('name', 'Exercise')} ({att.get('status', 'completed').title()})" for att in attempts
-                )
-                if attempts
-                else "Attempts: none recorded"
-            )
-            goal_display = entry.get("goal") or "—"
-            sets_display = str(entry.get("total_sets_completed") or 0)
-            duration_minutes = entry.get("duration_minutes") or 0
-            duration_seconds = entry.get("duration_seconds")
-            if duration_seconds is not None:
-                duration_display = f"{duration_minutes} min ({duration_seconds}s)"
-            else:
-                duration_display = f"{duration_minutes} min"
-            card = WorkoutCard(
-                date_display=entry["performed_at"],
-                duration_display=duration_display,
-                exercises_display=exercises_display,
-                goal_display=goal_display,
-                sets_display=sets_display,
-                attempts_display=attempts_display,
-            )
-            cards.append(card)
-        history_list = history_screen.ids.history_list
-        history_list.clear_widgets()
-        for card in cards:
-            history_list.add_widget(card)
-        if cards:
-            self._set_history_status(f"{len(cards)} workout(s) loaded.")
-        else:
-            self._set_history_status("No workouts in this date range.", error=False)
-        self._load_stats()
+            history_list.add_widget(self._build_workout_card(entry))
+        self._history_cursor = next_cursor
+        self._history_loaded_count += len(history_entries)
+        self._set_history_loaded_status()
+
+    def _history_load_failed(self, exc: Exception) -> None:
+        """Report a failed history fetch and stop paging."""
+        # A bad cursor or database error ends the current listing.
+        self._history_cursor = None
+        self._set_history_status(f"Database error: {exc}", error=True)
+
+    def on_history_scroll(self, scroll_view: Any) -> None:
+        """Load the next history page when the list is scrolled near the bottom."""
+        # scroll_y reaches 0 at the bottom of a Kivy ScrollView.
+        if self._history_cursor and scroll_view.scroll_y <= 0.05:
+            self.load_more_history()
 
     def apply_history_filter(self) -> None:
         """Apply date filters to the history list."""
@@ -3609,19 +4373,27 @@ class RootWidget(BoxLayout):
                 self._set_history_status("Total sets must be 0 or greater.", error=True)
                 return
 
-        try:
-            exercise_database.log_workout(
-                user_id=self.current_user_id,
-                performed_at=workout_date,
-                duration_minutes=duration_minutes,
-                exercises=exercises,
-                goal=goal,
-                total_sets_completed=total_sets_completed,
-            )
-        except (ValueError, sqlite3.DatabaseError) as exc:
-            self._set_history_status(str(exc), error=True)
+        if "workout" in self._saves_in_flight:
             return
+        self._set_history_status("Saving workout...")
+        self._submit_save(
+            "workout",
+            self._change_monitor.acknowledge,
+            ("history",),
+            exercise_database.log_workout,
+            user_id=self.current_user_id,
+            performed_at=workout_date,
+            duration_minutes=duration_minutes,
+            exercises=exercises,
+            goal=goal,
+            total_sets_completed=total_sets_completed,
+            on_success=self._workout_saved,
+            on_error=lambda exc: self._set_history_status(str(exc), error=True),
+        )
 
+    def _workout_saved(self, _workout_id: int) -> None:
+        """Reset the workout form and reload history after a save."""
+        # The reload is submitted only now so it sees the committed workout.
         self._set_history_status("Workout saved.")
         self._reset_workout_log_form(clear_status=False)
         self._load_history()
@@ -3631,20 +4403,26 @@ class RootWidget(BoxLayout):
         """Load and display workout statistics for the user."""
         # Optionally clear stats when no user is selected.
         if clear or not self.current_user_id:
+            self.db_executor.cancel("stats")
             self.stats_total_workouts = "0"
             self.stats_total_minutes = "0"
             self.stats_top_exercise = "—"
+            self._load_stats_series(clear=True)
             return
-        try:
-            stats = exercise_database.fetch_workout_stats(
-                self.current_user_id,
-                start_date=self.history_start,
-                end_date=self.history_end,
-            )
-        except sqlite3.DatabaseError as exc:
-            self._set_history_status(f"Database error while loading stats: {exc}", error=True)
-            return
+        self.db_executor.submit(
+            exercise_database.fetch_workout_stats,
+            self.current_user_id,
+            start_date=self.history_start,
+            end_date=self.history_end,
+            key="stats",
+            on_success=self._show_stats,
+            on_error=lambda exc: self._set_history_status(f"Database error while loading stats: {exc}", error=True),
+        )
+        self._load_stats_series()
 
+    def _show_stats(self, stats: dict[str, Any]) -> None:
+        """Display fetched workout statistics."""
+        # Runs on the main thread once the executor delivers the stats.
         self.stats_total_workouts = str(stats.get("total_workouts", 0))
         self.stats_total_minutes = str(stats.get("total_minutes", 0))
         top = stats.get("top_exercise")
@@ -3654,6 +4432,46 @@ class RootWidget(BoxLayout):
         else:
             self.stats_top_exercise = "—"
 
+    def set_stats_series_bucket(self, bucket: str) -> None:
+        """Switch the stats chart between weekly and monthly buckets."""
+        # Only the chart reloads; totals do not depend on the bucket size.
+        self.stats_series_bucket = bucket
+        self._load_stats_series()
+
+    def _load_stats_series(self, *, clear: bool = False) -> None:
+        """Load the sessions chart for the current user and history filter."""
+        # Without a filter the series covers the most recent twelve buckets.
+        if clear or not self.current_user_id:
+            self.db_executor.cancel("stats_series")
+            self.stats_series_values = []
+            self.stats_series_caption = ""
+            return
+        self.db_executor.submit(
+            exercise_database.fetch_workout_series,
+            self.current_user_id,
+            bucket=self.stats_series_bucket,
+            start_date=self.history_start,
+            end_date=self.history_end,
+            key="stats_series",
+            on_success=self._show_stats_series,
+            on_error=lambda exc: self._set_history_status(f"Could not load the stats chart: {exc}", error=True),
+        )
+
+    def _show_stats_series(self, series: list[dict[str, Any]]) -> None:
+        """Display a fetched workout series in the stats chart."""
+        # Runs on the main thread once the executor delivers the series.
+        self.stats_series_values = [point["sessions"] for point in series]
+        if not series:
+            self.stats_series_caption = ""
+            return
+        self.stats_series_caption = "{} to {}: {} sessions, {} min, {} sets".format(
+            series[0]["period_start"],
+            series[-1]["period_start"],
+            sum(point["sessions"] for point in series),
+            sum(point["minutes"] for point in series),
+            sum(point["sets"] for point in series),
+        )
+
     # --- Recommendation system ---
     def _set_rec_status(self, message: str, *, error: bool = False) -> None:
         """Update status banner in the recommendation screen."""
@@ -3749,23 +4567,14 @@ class RootWidget(BoxLayout):
             total_seconds += (len(plan_items) - 1) * rest_seconds
         return total_seconds
 
-    def _recency_days_map(self) -> dict[str, int]:
-        """Return a mapping of exercise name to days since last performed for current user."""
-        # Build a first-hit map from recent workout history.
+    def _recency_days_map(self) -> dict[int, int]:
+        """Return a mapping of catalog exercise id to days since last performed for current user."""
+        # Convert stored day numbers into day distances from today.
         if not self.current_user_id:
             return {}
-        rows = exercise_database.fetch_recent_exercise_usage(self.current_user_id, limit=200)
-        recency: dict[str, int] = {}
-        today = date.today()
-        for name, performed_at in rows:
-            if name in recency:
-                continue
-            try:
-                performed_date = date.fromisoformat(performed_at)
-                recency[name] = (today - performed_date).days
-            except Exception:
-                continue
-        return recency
+        last_days = exercise_database.fetch_exercise_last_performed_days(self.current_user_id)
+        today = exercise_database.day_number(date.today().isoformat())
+        return {exercise_id: today - last_day for exercise_id, last_day in last_days.items()}
 
     def _score_recommendation(self, record: dict[str, Any], recency_days: Optional[int]) -> float:
         """
@@ -3817,14 +4626,13 @@ class RootWidget(BoxLayout):
 
         recency_map = self._recency_days_map()
         recommendations = []
-        for record in self.records:
-            if record["goal"] != goal_code:
-                continue
-            if any(item["name"] == record["name"] for item in self.rec_plan):
+        planned_names = {item["name"] for item in self.rec_plan}
+        for record in self.catalog.for_goal(goal_code):
+            if record.exercise.name in planned_names:
                 continue
             est_seconds = self._estimate_exercise_seconds(record)
             est_minutes = self._minutes_from_seconds(est_seconds)
-            recency_days = recency_map.get(record["name"])
+            recency_days = recency_map.get(record.exercise.id)
             score = self._score_recommendation(
                 {"rating": float(record.get("rating", 0))}, recency_days
             )
@@ -3862,8 +4670,8 @@ class RootWidget(BoxLayout):
 
     def _find_recommendation(self, name: str) -> Optional[dict[str, Any]]:
         """Find a recommendation entry by exercise name."""
-        # Search the current recommendation list for a match.
-        return next((rec for rec in self.rec_recommendations if rec["name"] == name), None)
+        # The name index is rebuilt whenever rec_recommendations changes.
+        return self._recommendations_by_name.get(name)
 
     def _clear_recommendation_detail_modal(self, *_: Any) -> None:
         """Clear the cached recommendation detail modal reference."""
@@ -4018,12 +4826,12 @@ class RootWidget(BoxLayout):
         # Return the exercise to recommendations list in sorted order if it fits the current goal.
         if self.rec_goal_spinner_text:
             goal_code = self._goal_label_map.get(self.rec_goal_spinner_text)
-            match = next((r for r in self.records if r["name"] == name and r["goal"] == goal_code), None)
+            match = self.catalog.record(name, goal_code) if goal_code else None
             if match:
                 est_seconds = self._estimate_exercise_seconds(match)
                 est_minutes = self._minutes_from_seconds(est_seconds)
                 recency_map = self._recency_days_map()
-                recency_days = recency_map.get(match["name"])
+                recency_days = recency_map.get(match.exercise.id)
                 score = self._score_recommendation({"rating": float(match.get("rating", 0))}, recency_days)
                 self.rec_recommendations.append(
                     {
@@ -4114,9 +4922,8 @@ class RootWidget(BoxLayout):
             return
         session_plan: list[dict[str, Any]] = []
         missing: list[str] = []
-        name_to_record = {r["name"]: r for r in self.records}
         for item in self.rec_plan:
-            record = name_to_record.get(item["name"])
+            record = self.catalog.record(item["name"], self._goal_label_map.get(item.get("goal_label", "")))
             if not record:
                 missing.append(item["name"])
                 continue
@@ -4170,11 +4977,71 @@ class RootWidget(BoxLayout):
         self.status_color = (0.65, 0.16, 0.16, 1) if error else (0.14, 0.4, 0.2, 1)
 
     def _refresh_records(self) -> None:
-        """Reload exercise records and refresh filter state."""
+        """Reload exercise records in the background and refresh filter state."""
         # Keep browse/add screens in sync with the database.
-        self.records = self._load_records()
+        self.db_executor.submit(
+            exercise_database.query_exercises,
+            key="records",
+            on_success=self._apply_records,
+            on_error=lambda exc: self._set_status(f"Database error: {exc}", error=True),
+        )
+
+    def _submit_save(
+        self,
+        name: str,
+        fn: Callable[..., Any],
+        *args: Any,
+        on_success: Callable[[Any], None],
+        on_error: Callable[[Exception], None],
+        **kwargs: Any,
+    ) -> None:
+        """Submit a save without a key, marking name as in flight until a callback runs."""
+        # Saves are never superseded or cancelled at shutdown; the flag only blocks double taps.
+        self._saves_in_flight.add(name)
+
+        def settle(callback: Callable[[Any], None]) -> Callable[[Any], None]:
+            """Wrap a callback so it clears the in-flight flag first."""
+            # Runs on the main thread like the wrapped callback.
+            def run(value: Any) -> None:
+                """Clear the flag, then deliver value."""
+                # Cleared first so the callback may start another save.
+                self._saves_in_flight.discard(name)
+                callback(value)
+
+            return run
+
+        self.db_executor.submit(fn, *args, on_success=settle(on_success), on_error=settle(on_error), **kwargs)
+
+    def _poll_changes(self, *_: Any) -> None:
+        """Check in the background whether another connection changed the database."""
+        # A poll still running (e.g. on a slow network volume) makes this tick a no-op.
+        if self.db_executor.pending("change_poll"):
+            return
+        self.db_executor.submit(
+            self._change_monitor.poll,
+            key="change_poll",
+            on_success=self._apply_changes,
+            # A failed poll is simply retried on the next tick.
+            on_error=lambda _exc: None,
+        )
+
+    def _apply_changes(self, topics: list[str]) -> None:
+        """Reload only the in-memory state whose tables were changed elsewhere."""
+        # This kiosk's own saves go through ChangeMonitor.acknowledge and are not reported.
+        if "catalog" in topics:
+            self._refresh_records()
+        if "users" in topics:
+            # _load_users reloads the selected user's history as well.
+            self._load_users()
+        elif "history" in topics:
+            self._load_history()
+
+    def _apply_records(self, rows: list[tuple]) -> None:
+        """Replace loaded records with freshly queried rows."""
+        # Runs on the main thread once the executor delivers the rows.
+        self.catalog = self._load_catalog(rows)
         self._update_filter_options()
-        self.apply_filters()
+        self._run_browse_search()
 
     def _reset_form(self) -> None:
         """Clear add-exercise form fields and restore defaults."""
@@ -4226,7 +5093,7 @@ class RootWidget(BoxLayout):
             self._set_status("Choose equipment from the known list.", error=True)
             return
 
-        if any(r["name"].lower() == name.lower() for r in self.records):
+        if self.catalog.has_name(name):
             self._set_status("Exercise name already exists. Choose another name.", error=True)
             return
 
@@ -4246,31 +5113,79 @@ class RootWidget(BoxLayout):
             self._set_status(str(exc), error=True)
             return
 
-        try:
-            exercise_database.add_exercise(
-                name=name,
-                short_description=description,
-                execution_instructions=instructions,
-                required_equipment=equipment,
-                target_muscle_group=muscle_group,
-                goal=goal,
-                suitability_rating=rating,
-                recommended_sets=sets,
-                recommended_reps_per_set=reps,
-                recommended_time_seconds=time_seconds,
-                icon=icon,
-            )
-        except sqlite3.IntegrityError:
-            self._set_status("Exercise name already exists. Choose another name.", error=True)
-            return
-        except sqlite3.DatabaseError as exc:
-            self._set_status(f"Database error: {exc}", error=True)
+        if "exercise" in self._saves_in_flight:
             return
+        self._set_status("Saving exercise...")
+        self._submit_save(
+            "exercise",
+            self._change_monitor.acknowledge,
+            ("catalog",),
+            exercise_database.add_exercise_rows,
+            name=name,
+            short_description=description,
+            execution_instructions=instructions,
+            required_equipment=equipment,
+            target_muscle_group=muscle_group,
+            goal=goal,
+            suitability_rating=rating,
+            recommended_sets=sets,
+            recommended_reps_per_set=reps,
+            recommended_time_seconds=time_seconds,
+            icon=icon,
+            on_success=self._exercise_saved,
+            on_error=self._exercise_save_failed,
+        )
 
+    def _exercise_saved(self, rows: list[tuple]) -> None:
+        """Reset the add form and patch the saved exercise into the loaded catalog."""
+        # add_exercise_rows hands back the new rows, so no full reload is needed.
         self._set_status("Exercise added.")
-        self._refresh_records()
+        self._apply_added_exercise(rows)
         self._reset_form()
 
+    def _apply_added_exercise(self, rows: list[tuple]) -> None:
+        """Apply a new exercise to the catalog, filter options and browse list as deltas."""
+        # Work here scales with the new exercise and the tag lists, not with the catalog.
+        added = self.catalog.add_rows(rows)
+        if not added:
+            return
+        exercise = added[0].exercise
+        new_muscles = exercise.muscle_groups.difference(self.muscle_choice_options)
+        if new_muscles:
+            self.muscle_choice_options = sorted([*self.muscle_choice_options, *new_muscles])
+            self.muscle_choice_display = ", ".join(self.muscle_choice_options)
+        new_equipment = exercise.equipment_items.difference(self.equipment_choice_options)
+        if new_equipment:
+            self.equipment_choice_options = sorted([*self.equipment_choice_options, *new_equipment])
+            self.equipment_choice_display = ", ".join(self.equipment_choice_options)
+        bisect.insort(self.history_exercise_options, exercise.name)
+        query = self.history_exercise_filter.strip().lower()
+        if not query or query in exercise.name.lower():
+            bisect.insort(self.history_exercise_filtered_options, exercise.name)
+            if self.history_exercise_spinner_text in {"No matches", "No exercises"}:
+                self.history_exercise_spinner_text = "Select exercise"
+        if self._browse_search_rank is not None:
+            # Where the new exercise ranks for the query is only known after searching again.
+            self._run_browse_search()
+            return
+        filter_bits = self._browse_filter_bits()
+        search_bits, muscle_bits, equipment_bits, goal_bits = filter_bits
+        visible = search_bits & muscle_bits & equipment_bits & goal_bits & self.catalog.search_bits([exercise.id])
+        exercise_list = self._browse_screen().ids.exercise_list
+        for record in self.catalog.records_for_bits(visible):
+            entry = self._browse_entry(record)
+            exercise_list.data.insert(bisect.bisect(exercise_list.data, entry["name"], key=lambda item: item["name"]), entry)
+            self.browse_empty = False
+        self._refresh_filter_facets(filter_bits)
+
+    def _exercise_save_failed(self, exc: Exception) -> None:
+        """Report why an exercise could not be saved."""
+        # A unique-name violation gets the same message as the in-memory duplicate check.
+        if isinstance(exc, sqlite3.IntegrityError):
+            self._set_status("Exercise name already exists. Choose another name.", error=True)
+        else:
+            self._set_status(f"Database error: {exc}", error=True)
+
     def go_home(self) -> None:
         """Navigate to the home screen after user validation."""
         # Require a current user to access app content.
@@ -4367,6 +5282,7 @@ class RootWidget(BoxLayout):
     def start_new_session(self) -> None:
         """Reset live state and return to recommendations."""
         # Ensure live state is cleared for a fresh session.
+        self._discard_live_journal()
         self.live_active = False
         self.live_paused = False
         self.go_recommend()
@@ -4462,6 +5378,7 @@ class RootWidget(BoxLayout):
         normalized_status = "skipped" if status == "skipped" else "completed"
         name = exercise.get("name", "Exercise")
         self._live_attempt_log.append({"name": name, "status": normalized_status})
+        self._journal_live(lambda journal: journal.record_exercise(name, normalized_status))
         if normalized_status == "skipped":
             self._live_skipped.append(name)
         else:
@@ -4511,6 +5428,7 @@ class RootWidget(BoxLayout):
         self.live_started = True
         self.live_paused = False
         self._live_session_started_at = datetime.now()
+        self._open_live_journal(self._live_session_started_at.isoformat(timespec="seconds"))
         self._set_hint("Session started. Begin your first set!", color=(0.18, 0.4, 0.2, 1))
         self._flash_signal("Session started", color=(0.16, 0.32, 0.6, 1))
         self._update_live_labels()
@@ -4694,6 +5612,8 @@ class RootWidget(BoxLayout):
         self._live_completed = []
         self._live_skipped = []
         self._live_attempt_log = []
+        # A session replaced before it finished is abandoned, not logged.
+        self._discard_live_journal()
         self._live_goal_label = self.rec_goal_spinner_text or ""
         self._live_total_sets_completed = 0
         self._live_current_logged = False
@@ -4800,6 +5720,7 @@ class RootWidget(BoxLayout):
         if not exercise or not self.live_active:
             return
         self._live_total_sets_completed += 1
+        self._journal_live(lambda journal: journal.record_set(exercise.get("name", "Exercise")))
         total_sets = exercise.get("sets") or 1
         if self._live_current_set >= total_sets:
             self._start_between_exercise_rest(skipped=False)
@@ -4992,27 +5913,115 @@ class RootWidget(BoxLayout):
         self.summary_goal_display = self._live_goal_label or "—"
         self.summary_performed_at_display = performed_at
 
-    def _log_live_workout(self, duration_seconds: int, performed_at: str, attempts: list[dict[str, str]]) -> None:
-        """Persist live session results to the database."""
-        # Reuse the workout logging API with live session details.
+    def _open_live_journal(self, started_at: str) -> None:
+        """Start a durable journal for the live session of the current user."""
+        # Sessions still run without a journal if the file cannot be created.
         if not self.current_user_id:
             return
-        exercise_names = [att.get("name", "Exercise") for att in attempts]
-        duration_minutes = int(max(1, (duration_seconds + 59) // 60)) if duration_seconds else 1
         try:
-            exercise_database.log_workout(
-                user_id=self.current_user_id,
-                performed_at=performed_at,
-                duration_minutes=duration_minutes,
-                exercises=exercise_names,
+            self._live_journal = exercise_database.SessionJournal.start(
+                self.current_user_id,
+                started_at=started_at,
                 goal=self._live_goal_label or "",
-                duration_seconds=duration_seconds or duration_minutes * 60,
-                total_sets_completed=self._live_total_sets_completed,
-                exercise_statuses=[(att.get("name", "Exercise"), att.get("status", "completed")) for att in attempts],
             )
-        except (ValueError, sqlite3.DatabaseError) as exc:
-            self._set_history_status(f"Could not log workout: {exc}", error=True)
+        except OSError as exc:
+            self._live_journal = None
+            self._set_hint(f"Session journal unavailable: {exc}", color=(0.65, 0.3, 0.18, 1))
+
+    def _discard_live_journal(self) -> None:
+        """Delete the journal of a live session that will not be logged."""
+        # discard() sets the file aside when it cannot be deleted, so replay does not log it.
+        if self._live_journal is not None:
+            self._live_journal.discard()
+            self._live_journal = None
+
+    def _close_live_journal(self) -> None:
+        """Close the journal of a live session that is interrupted, keeping it for replay."""
+        # The next initialize_database logs the session from what was journaled so far.
+        if self._live_journal is not None:
+            self._live_journal.close()
+            self._live_journal = None
+
+    def _journal_live(self, write: Callable[[exercise_database.SessionJournal], None]) -> None:
+        """Append to the live session journal, discarding the journal after an I/O error."""
+        # The in-memory attempt log remains the source for the final save.
+        if self._live_journal is None:
+            return
+        try:
+            write(self._live_journal)
+        except OSError as exc:
+            self._discard_live_journal()
+            self._set_hint(f"Session journal unavailable: {exc}", color=(0.65, 0.3, 0.18, 1))
+
+    def _log_live_workout(self, duration_seconds: int, performed_at: str, attempts: list[dict[str, str]]) -> None:
+        """Journal live session results and flush them to the database in the background."""
+        # The journal is finished synchronously; the database write happens on the executor.
+        if not self.current_user_id:
             return
+        exercise_names = [att.get("name", "Exercise") for att in attempts]
+        duration_minutes = int(max(1, (duration_seconds + 59) // 60)) if duration_seconds else 1
+        statuses = [(att.get("name", "Exercise"), att.get("status", "completed")) for att in attempts]
+        if self._live_journal is None:
+            self._open_live_journal(performed_at)
+        journal, self._live_journal = self._live_journal, None
+        if journal is not None:
+            try:
+                journal_path = journal.finish(
+                    performed_at=performed_at,
+                    duration_seconds=duration_seconds or duration_minutes * 60,
+                    total_sets_completed=self._live_total_sets_completed,
+                    attempts=statuses,
+                )
+            except OSError as exc:
+                # The end record may have reached the disk; only save directly once the file is gone.
+                if not journal.discard():
+                    self._set_history_status(
+                        f"Could not write the session journal: {exc}. "
+                        "It will be logged from the journal on the next start.",
+                        error=True,
+                    )
+                    return
+            else:
+                self.db_executor.submit(
+                    self._change_monitor.acknowledge,
+                    ("history",),
+                    exercise_database.flush_session_journal,
+                    journal_path,
+                    on_success=self._live_workout_logged,
+                    on_error=lambda exc: self._live_journal_failed(journal_path, exc),
+                )
+                return
+        self.db_executor.submit(
+            self._change_monitor.acknowledge,
+            ("history",),
+            exercise_database.log_workout,
+            user_id=self.current_user_id,
+            performed_at=performed_at,
+            duration_minutes=duration_minutes,
+            exercises=exercise_names,
+            goal=self._live_goal_label or "",
+            duration_seconds=duration_seconds or duration_minutes * 60,
+            total_sets_completed=self._live_total_sets_completed,
+            exercise_statuses=statuses,
+            on_success=self._live_workout_logged,
+            on_error=lambda exc: self._set_history_status(f"Could not log workout: {exc}", error=True),
+        )
+
+    def _live_journal_failed(self, journal_path: Path, exc: Exception) -> None:
+        """Report a failed journal flush, setting the journal aside when a retry cannot succeed."""
+        # Other database and file errors (e.g. a locked file) leave the journal for replay on the next start.
+        if not isinstance(exc, exercise_database.SESSION_JOURNAL_REJECT_ERRORS):
+            self._set_history_status(f"Could not log workout: {exc}. It will be retried on the next start.", error=True)
+            return
+        try:
+            kept = exercise_database.set_aside_session_journal(journal_path).name
+        except OSError:
+            kept = journal_path.name
+        self._set_history_status(f"Could not log workout: {exc}. The session journal was kept as {kept}.", error=True)
+
+    def _live_workout_logged(self, _workout_id: Optional[int]) -> None:
+        """Report a saved live session and reload history."""
+        # Live saves have no key, so they are never superseded.
         self._set_history_status("Workout logged from live session.")
         self._load_history()
 
@@ -5027,6 +6036,15 @@ class ExerciseApp(App):
         Builder.load_string(KV)
         return RootWidget()
 
+    def on_stop(self):
+        """Finish background database work and release pooled connections on shutdown."""
+        # Let running saves commit, then close connections so WAL content is checkpointed cleanly.
+        if isinstance(self.root, RootWidget):
+            # A running live session is interrupted, not abandoned: its journal is replayed on the next start.
+            self.root._close_live_journal()
+            self.root.db_executor.shutdown()
+        exercise_database.close_all()
+
 
 if __name__ == "__main__":
     ExerciseApp().run()
@@ -1,5 +1,9 @@
+import json
 import os
+import sqlite3
 import tempfile
+import threading
+import time
 import unittest
 from pathlib import Path
 from types import MethodType, SimpleNamespace
@@ -10,7 +14,7 @@ os.environ.setdefault("KIVY_WINDOW", "mock")
 os.environ.setdefault("KIVY_NO_FILELOG", "1")
 
 import exercise_database
-from main import RootWidget
+from main import DatabaseExecutor, ExerciseCatalog, RootWidget
 
 
 class RecommendationLogicTests(unittest.TestCase):
@@ -161,6 +165,1091 @@ class HistoryAndStatsTests(unittest.TestCase):
             self.assertEqual(stats["top_exercise"], "Jump Rope")
             self.assertEqual(stats["top_exercise_count"], 2)
 
+    def test_stats_rollup_tracks_inserts_and_deletes(self) -> None:
+        """Ensure trigger-maintained rollups match a full recomputation."""
+        # Compare rollup-backed stats with a range query and the consistency check.
+        with tempfile.TemporaryDirectory() as tmpdir:
+            db_path = Path(tmpdir) / "test.db"
+            exercise_database.initialize_database(db_path)
+            user_id = exercise_database.add_user("erin", db_path=db_path)
+            first_id = exercise_database.log_workout(
+                user_id=user_id,
+                performed_at="2024-04-01",
+                duration_minutes=30,
+                exercises=["Plank", "Plank", "Push-Up"],
+                db_path=db_path,
+            )
+            exercise_database.log_workout(
+                user_id=user_id,
+                performed_at="2024-04-02",
+                duration_minutes=20,
+                exercises=["Push-Up"],
+                db_path=db_path,
+            )
+            rollup = exercise_database.fetch_workout_stats(user_id, db_path=db_path)
+            ranged = exercise_database.fetch_workout_stats(user_id, start_date="2000-01-01", db_path=db_path)
+            self.assertEqual(rollup, ranged)
+            self.assertEqual(rollup["top_exercise"], "Plank")
+
+            conn = exercise_database.get_connection(db_path)
+            with conn:
+                conn.execute("DELETE FROM workouts WHERE id = ?;", (first_id,))
+            self.assertEqual(exercise_database.check_stats_rollup(conn), [])
+            stats = exercise_database.fetch_workout_stats(user_id, db_path=db_path)
+            self.assertEqual((stats["total_workouts"], stats["total_minutes"]), (1, 20))
+            self.assertEqual((stats["top_exercise"], stats["top_exercise_count"]), ("Push-Up", 1))
+
+            other_id = exercise_database.add_user("frank", db_path=db_path)
+            with conn:
+                conn.execute("UPDATE workouts SET user_id = ?, duration_minutes = 25 WHERE user_id = ?;", (other_id, user_id))
+                conn.execute(
+                    "UPDATE workout_exercises SET exercise_name = 'Plank', "
+                    "exercise_id = (SELECT id FROM exercises WHERE name = 'Plank') WHERE exercise_name = 'Push-Up';"
+                )
+            self.assertEqual(exercise_database.check_stats_rollup(conn), [])
+            stats = exercise_database.fetch_workout_stats(other_id, db_path=db_path)
+            self.assertEqual((stats["total_minutes"], stats["top_exercise"]), (25, "Plank"))
+
+            with conn:
+                conn.execute("UPDATE user_stats SET total_minutes = 0;")
+            self.assertTrue(exercise_database.check_stats_rollup(conn))
+            exercise_database.rebuild_stats_rollup(conn)
+            self.assertEqual(exercise_database.check_stats_rollup(conn), [])
+            exercise_database.close_all()
+
+    def test_workout_exercises_link_catalog_ids(self) -> None:
+        """Ensure catalog names link by id while the entered text is preserved."""
+        # Mix case variants with an unknown name and check stats and recency.
+        with tempfile.TemporaryDirectory() as tmpdir:
+            db_path = Path(tmpdir) / "test.db"
+            exercise_database.initialize_database(db_path)
+            user_id = exercise_database.add_user("frank", db_path=db_path)
+            exercise_database.log_workout(
+                user_id=user_id,
+                performed_at="2024-06-01",
+                duration_minutes=20,
+                exercises=["push-up", "Mystery Move"],
+                db_path=db_path,
+            )
+            exercise_database.log_workout(
+                user_id=user_id,
+                performed_at="2024-06-03",
+                duration_minutes=20,
+                exercises=["Push-Up"],
+                db_path=db_path,
+            )
+            conn = exercise_database.get_connection(db_path)
+            rows = conn.execute(
+                """
+                SELECT we.exercise_id, we.exercise_name
+                FROM workout_exercises we JOIN workouts w ON w.id = we.workout_id
+                WHERE w.user_id = ?
+                ORDER BY we.id;
+                """,
+                (user_id,),
+            ).fetchall()
+            push_up_id = conn.execute("SELECT id FROM exercises WHERE name = 'Push-Up';").fetchone()[0]
+            self.assertEqual(rows, [(push_up_id, "push-up"), (None, "Mystery Move"), (push_up_id, "Push-Up")])
+            counts = conn.execute(
+                "SELECT exercise_id, free_text, attempt_count FROM user_exercise_counts WHERE user_id = ? "
+                "ORDER BY exercise_id;",
+                (user_id,),
+            ).fetchall()
+            self.assertEqual(counts, [(0, "Mystery Move", 1), (push_up_id, "", 2)])
+
+            for start_date in (None, "2024-06-01"):
+                stats = exercise_database.fetch_workout_stats(user_id, start_date=start_date, db_path=db_path)
+                self.assertEqual((stats["top_exercise"], stats["top_exercise_count"]), ("Push-Up", 2))
+            last_days = exercise_database.fetch_exercise_last_performed_days(user_id, db_path=db_path)
+            self.assertEqual(last_days, {push_up_id: exercise_database.day_number("2024-06-03")})
+            self.assertEqual(exercise_database.check_stats_rollup(conn), [])
+            exercise_database.close_all()
+
+    def test_last_performed_table_tracks_full_history(self) -> None:
+        """Ensure recency covers old exercises and follows workout deletes."""
+        # Bury one exercise under more than 200 newer attempts, then delete its latest workout.
+        with tempfile.TemporaryDirectory() as tmpdir:
+            db_path = Path(tmpdir) / "test.db"
+            exercise_database.initialize_database(db_path)
+            user_id = exercise_database.add_user("gail", db_path=db_path)
+            for performed_at in ("2024-01-05", "2024-01-10"):
+                exercise_database.log_workout(
+                    user_id=user_id,
+                    performed_at=performed_at,
+                    duration_minutes=15,
+                    exercises=["Plank", "Plank"],
+                    db_path=db_path,
+                )
+            exercise_database.log_workouts_bulk(
+                [
+                    {"user_id": user_id, "performed_at": "2024-03-01", "duration_minutes": 10, "exercises": ["Push-Up"] * 3}
+                    for _ in range(80)
+                ],
+                db_path=db_path,
+            )
+            conn = exercise_database.get_connection(db_path)
+            plank_id = conn.execute("SELECT id FROM exercises WHERE name = 'Plank';").fetchone()[0]
+            last_days = exercise_database.fetch_exercise_last_performed_days(user_id, db_path=db_path)
+            self.assertEqual(last_days[plank_id], exercise_database.day_number("2024-01-10"))
+            times = conn.execute(
+                "SELECT times_performed FROM user_exercise_last_performed WHERE user_id = ? AND exercise_id = ?;",
+                (user_id, plank_id),
+            ).fetchone()[0]
+            self.assertEqual(times, 2)
+
+            conn.execute("DELETE FROM workouts WHERE user_id = ? AND performed_at = '2024-01-10';", (user_id,))
+            conn.commit()
+            last_days = exercise_database.fetch_exercise_last_performed_days(user_id, db_path=db_path)
+            self.assertEqual(last_days[plank_id], exercise_database.day_number("2024-01-05"))
+            self.assertEqual(exercise_database.check_stats_rollup(conn), [])
+            exercise_database.close_all()
+
+    def test_history_packs_attempts_in_order(self) -> None:
+        """Ensure aggregated history keeps attempt order, statuses and empty workouts."""
+        # A workout whose exercise rows are removed must still appear with empty lists.
+        with tempfile.TemporaryDirectory() as tmpdir:
+            db_path = Path(tmpdir) / "test.db"
+            exercise_database.initialize_database(db_path)
+            user_id = exercise_database.add_user("alice", db_path=db_path)
+            exercise_database.log_workout(
+                user_id=user_id,
+                performed_at="2024-03-02",
+                duration_minutes=30,
+                exercises=["Squat", "Push-Up", "Squat"],
+                exercise_statuses=[("Squat", "completed"), ("Push-Up", "skipped"), ("Squat", "completed")],
+                db_path=db_path,
+            )
+            empty_id = exercise_database.log_workout(
+                user_id=user_id, performed_at="2024-03-01", duration_minutes=10, exercises=["Plank"], db_path=db_path
+            )
+            conn = exercise_database.get_connection(db_path)
+            conn.execute("DELETE FROM workout_exercises WHERE workout_id = ?;", (empty_id,))
+            conn.commit()
+
+            newest, oldest = exercise_database.fetch_workout_history(user_id, db_path=db_path)
+            self.assertEqual(newest["exercises"], ["Squat", "Push-Up", "Squat"])
+            self.assertEqual(
+                [attempt["status"] for attempt in newest["exercise_attempts"]],
+                ["completed", "skipped", "completed"],
+            )
+            self.assertEqual((oldest["exercises"], oldest["exercise_attempts"]), ([], []))
+            page, _ = exercise_database.fetch_workout_history_page(user_id, page_size=2, db_path=db_path)
+            self.assertEqual(page, [newest, oldest])
+            exercise_database.close_all()
+
+    def test_workout_series_is_dense_and_refreshes_after_logging(self) -> None:
+        """Validate weekly and monthly buckets, zero filling and cache refresh."""
+        # New workouts and edits that leave the stats rollup unchanged must both refresh the series.
+        with tempfile.TemporaryDirectory() as tmpdir:
+            db_path = Path(tmpdir) / "test.db"
+            exercise_database.initialize_database(db_path)
+            user_id = exercise_database.add_user("alice", db_path=db_path)
+            exercise_database.log_workout(
+                user_id=user_id,
+                performed_at="2024-01-03T18:30:00",
+                duration_minutes=30,
+                exercises=["Squat"],
+                total_sets_completed=4,
+                db_path=db_path,
+            )
+
+            weekly = exercise_database.fetch_workout_series(
+                user_id, start_date="2024-01-01", end_date="2024-01-21", db_path=db_path
+            )
+            self.assertEqual([point["period_start"] for point in weekly], ["2024-01-01", "2024-01-08", "2024-01-15"])
+            self.assertEqual([point["sessions"] for point in weekly], [1, 0, 0])
+            self.assertEqual((weekly[0]["minutes"], weekly[0]["sets"]), (30, 4))
+
+            exercise_database.log_workout(
+                user_id=user_id, performed_at="2024-01-16", duration_minutes=20, exercises=["Plank"], db_path=db_path
+            )
+            weekly = exercise_database.fetch_workout_series(
+                user_id, start_date="2024-01-01", end_date="2024-01-21", db_path=db_path
+            )
+            self.assertEqual([point["sessions"] for point in weekly], [1, 0, 1])
+            conn = exercise_database.get_connection(db_path)
+            conn.execute("UPDATE workouts SET total_sets_completed = 6 WHERE user_id = ? AND duration_minutes = 30;", (user_id,))
+            conn.commit()
+            weekly = exercise_database.fetch_workout_series(
+                user_id, start_date="2024-01-01", end_date="2024-01-21", db_path=db_path
+            )
+            self.assertEqual(weekly[0]["sets"], 6)
+            monthly = exercise_database.fetch_workout_series(
+                user_id, bucket="month", end_date="2024-03-10", periods=3, db_path=db_path
+            )
+            self.assertEqual(
+                [(point["period_start"], point["minutes"]) for point in monthly],
+                [("2024-01-01", 50), ("2024-02-01", 0), ("2024-03-01", 0)],
+            )
+            with self.assertRaises(ValueError):
+                exercise_database.fetch_workout_series(user_id, bucket="day", db_path=db_path)
+            exercise_database.close_all()
+
+    def test_history_range_includes_timestamped_live_sessions(self) -> None:
+        """Ensure ISO timestamps fall inside a single-day range filter."""
+        # Live sessions store full timestamps while manual logs store dates; an offset keeps the local day.
+        with tempfile.TemporaryDirectory() as tmpdir:
+            db_path = Path(tmpdir) / "test.db"
+            exercise_database.initialize_database(db_path)
+            user_id = exercise_database.add_user("carol", db_path=db_path)
+            exercise_database.log_workout(
+                user_id=user_id,
+                performed_at="2024-05-03T22:30:00-05:00",
+                duration_minutes=15,
+                exercises=["Plank"],
+                db_path=db_path,
+            )
+            entries = exercise_database.fetch_workout_history(
+                user_id,
+                start_date="2024-05-03",
+                end_date="2024-05-03",
+                db_path=db_path,
+            )
+            self.assertEqual(len(entries), 1)
+
+            conn = exercise_database.get_connection(db_path)
+            sql_day = conn.execute("SELECT performed_day FROM workouts WHERE user_id = ?;", (user_id,)).fetchone()[0]
+            backfilled = conn.execute(
+                f"SELECT {exercise_database._DAY_NUMBER_SQL} FROM workouts WHERE user_id = ?;",
+                (user_id,),
+            ).fetchone()[0]
+            self.assertEqual(sql_day, backfilled)
+            plan = conn.execute(
+                "EXPLAIN QUERY PLAN SELECT id FROM workouts w WHERE w.user_id = ? AND w.performed_day >= ?;",
+                (user_id, sql_day),
+            ).fetchall()
+            self.assertIn("idx_workouts_user_day", " ".join(str(row[-1]) for row in plan))
+            exercise_database.close_all()
+
+    def test_query_cache_serves_repeats_until_writes(self) -> None:
+        """Ensure repeated reads hit the cache and logging, profile or catalog edits invalidate it."""
+        # Hits return equal but independent results; every write bumps the data version.
+        exercise_database.clear_query_cache()
+        with tempfile.TemporaryDirectory() as tmpdir:
+            db_path = Path(tmpdir) / "test.db"
+            exercise_database.initialize_database(db_path)
+            user_id = exercise_database.add_user("dave", db_path=db_path)
+            exercise_database.log_workout(
+                user_id=user_id, performed_at="2024-05-01", duration_minutes=20, exercises=["Plank"], db_path=db_path
+            )
+            first = exercise_database.fetch_workout_history(user_id, db_path=db_path)
+            first[0]["exercises"].append("Mutated")
+            self.assertEqual(exercise_database.fetch_workout_history(user_id, db_path=db_path)[0]["exercises"], ["Plank"])
+            self.assertEqual(exercise_database.fetch_workout_stats(user_id, db_path=db_path)["total_workouts"], 1)
+            self.assertEqual(
+                exercise_database.query_cache_stats(),
+                {"hits": 1, "misses": 2, "evictions": 0, "size": 2, "maxsize": exercise_database.QUERY_CACHE_SIZE},
+            )
+
+            exercise_database.log_workout(
+                user_id=user_id, performed_at="2024-05-02", duration_minutes=30, exercises=["Plank"], db_path=db_path
+            )
+            self.assertEqual(exercise_database.fetch_workout_stats(user_id, db_path=db_path)["total_workouts"], 2)
+            usage = exercise_database.fetch_recent_exercise_usage(user_id, db_path=db_path)
+            exercise_database.update_user_profile(
+                user_id=user_id, display_name="Dave", preferred_goal=None, db_path=db_path
+            )
+            self.assertEqual(exercise_database.fetch_recent_exercise_usage(user_id, db_path=db_path), usage)
+            self.assertEqual(exercise_database.query_cache_stats()["hits"], 1)
+            self.assertEqual(exercise_database.fetch_workout_stats(user_id, db_path=db_path)["top_exercise"], "Plank")
+            conn = exercise_database.get_connection(db_path)
+            with conn:
+                conn.execute("UPDATE catalog.exercises SET name = 'Forearm Plank' WHERE name = 'Plank';")
+            self.assertEqual(exercise_database.fetch_workout_stats(user_id, db_path=db_path)["top_exercise"], "Forearm Plank")
+
+            cache = exercise_database.QueryCache(maxsize=2)
+            for key in ("a", "b", "c"):
+                cache.put((key,), (1,), key)
+            self.assertEqual(cache.get(("a",), (1,)), (False, None))
+            self.assertEqual(cache.get(("c",), (2,)), (False, None))
+            self.assertEqual(cache.get(("c",), (1,)), (True, "c"))
+            self.assertEqual((cache.hits, cache.misses, cache.evictions), (1, 2, 1))
+            exercise_database.close_all()
+        exercise_database.clear_query_cache()
+
+
+class BulkWorkoutImportTests(unittest.TestCase):
+    """Tests for chunked bulk workout imports."""
+    def test_bulk_import_reports_row_errors_and_keeps_valid_rows(self) -> None:
+        """Ensure invalid rows are reported by index while valid rows are inserted."""
+        # Stream a generator across several small chunks.
+        with tempfile.TemporaryDirectory() as tmpdir:
+            db_path = Path(tmpdir) / "test.db"
+            exercise_database.initialize_database(db_path)
+            user_id = exercise_database.add_user("gina", db_path=db_path)
+
+            def workouts():
+                """Yield a mix of valid and invalid workouts."""
+                # Rows 2 and 4 are invalid for different reasons.
+                for index in range(6):
+                    if index == 2:
+                        yield {"user_id": user_id, "performed_at": "2024-07-01", "duration_minutes": 0, "exercises": ["Plank"]}
+                    elif index == 4:
+                        yield {"user_id": 9999, "performed_at": "2024-07-01", "duration_minutes": 5, "exercises": ["Plank"]}
+                    else:
+                        yield {
+                            "user_id": user_id,
+                            "performed_at": f"2024-07-0{index + 1}",
+                            "duration_minutes": 10,
+                            "exercises": ["push-up", "Plank"],
+                        }
+
+            result = exercise_database.log_workouts_bulk(workouts(), chunk_size=2, db_path=db_path)
+            self.assertEqual(result["inserted"], 4)
+            self.assertEqual(len(result["inserted_ids"]), 4)
+            self.assertEqual([index for index, _ in result["errors"]], [2, 4])
+
+            history = exercise_database.fetch_workout_history(user_id, db_path=db_path)
+            self.assertEqual(sorted(entry["workout_id"] for entry in history), sorted(result["inserted_ids"]))
+            self.assertEqual(history[0]["exercises"], ["push-up", "Plank"])
+            conn = exercise_database.get_connection(db_path)
+            self.assertEqual(exercise_database.check_stats_rollup(conn), [])
+
+            def broken_chunk(*_args: object) -> list[int]:
+                """Fail the way a malformed row would outside SQLite."""
+                # Any non-database error must still end the transaction.
+                raise KeyError("status")
+
+            original = exercise_database._insert_workout_chunk
+            exercise_database._insert_workout_chunk = broken_chunk
+            try:
+                with self.assertRaises(KeyError):
+                    exercise_database.log_workouts_bulk(
+                        [{"user_id": user_id, "performed_at": "2024-03-01", "duration_minutes": 5, "exercises": ["Plank"]}],
+                        db_path=db_path,
+                    )
+            finally:
+                exercise_database._insert_workout_chunk = original
+            self.assertFalse(conn.in_transaction)
+            exercise_database.close_all()
+
+
+class CatalogImportTests(unittest.TestCase):
+    """Tests for streaming catalog imports."""
+    def test_jsonl_and_csv_imports_upsert_exercises(self) -> None:
+        """Ensure imports insert new exercises, update existing ones and report bad rows."""
+        # Import JSONL first, then update one exercise from CSV.
+        with tempfile.TemporaryDirectory() as tmpdir:
+            db_path = Path(tmpdir) / "test.db"
+            exercise_database.initialize_database(db_path)
+            jsonl_path = Path(tmpdir) / "catalog.jsonl"
+            records = [
+                {
+                    "name": "Überzug",
+                    "short_description": "Dumbbell pullover.",
+                    "required_equipment": "Dumbbells",
+                    "target_muscle_group": "Chest, back",
+                    "recommendations": {"muscle_building": {"suitability_rating": 7, "recommended_sets": 3}},
+                },
+                {"name": "", "short_description": "Missing name."},
+                {
+                    "name": "push-up",
+                    "short_description": "Updated push-up description.",
+                    "required_equipment": "Bodyweight",
+                    "target_muscle_group": "Chest",
+                },
+            ]
+            lines = [json.dumps(record) for record in records]
+            lines.insert(2, '{"name": "Broken')
+            jsonl_path.write_text("\n".join(lines), encoding="utf-8")
+            report = exercise_database.import_exercise_catalog(jsonl_path, batch_size=2, db_path=db_path)
+            self.assertEqual((report["inserted"], report["updated"]), (1, 1))
+            self.assertEqual([index for index, _ in report["errors"]], [1, 2])
+            self.assertTrue(report["errors"][1][1].startswith("Line 3: invalid JSON"))
+            self.assertIn("records_per_second", report)
+
+            csv_path = Path(tmpdir) / "catalog.csv"
+            csv_path.write_text(
+                "name,short_description,required_equipment,target_muscle_group,weight_loss_suitability_rating\n"
+                "ÜBERZUG,Pullover with one dumbbell.,Dumbbell,Chest,4\n",
+                encoding="utf-8",
+            )
+            report = exercise_database.import_exercise_catalog(csv_path, db_path=db_path)
+            self.assertEqual((report["inserted"], report["updated"]), (0, 1))
+
+            rows = {
+                (row[1], row[7]): row
+                for row in exercise_database.query_exercises(db_path=db_path)
+                if row[1] in {"Überzug", "Push-Up"}
+            }
+            self.assertEqual(rows[("Überzug", "muscle_building")][8:10], (7, 3))
+            self.assertEqual(rows[("Überzug", "weight_loss")][8], 4)
+            self.assertEqual(rows[("Überzug", "endurance_increase")][8], exercise_database.DEFAULT_GOAL_RATING)
+            self.assertEqual(rows[("Überzug", "muscle_building")][-1], ["Chest"])
+            self.assertEqual(rows[("Push-Up", "muscle_building")][3], "Updated push-up description.")
+            self.assertEqual(rows[("Push-Up", "muscle_building")][8], 8)
+            exercise_database.close_all()
+
+    def test_large_batches_are_looked_up_in_chunks(self) -> None:
+        """Ensure name lookups and tag resets span several IN lists when a batch exceeds the chunk size."""
+        # Shrink the chunk so a small batch needs several statements.
+        with tempfile.TemporaryDirectory() as tmpdir:
+            db_path = Path(tmpdir) / "test.db"
+            exercise_database.initialize_database(db_path)
+            jsonl_path = Path(tmpdir) / "catalog.jsonl"
+            records = [
+                {
+                    "name": "plank",
+                    "short_description": "Hold a straight line.",
+                    "required_equipment": "Mat",
+                    "target_muscle_group": "Glutes",
+                }
+            ]
+            records.extend(
+                {
+                    "name": f"Drill {index}",
+                    "short_description": "Agility drill.",
+                    "required_equipment": "Cones",
+                    "target_muscle_group": "Legs",
+                }
+                for index in range(5)
+            )
+            jsonl_path.write_text("\n".join(json.dumps(record) for record in records), encoding="utf-8")
+            original = exercise_database._SQL_IN_CHUNK
+            exercise_database._SQL_IN_CHUNK = 2
+            try:
+                report = exercise_database.import_exercise_catalog(jsonl_path, batch_size=10, db_path=db_path)
+                conn = exercise_database.get_connection(db_path)
+                resolved = exercise_database._resolve_exercise_ids(conn, [record["name"] for record in records])
+            finally:
+                exercise_database._SQL_IN_CHUNK = original
+            self.assertEqual((report["inserted"], report["updated"]), (5, 1))
+            self.assertEqual(len(resolved), 6)
+            self.assertEqual(resolved["plank"][1], "Plank")
+            tags = {
+                row[1]: row[-1]
+                for row in exercise_database.query_exercises(db_path=db_path)
+                if row[1] in {"Plank", "Drill 4"}
+            }
+            self.assertIn("Glutes", tags["Plank"])
+            self.assertNotIn("Core", tags["Plank"])
+            self.assertEqual(tags["Drill 4"], ["Legs"])
+            exercise_database.close_all()
+
+
+class SessionJournalTests(unittest.TestCase):
+    """Tests for the live session write-ahead journal."""
+    def test_unfinished_journal_replays_on_initialize(self) -> None:
+        """Ensure a crashed session is written once and corrupt or foreign journals are left alone."""
+        # Leave a journal open with a torn final line, as a killed process would.
+        with tempfile.TemporaryDirectory() as tmpdir:
+            db_path = Path(tmpdir) / "test.db"
+            exercise_database.initialize_database(db_path)
+            user_id = exercise_database.add_user("hana", db_path=db_path)
+            journal = exercise_database.SessionJournal.start(
+                user_id, started_at="2024-05-01T07:00:00", goal="Weight Loss", db_path=db_path
+            )
+            journal.record_set("Plank")
+            journal.record_exercise("Plank", "completed")
+            journal.record_set("Push-Up")
+            journal.close()
+            with journal.path.open("a", encoding="utf-8") as handle:
+                handle.write('{"type": "set", "exer')
+            corrupt = journal.path.with_name("corrupt.jsonl")
+            corrupt.write_text('{"type": "start"\n{"type": "set"}\n', encoding="utf-8")
+            other_kiosk = exercise_database.session_journal_dir(db_path).parent / "other-kiosk" / "live.jsonl"
+            other_kiosk.parent.mkdir()
+            other_kiosk.write_text('{"type": "start"}\n', encoding="utf-8")
+
+            exercise_database.initialize_database(db_path)
+            self.assertFalse(journal.path.exists())
+            entries = exercise_database.fetch_workout_history(user_id, db_path=db_path)
+            self.assertEqual(len(entries), 1)
+            self.assertEqual(entries[0]["performed_at"], "2024-05-01T07:00:00")
+            self.assertEqual(entries[0]["total_sets_completed"], 2)
+            self.assertEqual(
+                [(attempt["name"], attempt["status"]) for attempt in entries[0]["exercise_attempts"]],
+                [("Plank", "completed"), ("Push-Up", "skipped")],
+            )
+            self.assertTrue(corrupt.with_suffix(".failed").exists())
+            self.assertTrue(other_kiosk.exists())
+
+            abandoned = exercise_database.SessionJournal.start(user_id, started_at="2024-05-01T08:00:00", db_path=db_path)
+            abandoned.record_set("Plank")
+            self.assertTrue(abandoned.discard())
+            self.assertFalse(abandoned.path.exists())
+            self.assertEqual(exercise_database.replay_session_journals(db_path), [])
+            exercise_database.close_all()
+
+    def test_flush_is_idempotent_after_commit(self) -> None:
+        """Ensure a journal whose workout was committed is not written twice."""
+        # Simulate a crash between the commit and the journal removal.
+        with tempfile.TemporaryDirectory() as tmpdir:
+            db_path = Path(tmpdir) / "test.db"
+            exercise_database.initialize_database(db_path)
+            user_id = exercise_database.add_user("ivan", db_path=db_path)
+            journal = exercise_database.SessionJournal.start(user_id, started_at="2024-05-02T08:00:00", db_path=db_path)
+            path = journal.finish(
+                performed_at="2024-05-02T08:30:00",
+                duration_seconds=1800,
+                total_sets_completed=3,
+                attempts=[("Squat", "completed")],
+            )
+            saved = path.read_text(encoding="utf-8")
+            workout_id = exercise_database.flush_session_journal(path, db_path=db_path)
+            conn = exercise_database.get_connection(db_path)
+            exercise_database.set_meta(conn, f"session_journal:{journal.session_id}", workout_id)
+            conn.commit()
+            path.write_text(saved, encoding="utf-8")
+
+            self.assertEqual(exercise_database.flush_session_journal(path, db_path=db_path), workout_id)
+            self.assertFalse(path.exists())
+            entries = exercise_database.fetch_workout_history(user_id, db_path=db_path)
+            self.assertEqual(
+                [(entry["performed_at"], entry["duration_minutes"]) for entry in entries],
+                [("2024-05-02T08:30:00", 30)],
+            )
+            exercise_database.close_all()
+
+
+class HistoryPaginationTests(unittest.TestCase):
+    """Tests for keyset-paginated workout history."""
+    def test_pages_follow_cursor_without_overlap(self) -> None:
+        """Ensure pages chain through continuation tokens in newest-first order."""
+        # Log five workouts, two sharing a date, and page through them two at a time.
+        with tempfile.TemporaryDirectory() as tmpdir:
+            db_path = Path(tmpdir) / "test.db"
+            exercise_database.initialize_database(db_path)
+            user_id = exercise_database.add_user("dana", db_path=db_path)
+            for performed_at in ["2024-01-01", "2024-01-02", "2024-01-02", "2024-01-03", "2024-01-04"]:
+                exercise_database.log_workout(
+                    user_id=user_id,
+                    performed_at=performed_at,
+                    duration_minutes=10,
+                    exercises=["Push-Up", "Plank"],
+                    db_path=db_path,
+                )
+            expected = exercise_database.fetch_workout_history(user_id, db_path=db_path)
+
+            first, cursor = exercise_database.fetch_workout_history_page(user_id, page_size=2, db_path=db_path)
+            self.assertEqual(len(first), 2)
+            self.assertIsNotNone(cursor)
+            streamed = list(exercise_database.iter_workout_history(user_id, page_size=2, db_path=db_path))
+            self.assertEqual(streamed, expected)
+            self.assertEqual(streamed[0]["exercises"], ["Push-Up", "Plank"])
+
+            _, last_cursor = exercise_database.fetch_workout_history_page(user_id, page_size=5, db_path=db_path)
+            self.assertIsNone(last_cursor)
+            with self.assertRaises(ValueError):
+                exercise_database.fetch_workout_history_page(user_id, cursor="not-a-cursor", db_path=db_path)
+            exercise_database.close_all()
+
+
+class ExerciseTagQueryTests(unittest.TestCase):
+    """Tests for normalized exercise tags and SQL-side filtering."""
+    def test_query_filters_by_goal_muscle_and_equipment(self) -> None:
+        """Ensure tag filters match any requested tag and respect the goal."""
+        # Add an exercise with multiple tags and filter on one of each kind.
+        with tempfile.TemporaryDirectory() as tmpdir:
+            db_path = Path(tmpdir) / "test.db"
+            exercise_database.initialize_database(db_path)
+            exercise_database.add_exercise(
+                name="Band Row",
+                short_description="Rowing with bands.",
+                required_equipment="Resistance bands, mat",
+                target_muscle_group="Back, biceps",
+                goal="endurance_increase",
+                suitability_rating=6,
+                db_path=db_path,
+            )
+            rows = exercise_database.query_exercises(
+                goal="endurance_increase",
+                muscle_groups=["Biceps", "Unused"],
+                equipment=["Bands"],
+                db_path=db_path,
+            )
+            self.assertEqual([row[1] for row in rows], ["Band Row"])
+            self.assertEqual(rows[0][-2], ["Bands", "Bodyweight", "Mat"])
+            self.assertEqual(rows[0][-1], ["Back", "Biceps"])
+
+            all_goals = exercise_database.query_exercises(equipment=["Bands"], db_path=db_path)
+            self.assertEqual(
+                len([row for row in all_goals if row[1] == "Band Row"]),
+                len(exercise_database.GOALS),
+            )
+            self.assertIn("Biceps", exercise_database.fetch_tag_values("muscle", db_path=db_path))
+            exercise_database.close_all()
+
+
+class ExerciseSearchTests(unittest.TestCase):
+    """Tests for full-text exercise search."""
+    def test_prefix_search_ranks_names_and_tracks_edits(self) -> None:
+        """Ensure prefix matches rank name hits first and follow catalog edits."""
+        # Add an exercise whose name matches, then rename and delete it.
+        with tempfile.TemporaryDirectory() as tmpdir:
+            db_path = Path(tmpdir) / "test.db"
+            exercise_database.initialize_database(db_path)
+            exercise_id = exercise_database.add_exercise(
+                name="Zercher Carry",
+                short_description="Loaded walk holding the bar in the elbows.",
+                execution_instructions="Brace and walk slowly.",
+                required_equipment="Barbell",
+                target_muscle_group="Core",
+                goal="strength_increase",
+                suitability_rating=7,
+                db_path=db_path,
+            )
+            self.assertEqual(exercise_database.search_exercises("zerch", db_path=db_path), [exercise_id])
+            self.assertEqual(exercise_database.search_exercises("zerch walk", db_path=db_path), [exercise_id])
+            self.assertEqual(exercise_database.search_exercises('"(', db_path=db_path), [])
+            push_up_hits = exercise_database.search_exercises("push", db_path=db_path)
+            conn = exercise_database.get_connection(db_path)
+            push_up_id = conn.execute("SELECT id FROM exercises WHERE name = 'Push-Up';").fetchone()[0]
+            self.assertEqual(push_up_hits[0], push_up_id)
+
+            conn.execute("UPDATE exercises SET name = 'Suitcase Carry' WHERE id = ?;", (exercise_id,))
+            conn.commit()
+            self.assertEqual(exercise_database.search_exercises("zerch", db_path=db_path), [])
+            self.assertEqual(exercise_database.search_exercises("suitc", db_path=db_path), [exercise_id])
+            conn.execute("DELETE FROM exercises WHERE id = ?;", (exercise_id,))
+            conn.commit()
+            self.assertEqual(exercise_database.search_exercises("suitc", db_path=db_path), [])
+            exercise_database.close_all()
+
+    def test_catalog_bitset_filters_and_facets(self) -> None:
+        """Ensure bitset filters, best-goal picks, ordering and facet counts agree with the data."""
+        # Squat's best goal is a rating tie broken by GOALS order; Plank only has one goal.
+        catalog = ExerciseCatalog.from_rows(
+            [
+                (1, "Squat", "", "s", "", "", "", "muscle_building", 8, 4, 8, None, ("barbell",), ("legs", "glutes")),
+                (1, "Squat", "", "s", "", "", "", "strength_increase", 8, 5, 5, None, ("barbell",), ("legs", "glutes")),
+                (2, "Bridge", "", "b", "", "", "", "strength_increase", 6, 3, 12, None, ("mat",), ("glutes",)),
+                (2, "Bridge", "", "b", "", "", "", "weight_loss", 7, 3, 15, None, ("mat",), ("glutes",)),
+                (3, "Plank", "", "p", "", "", "", "weight_loss", 5, 3, None, 45, ("mat",), ("core",)),
+            ]
+        )
+        best = catalog.records_for_bits(catalog.goal_bits(None))
+        self.assertEqual([(record["name"], record.goal) for record in best], [
+            ("Bridge", "weight_loss"),
+            ("Plank", "weight_loss"),
+            ("Squat", "muscle_building"),
+        ])
+        glutes = catalog.tag_bits("muscle_groups", ["glutes"])
+        mat_or_barbell = catalog.tag_bits("equipment_items", ["mat", "barbell"])
+        self.assertEqual(mat_or_barbell, catalog.all_bits)
+        self.assertEqual(catalog.tag_bits("muscle_groups", []), catalog.all_bits)
+        weight_loss = catalog.records_for_bits(glutes & catalog.goal_bits("weight_loss"))
+        self.assertEqual([record["name"] for record in weight_loss], ["Bridge"])
+        ranked = catalog.records_for_bits(catalog.search_bits({3: 0, 1: 1}) & catalog.goal_bits(None), {3: 0, 1: 1})
+        self.assertEqual([record["name"] for record in ranked], ["Plank", "Squat"])
+        self.assertEqual(catalog.facet_counts("muscle_groups", catalog.goal_bits(None)), {"glutes": 2, "legs": 1, "core": 1})
+        self.assertEqual(catalog.facet_counts("goal", glutes)["strength_increase"], 2)
+
+    def test_added_exercise_rows_patch_catalog(self) -> None:
+        """Ensure add_exercise_rows matches query_exercises and patching equals a full rebuild."""
+        # The new name sorts into the middle of the catalog to exercise the name order insert.
+        with tempfile.TemporaryDirectory() as tmpdir:
+            db_path = Path(tmpdir) / "test.db"
+            exercise_database.initialize_database(db_path)
+            catalog = ExerciseCatalog.from_rows(exercise_database.query_exercises(db_path=db_path))
+            rows = exercise_database.add_exercise_rows(
+                name="Kettlebell Halo",
+                short_description="Circle the bell around the head.",
+                execution_instructions=" Keep ribs down. ",
+                required_equipment="Kettlebell",
+                target_muscle_group="Shoulders, core",
+                goal="muscle_building",
+                suitability_rating=6,
+                recommended_sets=3,
+                recommended_reps_per_set=10,
+                db_path=db_path,
+            )
+            queried = exercise_database.query_exercises(db_path=db_path)
+            self.assertEqual(rows, [row for row in queried if row[0] == rows[0][0]])
+            added = catalog.add_rows(rows)
+            self.assertEqual(len(added), len(exercise_database.GOALS))
+            self.assertEqual(catalog.add_rows(rows), [])
+            rebuilt = ExerciseCatalog.from_rows(queried)
+            for goal in (None, *exercise_database.GOALS):
+                bits = catalog.goal_bits(goal) & catalog.tag_bits("muscle_groups", ["Core"])
+                rebuilt_bits = rebuilt.goal_bits(goal) & rebuilt.tag_bits("muscle_groups", ["Core"])
+                self.assertEqual(
+                    [(record["name"], record.goal) for record in catalog.records_for_bits(bits)],
+                    [(record["name"], record.goal) for record in rebuilt.records_for_bits(rebuilt_bits)],
+                )
+            self.assertEqual(
+                catalog.facet_counts("equipment_items", catalog.goal_bits(None)),
+                rebuilt.facet_counts("equipment_items", rebuilt.goal_bits(None)),
+            )
+            exercise_database.close_all()
+
+    def test_exercise_catalog_shares_exercise_fields(self) -> None:
+        """Ensure goal records share one exercise and the indexes resolve names and goals."""
+        # Two goal rows for one exercise collapse into a single CatalogExercise.
+        catalog = ExerciseCatalog.from_rows(
+            [
+                (1, "Plank", "plank", "Hold", "Brace", "None", "Core", "strength_increase", 7, 3, None, 45, ("none",), ("core",)),
+                (1, "Plank", "plank", "Hold", "Brace", "None", "Core", "weight_loss", 5, 2, None, 30, ("none",), ("core",)),
+                (2, "Squat", "", "Sit", "", "", "Legs", "muscle_building", 8, 4, 8, None, (), ("legs",)),
+                (3, "", "", "Skipped", "", "", "", "weight_loss", 1, None, None, None, (), ()),
+            ]
+        )
+        self.assertEqual(len(catalog), 2)
+        self.assertEqual(len(catalog.records), 3)
+        plank = catalog.record("Plank", "weight_loss")
+        self.assertIs(plank.exercise, catalog.record("Plank", "strength_increase").exercise)
+        self.assertEqual(plank["description"], "Hold")
+        self.assertEqual(plank["recommendation"], "2 sets • 30s hold")
+        self.assertEqual(plank.get("goal_label"), "Weight Loss")
+        self.assertIsNone(plank.get("missing"))
+        self.assertIsNone(catalog.record("Plank", "muscle_building"))
+        self.assertIs(catalog.record("Plank"), plank)
+        self.assertEqual([record["name"] for record in catalog.for_goal("weight_loss")], ["Plank"])
+        self.assertTrue(catalog.has_name(" squat "))
+        self.assertEqual(catalog.names(), ["Plank", "Squat"])
+        self.assertEqual(catalog.tag_values("muscle_groups"), ["core", "legs"])
+        self.assertGreater(catalog.memory_footprint(), 0)
+
+
+class DatabaseExecutorTests(unittest.TestCase):
+    """Tests for the background database executor."""
+    def test_superseded_results_are_dropped(self) -> None:
+        """Ensure only the newest keyed request reaches its callback."""
+        # Block the first call so the second supersedes it while it runs.
+        scheduled: list = []
+        executor = DatabaseExecutor(schedule=scheduled.append)
+        release = threading.Event()
+        delivered: list[str] = []
+
+        def slow(value: str) -> str:
+            """Wait for the test to release the worker."""
+            # Simulates a slow query on the worker thread.
+            release.wait(5)
+            return value
+
+        first = executor.submit(slow, "stale", key="history", on_success=delivered.append)
+        second = executor.submit(slow, "fresh", key="history", on_success=delivered.append)
+        self.assertTrue(executor.pending("history"))
+        release.set()
+        for future in (first, second):
+            if not future.cancelled():
+                future.result(5)
+        deadline = time.monotonic() + 5
+        while len(scheduled) < 2 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        for callback in scheduled:
+            callback(0)
+        self.assertEqual(delivered, ["fresh"])
+        self.assertFalse(executor.pending("history"))
+        executor.shutdown()
+
+    def test_errors_are_routed_to_on_error(self) -> None:
+        """Ensure every error reaches on_error and is re-raised only when there is no handler."""
+        # Delivery runs after shutdown(wait=True) has flushed the done callbacks.
+        scheduled: list = []
+        executor = DatabaseExecutor(schedule=scheduled.append)
+        errors: list[Exception] = []
+        future = executor.submit(int, "not a number", on_error=errors.append)
+        executor.shutdown()
+        self.assertIsInstance(future.exception(), ValueError)
+        for callback in scheduled:
+            callback(0)
+        self.assertEqual(len(errors), 1)
+        unhandled = DatabaseExecutor(max_workers=1, schedule=scheduled.append)
+        scheduled.clear()
+        unhandled.submit(open, Path(tempfile.gettempdir()) / "missing-dir" / "missing.db", on_error=errors.append)
+        unhandled.submit(dict.__getitem__, {}, "missing")
+        unhandled.shutdown()
+        with self.assertRaises(KeyError):
+            for callback in scheduled:
+                callback(0)
+        self.assertIsInstance(errors[1], OSError)
+
+    def test_shutdown_cancels_queued_reloads_but_runs_saves(self) -> None:
+        """Ensure queued unkeyed saves still run at shutdown while keyed reloads are dropped."""
+        # One worker is held busy so both follow-up requests are still queued at shutdown.
+        executor = DatabaseExecutor(max_workers=1, schedule=lambda _callback: None)
+        release = threading.Event()
+        saved: list[str] = []
+        executor.submit(release.wait, 5)
+        reload = executor.submit(saved.append, "reload", key="history")
+        save = executor.submit(saved.append, "save")
+        executor.shutdown(wait=False)
+        release.set()
+        save.result(5)
+        self.assertTrue(reload.cancelled())
+        self.assertEqual(saved, ["save"])
+
+
+class ConnectionManagerTests(unittest.TestCase):
+    """Tests for pooled connection reuse and configuration."""
+    def test_connections_reused_per_thread_and_closed(self) -> None:
+        """Ensure a thread reuses its connection and close_all releases it."""
+        # Compare connection identity within and across threads.
+        with tempfile.TemporaryDirectory() as tmpdir:
+            db_path = Path(tmpdir) / "test.db"
+            first = exercise_database.get_connection(db_path)
+            self.assertIs(first, exercise_database.get_connection(db_path))
+            self.assertEqual(first.execute("PRAGMA journal_mode;").fetchone()[0], "wal")
+            self.assertEqual(first.execute("PRAGMA foreign_keys;").fetchone()[0], 1)
+
+            other: list[object] = []
+            worker = threading.Thread(target=lambda: other.append(exercise_database.get_connection(db_path)))
+            worker.start()
+            worker.join()
+            self.assertIsNot(first, other[0])
+
+            exercise_database.close_all()
+            with self.assertRaises(exercise_database.sqlite3.ProgrammingError):
+                first.execute("SELECT 1;")
+            self.assertIsNot(first, exercise_database.get_connection(db_path))
+            exercise_database.close_all()
+
+    def test_configure_rejects_unknown_synchronous(self) -> None:
+        """Ensure invalid PRAGMA settings are rejected up front."""
+        # Use a private manager to avoid touching shared settings.
+        manager = exercise_database.ConnectionManager()
+        with self.assertRaises(ValueError):
+            manager.configure(synchronous="sometimes")
+
+
+class QueryTracingTests(unittest.TestCase):
+    """Tests for opt-in query and function tracing."""
+    def test_tracing_records_queries_functions_and_prometheus(self) -> None:
+        """Ensure traced calls produce latency, row counts and Prometheus output."""
+        # Enable tracing around a few calls and restore the module afterwards, unless the env var enabled it.
+        original = exercise_database.fetch_workout_history
+        was_enabled = exercise_database._TRACER.enabled
+        tracer = exercise_database.enable_query_tracing()
+        tracer.reset()
+        try:
+            with tempfile.TemporaryDirectory() as tmpdir:
+                db_path = Path(tmpdir) / "test.db"
+                exercise_database.initialize_database(db_path)
+                user_id = exercise_database.add_user("jo", db_path=db_path)
+                tracer.reset()
+                exercise_database.log_workout(
+                    user_id=user_id,
+                    performed_at="2024-08-01",
+                    duration_minutes=20,
+                    exercises=["Plank", "Push-Up"],
+                    db_path=db_path,
+                )
+                exercise_database.fetch_workout_history(user_id, db_path=db_path)
+                report = exercise_database.query_trace_report()
+                functions = {item["function"]: item for item in report["functions"]}
+                self.assertEqual(functions["log_workout"]["calls"], 1)
+                self.assertEqual(functions["fetch_workout_history"]["errors"], 0)
+                self.assertGreater(report["statements"], 0)
+                exercise_inserts = [item for item in report["queries"] if "INSERT INTO workout_exercises" in item["query"]]
+                self.assertEqual(exercise_inserts[0]["rows"], 2)
+                metrics = exercise_database.query_trace_prometheus()
+                self.assertIn('fittrainer_db_function_seconds_count{function="log_workout"} 1', metrics)
+                self.assertIn('le="+Inf"', metrics)
+                written = exercise_database.write_query_trace_report(Path(tmpdir) / "trace.json")
+                self.assertEqual(json.loads(written.read_text())["statements"], report["statements"])
+                exercise_database.close_all()
+        finally:
+            if not was_enabled:
+                exercise_database.disable_query_tracing()
+            tracer.reset()
+        self.assertIs(exercise_database.fetch_workout_history, original)
+
+
+class SchemaMigrationTests(unittest.TestCase):
+    """Tests for versioned schema migrations."""
+    def test_initialize_sets_version_and_indexes(self) -> None:
+        """Ensure initialization records the schema version and creates indexes."""
+        # Inspect sqlite_master for the secondary indexes.
+        with tempfile.TemporaryDirectory() as tmpdir:
+            db_path = Path(tmpdir) / "test.db"
+            exercise_database.initialize_database(db_path)
+            conn = exercise_database.get_connection(db_path)
+            self.assertEqual(exercise_database.get_schema_version(conn), exercise_database.SCHEMA_VERSION)
+            indexes = {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'index';")}
+            self.assertIn("idx_workouts_user_performed", indexes)
+            self.assertIn("idx_workout_exercises_workout", indexes)
+            self.assertIn("idx_workout_exercises_name", indexes)
+            exercise_database.close_all()
+
+    def test_current_schema_skips_introspection(self) -> None:
+        """Ensure a current database runs no table introspection."""
+        # Trace statements issued by a second migrate_schema call.
+        with tempfile.TemporaryDirectory() as tmpdir:
+            db_path = Path(tmpdir) / "test.db"
+            exercise_database.initialize_database(db_path)
+            conn = exercise_database.get_connection(db_path)
+            statements: list[str] = []
+            conn.set_trace_callback(statements.append)
+            try:
+                exercise_database.migrate_schema(conn)
+            finally:
+                conn.set_trace_callback(None)
+            self.assertFalse(any("table_info" in statement for statement in statements))
+            exercise_database.close_all()
+
+    def test_warm_start_skips_seeding(self) -> None:
+        """Ensure a stamped database is not reseeded on the next launch."""
+        # Trace a second initialize_database call on the same file.
+        with tempfile.TemporaryDirectory() as tmpdir:
+            db_path = Path(tmpdir) / "test.db"
+            exercise_database.initialize_database(db_path)
+            conn = exercise_database.get_connection(db_path)
+            self.assertEqual(exercise_database.get_meta(conn, "seed_version"), str(exercise_database.SEED_VERSION))
+            statements: list[str] = []
+            conn.set_trace_callback(statements.append)
+            try:
+                exercise_database.initialize_database(db_path)
+            finally:
+                conn.set_trace_callback(None)
+            self.assertFalse(any("exercises" in statement for statement in statements))
+            self.assertFalse(any("INSERT" in statement for statement in statements))
+            exercise_database.close_all()
+
+
+    def test_single_file_database_moves_catalog_to_its_own_file(self) -> None:
+        """Ensure a pre-split database hands its catalog to the attached file and keeps history."""
+        # Build a version 9 single-file database with a plain connection, then initialize it.
+        with tempfile.TemporaryDirectory() as tmpdir:
+            db_path = Path(tmpdir) / "legacy.db"
+            legacy = sqlite3.connect(db_path)
+            exercise_database.create_schema(legacy)
+            for version, migration in exercise_database._MIGRATIONS:
+                if version >= exercise_database._CATALOG_SPLIT_VERSION:
+                    break
+                migration(legacy)
+                legacy.execute(f"PRAGMA user_version = {version};")
+            legacy.execute(
+                "INSERT INTO exercises (id, name, short_description, required_equipment, target_muscle_group) "
+                "VALUES (40, 'Zercher Squat', 'Front-loaded squat.', 'Barbell', 'Legs');"
+            )
+            legacy.execute("INSERT INTO users (id, username) VALUES (1, 'alice');")
+            legacy.execute(
+                "INSERT INTO workouts (id, user_id, performed_at, performed_day, duration_minutes) "
+                "VALUES (1, 1, '2024-04-02', 19815, 25);"
+            )
+            legacy.execute(
+                "INSERT INTO workout_exercises (workout_id, exercise_id, exercise_name) VALUES (1, 40, 'Zercher Squat');"
+            )
+            legacy.commit()
+            legacy.close()
+
+            # A crash after the catalog copy committed leaves user_version at 9; the copy reruns harmlessly.
+            conn = exercise_database.get_connection(db_path)
+            conn.execute("BEGIN;")
+            exercise_database._prepare_catalog_split(conn, "rw")
+            conn.commit()
+            # Exercises new to the now populated catalog that differ only by case merge into one row.
+            conn.execute(
+                "INSERT INTO main.exercises (id, name, short_description, required_equipment, target_muscle_group) "
+                "VALUES (41, 'Hack Squat', 'Machine squat.', 'Machine', 'Legs'), "
+                "(42, 'hack squat', 'Machine squat.', 'Machine', 'Legs');"
+            )
+            conn.execute(
+                "INSERT INTO main.goal_recommendations (exercise_id, goal, suitability_rating) "
+                "VALUES (41, 'strength_increase', 7), (42, 'muscle_building', 8);"
+            )
+            conn.execute(
+                "INSERT INTO main.exercise_tags (exercise_id, kind, tag, position) "
+                "VALUES (41, 'muscle', 'Legs', 0), (42, 'equipment', 'Machine', 0);"
+            )
+            conn.commit()
+            exercise_database.initialize_database(db_path)
+            hack_squat_id = conn.execute(
+                "SELECT id FROM catalog.exercises WHERE lower(name) = 'hack squat';"
+            ).fetchone()[0]
+            self.assertEqual(
+                conn.execute(
+                    "SELECT goal FROM catalog.goal_recommendations WHERE exercise_id = ? ORDER BY goal;",
+                    (hack_squat_id,),
+                ).fetchall(),
+                [("muscle_building",), ("strength_increase",)],
+            )
+            self.assertEqual(
+                conn.execute(
+                    "SELECT kind, tag FROM catalog.exercise_tags WHERE exercise_id = ? ORDER BY kind;",
+                    (hack_squat_id,),
+                ).fetchall(),
+                [("equipment", "Machine"), ("muscle", "Legs")],
+            )
+            self.assertEqual(exercise_database.catalog_path_for(db_path), Path(tmpdir) / "legacy_catalog.db")
+            self.assertEqual(
+                conn.execute(
+                    "SELECT COUNT(*) FROM (SELECT 1 FROM catalog.exercises GROUP BY lower(name) HAVING COUNT(*) > 1);"
+                ).fetchone(),
+                (0,),
+            )
+            self.assertIsNone(
+                conn.execute("SELECT 1 FROM main.sqlite_master WHERE name = 'exercises';").fetchone()
+            )
+            self.assertEqual(
+                conn.execute("SELECT id FROM catalog.exercises WHERE name = 'Zercher Squat';").fetchone(),
+                (40,),
+            )
+            history = exercise_database.fetch_workout_history(1, db_path=db_path)
+            self.assertEqual(history[0]["exercises"], ["Zercher Squat"])
+            self.assertEqual(exercise_database.search_exercises("zercher", db_path=db_path), [40])
+            self.assertEqual(exercise_database.check_stats_rollup(conn), [])
+            self.assertEqual(conn.execute("PRAGMA foreign_key_check;").fetchall(), [])
+            exercise_database.close_all()
+
+    def test_read_only_catalog_serves_reads_and_rejects_writes(self) -> None:
+        """Ensure a read-only catalog still allows workout logging against it."""
+        # Prepare the catalog in the default mode, then reopen everything read-only.
+        with tempfile.TemporaryDirectory() as tmpdir:
+            db_path = Path(tmpdir) / "test.db"
+            exercise_database.initialize_database(db_path)
+            user_id = exercise_database.add_user("alice", db_path=db_path)
+            exercise_database.configure_connections(catalog_mode="ro")
+            try:
+                exercise_database.initialize_database(db_path)
+                self.assertTrue(exercise_database.query_exercises(db_path=db_path))
+                exercise_database.log_workout(
+                    user_id=user_id, performed_at="2024-04-02", duration_minutes=20, exercises=["Plank"], db_path=db_path
+                )
+                with self.assertRaises(sqlite3.OperationalError):
+                    exercise_database.add_exercise(
+                        name="Zercher Squat",
+                        short_description="Front-loaded squat.",
+                        execution_instructions="Hold the bar in the elbows and squat.",
+                        required_equipment="Barbell",
+                        target_muscle_group="Legs",
+                        goal="strength_increase",
+                        suitability_rating=7,
+                        db_path=db_path,
+                    )
+                self.assertEqual(len(exercise_database.fetch_workout_history(user_id, db_path=db_path)), 1)
+            finally:
+                exercise_database.configure_connections(catalog_mode="rw")
+
+    def test_change_monitor_reports_changed_topics(self) -> None:
+        """Ensure polls are cheap when idle, name changed tables and skip acknowledged writes."""
+        # The monitor uses its own connection, so writes through the pool count as external.
+        with tempfile.TemporaryDirectory() as tmpdir:
+            db_path = Path(tmpdir) / "test.db"
+            exercise_database.initialize_database(db_path)
+            monitor = exercise_database.ChangeMonitor(db_path)
+            self.assertEqual(monitor.poll(), [])
+            reads = monitor.counter_reads
+            self.assertEqual(monitor.poll(), [])
+            self.assertEqual(monitor.counter_reads, reads)
+            user_id = exercise_database.add_user("alice", db_path=db_path)
+            self.assertEqual(monitor.poll(), ["users"])
+            exercise_database.log_workout(
+                user_id=user_id, performed_at="2024-04-02", duration_minutes=20, exercises=["Plank"], db_path=db_path
+            )
+            self.assertEqual(monitor.poll(), ["history"])
+            exercise_database.add_exercise(
+                name="Zercher Squat",
+                short_description="Front-loaded squat.",
+                required_equipment="Barbell",
+                target_muscle_group="Legs",
+                goal="strength_increase",
+                suitability_rating=7,
+                db_path=db_path,
+            )
+            self.assertEqual(monitor.poll(), ["catalog"])
+
+            bob_id = monitor.acknowledge(("users",), exercise_database.add_user, "bob", db_path=db_path)
+            self.assertEqual(monitor.poll(), [])
+            exercise_database.update_user_profile(
+                user_id=bob_id, display_name="Bob", preferred_goal=None, db_path=db_path
+            )
+            monitor.acknowledge(("users",), exercise_database.add_user, "carol", db_path=db_path)
+            self.assertEqual(monitor.poll(), ["users"])
+            monitor.close()
+        exercise_database.close_all()
+
 
 class ParsingHelperTests(unittest.TestCase):
     """Tests for parsing and normalization helpers."""
@@ -206,6 +1295,16 @@ class ParsingHelperTests(unittest.TestCase):
         self.assertIn("Legs", items)
         self.assertIn("Posterior Chain", items)
 
+    def test_tag_normalizer_batches_and_memoizes(self) -> None:
+        """Ensure normalize_many matches single calls and serves repeats from the memo."""
+        # A private normalizer keeps cache counters independent of other tests.
+        normalizer = exercise_database.TagNormalizer({"pull-up bar": ["Bodyweight", "Pull-up Bar"]}, cache_size=8)
+        batch = normalizer.normalize_many(["Pull up bar / rings (gym)", ["Rings", None, "pull-up bar"], None])
+        self.assertEqual(batch, [["Bodyweight", "Pull-up Bar", "Rings"], ["Rings", "Bodyweight", "Pull-up Bar"], []])
+        batch[0].append("Mutated")
+        self.assertEqual(normalizer.normalize("Pull up bar / rings (gym)"), ["Bodyweight", "Pull-up Bar", "Rings"])
+        self.assertGreaterEqual(normalizer.cache_info().hits, 1)
+
 
 class RegressionGuardTests(unittest.TestCase):
     """Regression tests for edge cases in helpers."""
@@ -277,36 +1376,12 @@ class RegressionGuardTests(unittest.TestCase):
             rec_recommendations=[],
             rec_goal_spinner_text="Muscle Building",
             rec_max_minutes_text="30",
-            records=[
-                {
-                    "name": "Push-Up",
-                    "goal": "muscle_building",
-                    "description": "desc",
-                    "muscle_group": "Chest",
-                    "equipment": "Bodyweight",
-                    "suitability_display": "8/10",
-                    "sets": 3,
-                    "reps": 10,
-                    "time_seconds": None,
-                    "recommendation": "Do it",
-                    "goal_label": "Muscle Building",
-                    "rating": 8,
-                },
-                {
-                    "name": "Row",
-                    "goal": "muscle_building",
-                    "description": "desc",
-                    "muscle_group": "Back",
-                    "equipment": "Cable",
-                    "suitability_display": "7/10",
-                    "sets": 3,
-                    "reps": 12,
-                    "time_seconds": None,
-                    "recommendation": "Rows",
-                    "goal_label": "Muscle Building",
-                    "rating": 7,
-                },
-            ],
+            catalog=ExerciseCatalog.from_rows(
+                [
+                    (1, "Push-Up", "", "desc", "", "Bodyweight", "Chest", "muscle_building", 8, 3, 10, None, (), ()),
+                    (2, "Row", "", "desc", "", "Cable", "Back", "muscle_building", 7, 3, 12, None, (), ()),
+                ]
+            ),
             _goal_label_map={"Muscle Building": "muscle_building"},
         )
         stub._require_user = lambda: True